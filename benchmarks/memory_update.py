@@ -0,0 +1,54 @@
+"""
+Throughput of MemoryManager bulk ingest
+
+Run from the repository root:
+
+    python -m benchmarks.memory_update --sizes 1000 100000 1000000
+
+Each size is written to a fresh database, once as a cold insert and once
+more as an upsert over the same IDs, and rows/sec is reported for both.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+from components.memory_manager import MemoryManager
+
+def make_articles(n: int) -> List[Dict]:
+    """Synthetic processed articles with distinct DOIs"""
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            'title': f"Sediment transport study {i}",
+            'journal': f"Journal {i % 50}",
+            'published_date': (start + timedelta(minutes=i)).isoformat(),
+            'relevance_score': (i % 100) / 100,
+            'llm_summary': f"Summary of study {i} on fluvial morphodynamics.",
+            'url': f"https://doi.org/10.1000/bench.{i}",
+        }
+        for i in range(n)
+    ]
+
+async def run(sizes: List[int]) -> None:
+    print(f"{'rows':>10} {'insert rows/s':>15} {'upsert rows/s':>15}")
+    for size in sizes:
+        articles = make_articles(size)
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = MemoryManager(os.path.join(tmp, "bench.ddb"))
+            rates = []
+            for _ in range(2):
+                start = time.perf_counter()
+                await manager.update(articles)
+                rates.append(size / (time.perf_counter() - start))
+            count = manager.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            assert count == size, f"expected {size} rows, found {count}"
+            manager.close()
+        print(f"{size:>10} {rates[0]:>15,.0f} {rates[1]:>15,.0f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000])
+    asyncio.run(run(parser.parse_args().sizes))
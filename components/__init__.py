@@ -0,0 +1,28 @@
+"""
+SedRSS pipeline components
+
+The classes main.py wires together are importable from the package
+directly. They are loaded on first access so that, for example, using
+the feed fetcher does not import the LLM stack.
+"""
+import importlib
+
+_EXPORTS = {
+    'RSSFeedFetcher': 'components.rss_feed_fetcher',
+    'DataStandardizer': 'components.data_standardizer',
+    'ArticleDatabase': 'components.article_database',
+    'RelevanceScorer': 'components.relevance_scorer',
+    'NewsletterComposer': 'components.newsletter_composer',
+    'LLMOrchestrator': 'components.llm_orchestrator',
+    'MemoryManager': 'components.memory_manager',
+    'EmailSender': 'components.email_sender',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,175 @@
+from typing import List, Dict, Optional, Any
+import os
+from datetime import datetime, timedelta, timezone
+import duckdb
+import pandas as pd
+from components.article_id import article_doi, content_id
+from components.date_normalizer import normalizer
+
+class ArticleDatabase:
+    def __init__(self, db_path: str = "data/articles.ddb"):
+        """Initialize with DuckDB so fetched articles persist across runs"""
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.conn = duckdb.connect(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        """
+        Initialize DuckDB database
+
+        published_date is a native TIMESTAMP, so range filters are pruned
+        with DuckDB's per-row-group min/max statistics instead of parsing
+        strings row by row. Timestamps are stored as naive UTC.
+        """
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_articles (
+                id VARCHAR PRIMARY KEY,
+                title VARCHAR,
+                authors VARCHAR[],
+                journal VARCHAR,
+                abstract VARCHAR,
+                url VARCHAR,
+                doi VARCHAR,
+                published_date TIMESTAMP,
+                stored_at TIMESTAMP
+            )
+        """)
+        self._migrate_ids()
+
+    def _migrate_ids(self) -> None:
+        """
+        One-time re-key of rows stored under the old raw-URL key
+
+        Rows are keyed by content_id like every other store; URL variants
+        of the same paper collapse to the most recently stored row.
+        """
+        columns = ['id', 'title', 'authors', 'journal', 'abstract', 'url', 'doi',
+                   'published_date', 'stored_at']
+        sample = self.conn.execute(f"SELECT {', '.join(columns)} FROM feed_articles LIMIT 1").fetchone()
+        if sample is None or sample[0] == content_id(dict(zip(columns, sample))):
+            return
+
+        rows = [dict(zip(columns, row)) for row in self.conn.execute(f"""
+            SELECT {', '.join(columns)} FROM feed_articles ORDER BY stored_at
+        """).fetchall()]
+        rekeyed = {}
+        for row in rows:
+            row['id'] = content_id(row)
+            rekeyed[row['id']] = row
+        batch = pd.DataFrame(list(rekeyed.values()), columns=columns)
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("DELETE FROM feed_articles")
+            self.conn.register('migrated_articles', batch)
+            self.conn.execute(f"INSERT INTO feed_articles SELECT {', '.join(columns)} FROM migrated_articles")
+            self.conn.unregister('migrated_articles')
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def store(self, articles: List[Dict[str, Any]]) -> None:
+        """Bulk upsert articles keyed by their content_id"""
+        if not articles:
+            return
+
+        # Later duplicates in the same batch win, matching upsert semantics
+        rows = {}
+        stored_at = self._utc_now()
+        for article in articles:
+            published_date = self._to_timestamp(article.get('published_date'), article.get('journal'))
+            article_id = content_id({**article, 'published_date': published_date})
+            rows[article_id] = {
+                'id': article_id,
+                'title': article.get('title', ''),
+                'authors': list(article.get('authors') or []),
+                'journal': article.get('journal', ''),
+                'abstract': article.get('abstract') or article.get('summary') or '',
+                'url': article.get('url') or article.get('link') or '',
+                'doi': article_doi(article),
+                'published_date': published_date,
+                'stored_at': stored_at
+            }
+
+        batch = pd.DataFrame(list(rows.values()))
+        batch['published_date'] = pd.to_datetime(batch['published_date'])
+        self.conn.register('article_batch', batch)
+        try:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO feed_articles
+                SELECT id, title, authors, journal, abstract, url, doi,
+                       published_date, stored_at
+                FROM article_batch
+            """)
+        finally:
+            self.conn.unregister('article_batch')
+
+    def get_recent_articles(self, days: int = 7) -> List[Dict[str, Any]]:
+        """
+        Return articles published within the last `days` days, newest first
+
+        Articles whose feed gave no usable date count as recent if they were
+        stored within the window. published_date is an aware UTC datetime.
+        """
+        cutoff_date = self._utc_now() - timedelta(days=days)
+        cursor = self.conn.execute("""
+            SELECT title, authors, journal, abstract, url, doi, published_date
+            FROM feed_articles
+            WHERE published_date > ?
+                OR (published_date IS NULL AND stored_at > ?)
+            ORDER BY published_date DESC NULLS LAST
+        """, [cutoff_date, cutoff_date])
+        columns = [column[0] for column in cursor.description]
+        articles = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for article in articles:
+            if article['published_date'] is not None:
+                article['published_date'] = article['published_date'].replace(tzinfo=timezone.utc)
+        return articles
+
+    def publication_cadence(self, days: int = 90) -> Dict[str, timedelta]:
+        """
+        Median gap between successive publication times, per journal
+
+        Articles released together (an issue, or a daily batch) share a
+        timestamp and count as one publication event.
+        """
+        rows = self.conn.execute("""
+            SELECT journal, median(gap_seconds)
+            FROM (
+                SELECT journal,
+                       epoch(published_date) - epoch(lag(published_date) OVER (
+                           PARTITION BY journal ORDER BY published_date
+                       )) AS gap_seconds
+                FROM (
+                    SELECT DISTINCT journal, published_date
+                    FROM feed_articles
+                    WHERE published_date > ?
+                )
+            )
+            WHERE gap_seconds > 0
+            GROUP BY journal
+        """, [self._utc_now() - timedelta(days=days)]).fetchall()
+        return {journal: timedelta(seconds=float(gap)) for journal, gap in rows}
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM feed_articles").fetchone()[0]
+
+    def clear(self):
+        self.conn.execute("DELETE FROM feed_articles")
+
+    def close(self) -> None:
+        """Close the underlying DuckDB connection"""
+        self.conn.close()
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        """Current time as a naive UTC datetime, matching stored timestamps"""
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _to_timestamp(value: Any, journal: Optional[str] = None) -> Optional[datetime]:
+        """Convert a datetime or date string to a naive UTC datetime"""
+        value = normalizer.normalize(value, journal)
+        return value.replace(tzinfo=None) if value is not None else None
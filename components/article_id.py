@@ -0,0 +1,67 @@
+from typing import Any, Dict, Optional
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+DOI_RE = re.compile(r'10\.\d{4,9}/[^\s?#]+', re.IGNORECASE)
+NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Lower-case bare DOI with any resolver prefix removed"""
+    if not doi:
+        return None
+    match = DOI_RE.search(doi.strip())
+    return match.group(0).rstrip('./').lower() if match else None
+
+def canonical_url(url: Optional[str]) -> Optional[str]:
+    """Scheme-less, query-less, lower-cased host form of a URL"""
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return None
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return urlunsplit(('', host, parts.path.rstrip('/'), '', '')).lstrip('/')
+
+def title_digest(title: Optional[str]) -> Optional[str]:
+    """Digest of a title with case, punctuation and spacing normalized away"""
+    normalized = NON_ALNUM_RE.sub(' ', (title or '').lower()).strip()
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:32]
+
+def article_doi(article: Dict) -> Optional[str]:
+    """DOI from the doi field, or embedded in the article URL"""
+    return normalize_doi(article.get('doi')) or normalize_doi(article.get('url') or article.get('link'))
+
+def content_id(article: Dict) -> str:
+    """
+    Deterministic ID for the work an article describes
+
+    Uses the DOI when there is one, then the canonical URL, then a digest
+    of the normalized title and publication day, so the same paper gets
+    the same ID across runs, feeds and URL variants. Every store keys
+    articles by this ID.
+    """
+    return content_id_from_keys(
+        article_doi(article),
+        canonical_url(article.get('url') or article.get('link')),
+        article.get('title'),
+        article.get('published_date')
+    )
+
+def content_id_from_keys(doi: Optional[str],
+                         url_key: Optional[str],
+                         title: Optional[str] = None,
+                         published_date: Any = None) -> str:
+    """content_id from an already normalized DOI and canonical URL"""
+    if doi:
+        basis = f"doi:{doi}"
+    elif url_key:
+        basis = f"url:{url_key}"
+    else:
+        normalized = NON_ALNUM_RE.sub(' ', (title or '').lower()).strip()
+        basis = f"title:{normalized}|{str(published_date or '')[:10]}"
+    return hashlib.sha256(basis.encode('utf-8')).hexdigest()[:32]
@@ -0,0 +1,84 @@
+from typing import Any, Callable, List, Optional, TypeVar
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import duckdb
+
+T = TypeVar('T')
+
+class AsyncDuckDB:
+    def __init__(self, conn: duckdb.DuckDBPyConnection, max_readers: int = 4):
+        """
+        Run DuckDB work off the event loop
+
+        Reads go to a small thread pool and writes to one dedicated writer
+        thread, so writes are serialized while reads run concurrently. Each
+        thread gets its own cursor on the shared connection, because a
+        DuckDB connection must not be used from several threads at once.
+
+        Args:
+            conn: Connection whose database the cursors are opened on
+            max_readers: Threads available for concurrent reads
+        """
+        self.logger = logging.getLogger(__name__)
+        self.conn = conn
+        self._readers = ThreadPoolExecutor(max_readers, thread_name_prefix='duckdb-read')
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix='duckdb-write')
+        self._local = threading.local()
+        self._cursors: List[duckdb.DuckDBPyConnection] = []
+        self._cursors_lock = threading.Lock()
+        self.closed = False
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self.conn.cursor()
+            self._local.cursor = cursor
+            with self._cursors_lock:
+                self._cursors.append(cursor)
+        return cursor
+
+    def _call(self, fn: Callable[..., T], args: tuple) -> T:
+        return fn(self._cursor(), *args)
+
+    async def _submit(self, executor: ThreadPoolExecutor, fn: Callable[..., T], args: tuple) -> T:
+        if self.closed:
+            raise RuntimeError("AsyncDuckDB is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(self._call, fn, args))
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call fn(cursor, *args) on a reader thread"""
+        return await self._submit(self._readers, fn, args)
+
+    async def run_write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call fn(cursor, *args) on the writer thread, after earlier writes"""
+        return await self._submit(self._writer, fn, args)
+
+    async def fetchall(self, sql: str, params: Optional[list] = None) -> List[tuple]:
+        return await self.run(lambda cursor: cursor.execute(sql, params).fetchall())
+
+    async def execute(self, sql: str, params: Optional[list] = None) -> None:
+        await self.run_write(lambda cursor: cursor.execute(sql, params))
+
+    def close(self) -> None:
+        """Wait for queued work, then close every cursor (not the connection)"""
+        if self.closed:
+            return
+        self.closed = True
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        for cursor in self._cursors:
+            try:
+                cursor.close()
+            except duckdb.Error as e:
+                self.logger.warning(f"Error closing DuckDB cursor: {str(e)}")
+        self._cursors.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
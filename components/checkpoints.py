@@ -0,0 +1,103 @@
+from typing import Any, List, Optional
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta
+import duckdb
+from components.date_normalizer import normalizer
+
+# Checkpointed stages of a newsletter run, in order; 'sent' marks a finished run
+STAGES = ('fetched', 'standardized', 'processed', 'composed', 'sent')
+
+# Stages whose payload is a list of article dicts
+ARTICLE_STAGES = ('fetched', 'standardized', 'processed')
+
+class RunCheckpoints:
+    def __init__(self, db_path: str = "data/checkpoints.ddb"):
+        """
+        Persistent per-stage outputs of newsletter runs, keyed by run ID
+
+        Payloads are stored as JSON; datetimes come back as ISO strings,
+        except article published_dates, which are restored to aware UTC
+        datetimes so resumed stages see the same types as a fresh run.
+        """
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.conn = duckdb.connect(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize DuckDB checkpoint table"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS run_checkpoints (
+                run_id VARCHAR,
+                stage VARCHAR,
+                payload VARCHAR,
+                created_at TIMESTAMP,
+                PRIMARY KEY (run_id, stage)
+            )
+        """)
+
+    @staticmethod
+    def new_run_id() -> str:
+        return f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+    def save(self, run_id: str, stage: str, payload: Any) -> None:
+        """Record a stage's output, replacing any earlier one"""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage: {stage}")
+        self.conn.execute("""
+            INSERT OR REPLACE INTO run_checkpoints VALUES (?, ?, ?, ?)
+        """, [run_id, stage, json.dumps(payload, default=str), datetime.now()])
+
+    def load(self, run_id: str, stage: str) -> Optional[Any]:
+        """Output recorded for a stage, or None if it has not completed"""
+        row = self.conn.execute("""
+            SELECT payload FROM run_checkpoints WHERE run_id = ? AND stage = ?
+        """, [run_id, stage]).fetchone()
+        if row is None:
+            return None
+        payload = json.loads(row[0])
+        if stage in ARTICLE_STAGES and isinstance(payload, list):
+            for article in payload:
+                if isinstance(article, dict) and 'published_date' in article:
+                    article['published_date'] = normalizer.normalize(article['published_date'])
+        return payload
+
+    def completed_stages(self, run_id: str) -> List[str]:
+        rows = self.conn.execute("""
+            SELECT stage FROM run_checkpoints WHERE run_id = ?
+        """, [run_id]).fetchall()
+        done = {stage for stage, in rows}
+        return [stage for stage in STAGES if stage in done]
+
+    def latest_unfinished(self) -> Optional[str]:
+        """Most recent run that has checkpoints but was never sent"""
+        row = self.conn.execute("""
+            SELECT run_id FROM run_checkpoints
+            GROUP BY run_id
+            HAVING NOT bool_or(stage = 'sent')
+            ORDER BY MAX(created_at) DESC
+            LIMIT 1
+        """).fetchone()
+        return row[0] if row else None
+
+    def prune(self, days: int = 14) -> int:
+        """Delete checkpoints of runs last touched more than `days` ago"""
+        removed = self.conn.execute("""
+            DELETE FROM run_checkpoints
+            WHERE run_id IN (
+                SELECT run_id FROM run_checkpoints
+                GROUP BY run_id
+                HAVING MAX(created_at) < ?
+            )
+            RETURNING run_id
+        """, [datetime.now() - timedelta(days=days)]).fetchall()
+        return len({run_id for run_id, in removed})
+
+    def close(self) -> None:
+        """Close the underlying DuckDB connection"""
+        self.conn.close()
@@ -0,0 +1,55 @@
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+import logging
+import re
+from components.article_id import normalize_doi
+from components.date_normalizer import DateNormalizer, normalizer as default_normalizer
+
+class DataStandardizer:
+    def __init__(self, date_normalizer: Optional[DateNormalizer] = None):
+        """
+        Normalize fetched articles before they are stored
+
+        published_date leaves as an aware UTC datetime (None if unparseable),
+        so later stages never re-parse date strings. doi and keywords from
+        the feed are kept: content_id prefers the DOI, and the LLM prompts
+        read the keywords.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.date_normalizer = date_normalizer or default_normalizer
+
+    def standardize(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        standardized_articles = []
+        for article in articles:
+            try:
+                standardized_article = self._standardize_article(article)
+                standardized_articles.append(standardized_article)
+            except Exception as e:
+                self.logger.error(f"Error standardizing article: {str(e)}")
+        return standardized_articles
+
+    def _standardize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'title': self._standardize_title(article.get('title', '')),
+            'authors': self._standardize_authors(article.get('authors', [])),
+            'journal': article.get('journal', ''),
+            'abstract': self._standardize_abstract(article.get('abstract', '')),
+            'published_date': self._standardize_date(article.get('published_date'), article.get('journal')),
+            'url': article.get('url', ''),
+            'doi': normalize_doi(article.get('doi')),
+            'keywords': [keyword.strip() for keyword in article.get('keywords') or [] if keyword.strip()],
+        }
+
+    def _standardize_title(self, title: str) -> str:
+        return title.strip().title()
+
+    def _standardize_authors(self, authors: List[str]) -> List[str]:
+        return [author.strip() for author in authors if author.strip()]
+
+    def _standardize_abstract(self, abstract: str) -> str:
+        # Remove HTML tags (simple approach, consider using BeautifulSoup for more complex HTML)
+        abstract = re.sub('<[^<]+?>', '', abstract)
+        return abstract.strip()
+
+    def _standardize_date(self, value: Any, journal: Optional[str] = None) -> Optional[datetime]:
+        return self.date_normalizer.normalize(value, feed=journal)
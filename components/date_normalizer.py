@@ -0,0 +1,117 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import time
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from dateutil import parser as date_parser
+
+def _strptime(fmt: str) -> Callable[[str], datetime]:
+    return lambda text: datetime.strptime(text, fmt)
+
+# Fills fields dateutil cannot find; without it they come from today's date,
+# so the same partial date would parse differently on every run
+DATEUTIL_DEFAULT = datetime(1900, 1, 1)
+
+def _dateutil(text: str) -> datetime:
+    try:
+        parsed = date_parser.parse(text, default=DATEUTIL_DEFAULT)
+    except OverflowError as e:
+        raise ValueError(str(e))
+    # A missing month or day becomes the 1st; a missing year is unusable
+    if parsed.year == DATEUTIL_DEFAULT.year:
+        raise ValueError(f"No year in date {text!r}")
+    return parsed
+
+# Candidate formats, cheapest and most common in journal feeds first
+FORMATS: List[Tuple[str, Callable[[str], datetime]]] = [
+    ('rfc822', parsedate_to_datetime),
+    ('iso8601', datetime.fromisoformat),
+    ('%d %B %Y', _strptime('%d %B %Y')),
+    ('%d %b %Y', _strptime('%d %b %Y')),
+    ('%B %d, %Y', _strptime('%B %d, %Y')),
+    ('%Y/%m/%d', _strptime('%Y/%m/%d')),
+    ('dateutil', _dateutil),
+]
+
+class DateNormalizer:
+    def __init__(self, formats: Optional[List[Tuple[str, Callable[[str], datetime]]]] = None):
+        """
+        Parse feed dates into timezone-aware UTC datetimes
+
+        A feed writes every date the same way, so the first format that
+        parses a feed's date is remembered and tried first for the rest of
+        its entries; the full candidate list is only walked again if the
+        feed changes format. Naive values are taken to be UTC, as are
+        feedparser's *_parsed struct_times.
+
+        Args:
+            formats: (name, parse function) candidates tried in order
+        """
+        self.logger = logging.getLogger(__name__)
+        self.formats = formats or FORMATS
+        self._parsers = dict(self.formats)
+        self.feed_formats: Dict[Optional[str], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def normalize(self, value: Any, feed: Optional[str] = None) -> Optional[datetime]:
+        """
+        Convert a feed date to an aware UTC datetime
+
+        Args:
+            value: datetime, date, struct_time/tuple or date string
+            feed: Name of the feed the value came from, used to cache its format
+
+        Returns:
+            Aware UTC datetime, or None if the value cannot be parsed
+        """
+        if value is None or value == '':
+            return None
+        if isinstance(value, datetime):
+            return self._to_utc(value)
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+        if isinstance(value, (time.struct_time, tuple)):
+            try:
+                return datetime(*value[:6], tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                return None
+        return self._parse_text(str(value).strip(), feed)
+
+    def _parse_text(self, text: str, feed: Optional[str]) -> Optional[datetime]:
+        if not text:
+            return None
+        cached = self.feed_formats.get(feed)
+        if cached is not None:
+            try:
+                parsed = self._parsers[cached](text)
+                self.hits += 1
+                return self._to_utc(parsed)
+            except (TypeError, ValueError):
+                pass
+
+        self.misses += 1
+        for name, parse in self.formats:
+            if name == cached:
+                continue
+            try:
+                parsed = parse(text)
+            except (TypeError, ValueError):
+                continue
+            self.feed_formats[feed] = name
+            return self._to_utc(parsed)
+        self.logger.warning(f"Could not parse date {text!r} from {feed or 'unknown feed'}")
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Cached-format hits and full format scans so far"""
+        return {'hits': self.hits, 'misses': self.misses, 'feeds': len(self.feed_formats)}
+
+# Shared instance; each parse worker process learns its own feed formats
+normalizer = DateNormalizer()
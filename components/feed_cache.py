@@ -0,0 +1,89 @@
+from typing import Dict, Optional
+import hashlib
+import os
+from datetime import datetime
+import duckdb
+
+class FeedCache:
+    def __init__(self, db_path: str = "data/feed_cache.ddb"):
+        """Persistent per-URL store of HTTP validators for conditional GETs"""
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.conn = duckdb.connect(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize DuckDB validator table"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_validators (
+                url VARCHAR PRIMARY KEY,
+                etag VARCHAR,
+                last_modified VARCHAR,
+                content_hash VARCHAR,
+                last_fetched TIMESTAMP
+            )
+        """)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the stored validators for a feed URL, if any"""
+        row = self.conn.execute("""
+            SELECT url, etag, last_modified, content_hash, last_fetched
+            FROM feed_validators
+            WHERE url = ?
+        """, [url]).fetchone()
+        if row is None:
+            return None
+        columns = ['url', 'etag', 'last_modified', 'content_hash', 'last_fetched']
+        return dict(zip(columns, row))
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a feed URL"""
+        entry = self.get(url)
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """Hash a feed body so unchanged documents can be detected"""
+        return hashlib.sha256(content).hexdigest()
+
+    def is_unchanged(self, url: str, content: bytes) -> bool:
+        """Check whether a feed body matches the last body stored for the URL"""
+        entry = self.get(url)
+        return bool(entry and entry['content_hash'] == self.hash_content(content))
+
+    def store(self,
+              url: str,
+              etag: Optional[str] = None,
+              last_modified: Optional[str] = None,
+              content: Optional[bytes] = None,
+              content_hash: Optional[str] = None) -> None:
+        """Record validators and body hash after a successful fetch"""
+        if content is not None:
+            content_hash = self.hash_content(content)
+        self.conn.execute("""
+            INSERT OR REPLACE INTO feed_validators
+            VALUES (?, ?, ?, ?, ?)
+        """, [url, etag, last_modified, content_hash, datetime.now()])
+
+    def touch(self, url: str) -> None:
+        """Update the last fetch time for a feed that was not modified"""
+        self.conn.execute("""
+            UPDATE feed_validators
+            SET last_fetched = ?
+            WHERE url = ?
+        """, [datetime.now(), url])
+
+    def forget(self, url: str) -> None:
+        """Drop a feed's validators so its next fetch downloads and parses it in full"""
+        self.conn.execute("DELETE FROM feed_validators WHERE url = ?", [url])
+
+    def close(self) -> None:
+        """Close the underlying DuckDB connection"""
+        self.conn.close()
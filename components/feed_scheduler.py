@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional
+import heapq
+import logging
+import random
+from datetime import datetime, timedelta
+
+class FeedScheduler:
+    def __init__(self,
+                 journals: List[Dict[str, str]],
+                 min_interval: timedelta = timedelta(hours=1),
+                 max_interval: timedelta = timedelta(hours=48),
+                 default_interval: timedelta = timedelta(hours=6),
+                 poll_fraction: float = 0.5,
+                 rng: Optional[random.Random] = None):
+        """
+        Per-feed polling schedule adapted to each journal's publication cadence
+
+        A journal is polled every poll_fraction of its typical gap between
+        publications, clamped to [min_interval, max_interval]. Journals
+        without history use default_interval. First polls are spread at
+        random across each journal's interval so feeds are not all fetched
+        in one burst.
+
+        Args:
+            journals: Rows from journals.csv, keyed by 'Journal Name'
+            min_interval: Shortest time between polls of one feed
+            max_interval: Longest time between polls of one feed
+            default_interval: Interval for journals with no stored articles
+            poll_fraction: Poll interval as a fraction of the publication gap
+            rng: Random source for the initial stagger
+        """
+        self.logger = logging.getLogger(__name__)
+        self.journals = {journal['Journal Name']: journal for journal in journals}
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.poll_fraction = poll_fraction
+        self.cadence: Dict[str, timedelta] = {}
+        self.rng = rng or random.Random()
+        self._queue: List = []
+
+    def update_cadence(self, cadence: Dict[str, timedelta]) -> None:
+        """Replace the typical publication gap per journal name"""
+        self.cadence = dict(cadence)
+
+    def interval(self, journal_name: str) -> timedelta:
+        gap = self.cadence.get(journal_name)
+        if gap is None:
+            return self.default_interval
+        return min(self.max_interval, max(self.min_interval, gap * self.poll_fraction))
+
+    def start(self, now: datetime) -> None:
+        """Schedule every journal's first poll within one interval of now"""
+        self._queue = [
+            (now + self.interval(name) * self.rng.random(), name)
+            for name in self.journals
+        ]
+        heapq.heapify(self._queue)
+
+    def due(self, now: datetime) -> List[Dict[str, str]]:
+        """Remove and return the journals whose poll time has passed"""
+        journals = []
+        while self._queue and self._queue[0][0] <= now:
+            _, name = heapq.heappop(self._queue)
+            journals.append(self.journals[name])
+        return journals
+
+    def reschedule(self, journal: Dict[str, str], now: datetime,
+                   delay: Optional[timedelta] = None) -> datetime:
+        """Queue a journal's next poll one interval, or `delay` if given, after now"""
+        name = journal['Journal Name']
+        next_poll = now + (delay if delay is not None else self.interval(name))
+        heapq.heappush(self._queue, (next_poll, name))
+        return next_poll
+
+    def next_poll(self) -> Optional[datetime]:
+        return self._queue[0][0] if self._queue else None
+
+    def polls_per_day(self) -> float:
+        """Expected feed requests per day under the current intervals"""
+        day = timedelta(days=1)
+        return sum(day / self.interval(name) for name in self.journals)
@@ -0,0 +1,117 @@
+from typing import List, Dict, Optional, Any, Iterator
+from datetime import datetime, timezone
+import xml.etree.ElementTree as ET
+from components.date_normalizer import normalizer
+from components.parse_executor import html_to_text
+
+# Local tag names (namespace stripped) used by RSS 2.0, RSS 1.0/RDF and Atom
+ITEM_TAGS = {'item', 'entry'}
+CHANNEL_TAGS = {'channel', 'feed'}
+CONTENT_TAGS = ('encoded', 'content', 'description', 'summary')
+DATE_TAGS = ('pubDate', 'published', 'date', 'updated', 'created')
+
+def _local_name(tag: str) -> str:
+    """Strip the '{namespace}' prefix ElementTree puts on qualified tags"""
+    return tag.rsplit('}', 1)[-1]
+
+def _text(element: Optional[ET.Element]) -> str:
+    return ''.join(element.itertext()).strip() if element is not None else ''
+
+class StreamingFeedParser:
+    def __init__(self, clean: bool = True):
+        """
+        Incremental RSS/Atom parser fed with raw byte chunks
+
+        Articles are emitted as soon as their closing tag arrives and the
+        element is detached from the tree, so memory stays proportional to
+        one entry rather than the whole document.
+
+        Args:
+            clean: Strip HTML from abstracts here. Pass False to emit raw
+                content and clean it later with clean_abstracts.
+        """
+        self.clean = clean
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._stack: List[ET.Element] = []
+        self.journal = ''
+
+    def feed(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+        """Feed a chunk of the document and yield any completed articles"""
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> Iterator[Dict[str, Any]]:
+        """Signal end of document and yield any remaining articles"""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> Iterator[Dict[str, Any]]:
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._stack.append(element)
+                continue
+
+            self._stack.pop()
+            name = _local_name(element.tag)
+            parent = self._stack[-1] if self._stack else None
+            parent_name = _local_name(parent.tag) if parent is not None else ''
+
+            if name == 'title' and parent_name in CHANNEL_TAGS and not self.journal:
+                self.journal = _text(element)
+            elif name in ITEM_TAGS:
+                article = self._standardize_element(element)
+                if parent is not None:
+                    parent.remove(element)
+                yield article
+
+    def _standardize_element(self, element: ET.Element) -> Dict[str, Any]:
+        """
+        Convert an <item>/<entry> element to the standardized article format
+
+        Mirrors RSSFeedFetcher._standardize_entry so both parse modes
+        produce interchangeable dictionaries.
+        """
+        children: Dict[str, List[ET.Element]] = {}
+        for child in element:
+            children.setdefault(_local_name(child.tag), []).append(child)
+
+        def first(*names: str) -> Optional[ET.Element]:
+            for name in names:
+                if children.get(name):
+                    return children[name][0]
+            return None
+
+        # Extract date with fallbacks
+        published_date = None
+        for name in DATE_TAGS:
+            published_date = normalizer.normalize(_text(first(name)), feed=self.journal)
+            if published_date:
+                break
+        if not published_date:
+            published_date = datetime.now(timezone.utc)
+
+        # RSS puts the URL in the text, Atom in an href attribute
+        link = first('link')
+        url = ''
+        if link is not None:
+            url = link.get('href') or _text(link)
+
+        # Extract and clean text content
+        content = _text(first(*CONTENT_TAGS))
+        if content and self.clean:
+            content = html_to_text(content)[:1000]
+
+        # dc:creator (RSS) or <author><name> (Atom)
+        authors = [_text(creator) for creator in children.get('creator', [])]
+        for author in children.get('author', []):
+            name = next((c for c in author if _local_name(c.tag) == 'name'), None)
+            authors.append(_text(name) if name is not None else _text(author))
+
+        return {
+            'title': _text(first('title')),
+            'journal': self.journal,
+            'published_date': published_date,
+            'abstract': content,
+            'url': url,
+            'authors': [author for author in authors if author]
+        }
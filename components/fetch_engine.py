@@ -0,0 +1,250 @@
+from typing import AsyncIterator, Dict, Optional, NamedTuple
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import random
+import time
+from urllib.parse import urlparse
+import aiohttp
+
+# Statuses worth retrying; 403 is deliberately absent so blocked feeds fail fast
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+class FetchResponse(NamedTuple):
+    """Result of a single HTTP fetch"""
+    url: str
+    status: int
+    body: bytes
+    headers: Dict[str, str]
+    elapsed: float
+
+class FetchEngine:
+    def __init__(self,
+                 max_concurrency: int = 16,
+                 per_host_limit: int = 2,
+                 min_host_interval: float = 0.5,
+                 timeout: int = 30,
+                 max_retries: int = 3,
+                 backoff_base: float = 1.0,
+                 max_retry_after: float = 60.0,
+                 user_agent: str = DEFAULT_USER_AGENT):
+        """
+        Pooled async HTTP engine with global and per-host concurrency limits
+
+        Args:
+            max_concurrency: Maximum requests in flight across all hosts
+            per_host_limit: Maximum requests in flight to any single host
+            min_host_interval: Minimum seconds between request starts on one host
+            timeout: Total request timeout in seconds
+            max_retries: Attempts per URL before giving up
+            backoff_base: Base delay in seconds for exponential backoff
+            max_retry_after: Upper bound in seconds on a server's Retry-After
+            user_agent: User-Agent header sent with every request
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.min_host_interval = min_host_interval
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_retry_after = max_retry_after
+        self.user_agent = user_agent
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_last_request: Dict[str, float] = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    async def open(self) -> None:
+        """Create the pooled session with keep-alive and DNS caching"""
+        if self.is_open:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.per_host_limit,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={'User-Agent': self.user_agent}
+        )
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._host_semaphores = {}
+        self._host_last_request = {}
+
+    async def close(self) -> None:
+        """Close the pooled session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'FetchEngine':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def _respect_host_interval(self, host: str) -> None:
+        """Space out request starts on a host; called while holding its semaphore"""
+        now = time.monotonic()
+        wait = self._host_last_request.get(host, 0.0) + self.min_host_interval - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._host_last_request[host] = time.monotonic()
+
+    @asynccontextmanager
+    async def _slot(self, host: str) -> AsyncIterator[None]:
+        """
+        Hold a host slot, then a global slot, for one request
+
+        The host slot and interval wait come first so requests queued
+        behind a busy host never sit on global slots other hosts could use.
+        """
+        async with self._host_semaphore(host):
+            await self._respect_host_interval(host)
+            async with self._global_semaphore:
+                yield
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with jitter, honouring Retry-After up to max_retry_after"""
+        if retry_after and retry_after.isdigit():
+            # A misbehaving host must not stall its worker for hours
+            return min(float(retry_after), self.max_retry_after)
+        return self.backoff_base * (2 ** attempt) + random.uniform(0, self.backoff_base)
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchResponse:
+        """
+        Fetch a URL, retrying transient failures without blocking the loop
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers (e.g. conditional-GET validators)
+
+        Returns:
+            FetchResponse; status 304 responses carry an empty body
+
+        Raises:
+            aiohttp.ClientError: If the request fails after all retries,
+                or immediately on non-retryable HTTP errors such as 403
+        """
+        if not self.is_open:
+            await self.open()
+        host = urlparse(url).netloc
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries):
+            retry_after = None
+            async with self._slot(host):
+                start = time.monotonic()
+                try:
+                    async with self.session.get(url, headers=headers) as response:
+                        if response.status in RETRY_STATUSES:
+                            retry_after = response.headers.get('Retry-After')
+                            raise aiohttp.ClientResponseError(
+                                response.request_info, response.history,
+                                status=response.status, message=response.reason or ''
+                            )
+                        response.raise_for_status()
+                        body = b'' if response.status == 304 else await response.read()
+                        return FetchResponse(
+                            url=url,
+                            status=response.status,
+                            body=body,
+                            headers=dict(response.headers),
+                            elapsed=time.monotonic() - start
+                        )
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in RETRY_STATUSES:
+                        raise
+                    last_error = e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    last_error = e
+
+            # Back off outside the semaphores so other feeds keep flowing
+            if attempt < self.max_retries - 1:
+                delay = self._backoff_delay(attempt, retry_after)
+                self.logger.warning(
+                    f"Attempt {attempt + 1} failed for {url}: {last_error!r}; retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+        if isinstance(last_error, aiohttp.ClientError):
+            raise last_error
+        raise aiohttp.ServerTimeoutError(f"Timed out fetching {url}")
+
+    @asynccontextmanager
+    async def stream(self, url: str,
+                     headers: Optional[Dict[str, str]] = None) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Open a URL for streaming, retrying only until the response starts
+
+        The global and per-host slots stay held while the caller reads the
+        body, and leaving the context early closes the connection so the
+        rest of the document is never downloaded.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers (e.g. conditional-GET validators)
+
+        Yields:
+            The open aiohttp response; 304 responses are yielded unread
+
+        Raises:
+            aiohttp.ClientError: If the request cannot be started after all
+                retries, or immediately on non-retryable HTTP errors
+        """
+        if not self.is_open:
+            await self.open()
+        host = urlparse(url).netloc
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries):
+            retry_after = None
+            async with self._slot(host):
+                try:
+                    response = await self.session.get(url, headers=headers)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    last_error = e
+                else:
+                    try:
+                        if response.status in RETRY_STATUSES:
+                            retry_after = response.headers.get('Retry-After')
+                            last_error = aiohttp.ClientResponseError(
+                                response.request_info, response.history,
+                                status=response.status, message=response.reason or ''
+                            )
+                        else:
+                            response.raise_for_status()
+                            yield response
+                            return
+                    finally:
+                        response.release()
+
+            if attempt < self.max_retries - 1:
+                delay = self._backoff_delay(attempt, retry_after)
+                self.logger.warning(
+                    f"Attempt {attempt + 1} failed for {url}: {last_error!r}; retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+        if isinstance(last_error, aiohttp.ClientError):
+            raise last_error
+        raise aiohttp.ServerTimeoutError(f"Timed out fetching {url}")
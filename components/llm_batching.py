@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Sequence
+import json
+import re
+
+FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+def chunk(items: Sequence[Any], size: int) -> List[List[Any]]:
+    """Split items into consecutive lists of at most `size`"""
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+def format_articles(articles: Sequence[Dict]) -> str:
+    """Render articles as numbered blocks for a multi-article prompt"""
+    return "\n\n".join(
+        f"Article {i}:\nTitle: {article.get('title', '')}\nAbstract: {article.get('abstract', '')}"
+        for i, article in enumerate(articles)
+    )
+
+def _coerce_item(item: Any) -> Dict[str, Any]:
+    """Validate one element of a batched response; raises on bad shape"""
+    summary = str(item['summary']).strip()
+    if not summary:
+        raise ValueError("empty summary")
+    score = float(item['relevance_score'])
+    if not 0.0 <= score <= 1.0:
+        raise ValueError(f"relevance_score out of range: {score}")
+    topics = item.get('key_topics', [])
+    if isinstance(topics, str):
+        topics = [topic.strip() for topic in topics.split(',') if topic.strip()]
+    return {
+        'llm_summary': summary,
+        'relevance_score': score,
+        'key_topics': [str(topic) for topic in topics],
+        'relevance_reasoning': str(item.get('reasoning', ''))
+    }
+
+def parse_batch_response(text: str, n_articles: int) -> Dict[int, Dict[str, Any]]:
+    """
+    Parse a multi-article JSON response into per-article results
+
+    Only well-formed items with an id in range are returned; callers
+    re-request whatever is missing.
+
+    Returns:
+        Mapping from article index to the fields to merge into it
+    """
+    fenced = FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start, end = text.find('['), text.rfind(']')
+    if start == -1 or end <= start:
+        return {}
+    try:
+        items = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+
+    results = {}
+    for item in items if isinstance(items, list) else []:
+        try:
+            index = int(item['id'])
+            if 0 <= index < n_articles and index not in results:
+                results[index] = _coerce_item(item)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return results
+
+def parse_fused_response(text: str) -> Dict[str, Any]:
+    """
+    Parse a single-article summarize-and-score JSON response
+
+    Returns:
+        The fields to merge into the article
+
+    Raises:
+        ValueError: If the response holds no well-formed result
+    """
+    fenced = FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end <= start:
+        raise ValueError("no JSON object in response")
+    try:
+        item = json.loads(text[start:end + 1])
+        return _coerce_item(item)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}")
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"malformed result: {e!r}")
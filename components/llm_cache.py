@@ -0,0 +1,141 @@
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+import duckdb
+
+class LLMResponseCache:
+    def __init__(self,
+                 db_path: str = "data/llm_cache.ddb",
+                 ttl: timedelta = timedelta(days=30),
+                 max_bytes: int = 100 * 1024 * 1024):
+        """
+        Persistent content-addressed cache of LLM responses
+
+        Args:
+            db_path: DuckDB file holding cached responses
+            ttl: Age after which a cached response is treated as a miss
+            max_bytes: Total response size kept before least recently
+                used entries are evicted
+        """
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.conn = duckdb.connect(db_path)
+        self._init_db()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._total_bytes = self.conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+        ).fetchone()[0]
+
+    def _init_db(self):
+        """Initialize DuckDB response table"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key VARCHAR PRIMARY KEY,
+                model_name VARCHAR,
+                response VARCHAR,
+                size_bytes BIGINT,
+                created_at TIMESTAMP,
+                last_accessed TIMESTAMP
+            )
+        """)
+
+    @staticmethod
+    def make_key(model_name: str, template: str, inputs: Dict[str, Any]) -> str:
+        """Hash of the model name, prompt template and input fields"""
+        template_hash = hashlib.sha256(template.encode('utf-8')).hexdigest()
+        payload = json.dumps(
+            {'model': model_name, 'template': template_hash, 'inputs': inputs},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None on a miss or expired entry"""
+        row = self.conn.execute("""
+            SELECT response, created_at FROM llm_responses WHERE key = ?
+        """, [key]).fetchone()
+        now = datetime.now()
+        if row is None or row[1] < now - self.ttl:
+            if row is not None:
+                self._delete(key)
+            self.misses += 1
+            return None
+
+        self.conn.execute("""
+            UPDATE llm_responses SET last_accessed = ? WHERE key = ?
+        """, [now, key])
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, response: str, model_name: str = '') -> None:
+        """Store a response and evict least recently used entries if over size"""
+        size = len(response.encode('utf-8'))
+        existing = self.conn.execute(
+            "SELECT size_bytes FROM llm_responses WHERE key = ?", [key]
+        ).fetchone()
+        now = datetime.now()
+        self.conn.execute("""
+            INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?, ?)
+        """, [key, model_name, response, size, now, now])
+        self._total_bytes += size - (existing[0] if existing else 0)
+
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _delete(self, key: str) -> None:
+        row = self.conn.execute("""
+            DELETE FROM llm_responses WHERE key = ? RETURNING size_bytes
+        """, [key]).fetchone()
+        if row:
+            self._total_bytes -= row[0]
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits max_bytes"""
+        evicted = self.conn.execute("""
+            DELETE FROM llm_responses
+            WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size_bytes) OVER (
+                        ORDER BY last_accessed DESC, created_at DESC
+                        ROWS UNBOUNDED PRECEDING
+                    ) AS retained_bytes
+                    FROM llm_responses
+                )
+                WHERE retained_bytes > ?
+            )
+            RETURNING size_bytes
+        """, [self.max_bytes]).fetchall()
+        self.evictions += len(evicted)
+        self._total_bytes -= sum(row[0] for row in evicted)
+        self.logger.info(f"Evicted {len(evicted)} LLM cache entries")
+
+    def purge_expired(self) -> int:
+        """Delete every entry older than the TTL and return how many"""
+        removed = self.conn.execute("""
+            DELETE FROM llm_responses WHERE created_at < ? RETURNING size_bytes
+        """, [datetime.now() - self.ttl]).fetchall()
+        self._total_bytes -= sum(row[0] for row in removed)
+        return len(removed)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters for this process and current size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size_bytes': self._total_bytes
+        }
+
+    def close(self) -> None:
+        """Close the underlying DuckDB connection"""
+        self.conn.close()
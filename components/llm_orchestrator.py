@@ -1,13 +1,32 @@
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from langchain.chat_models import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from langchain.chains import LLMChain
 from langchain.output_parsers import ResponseSchema, StructuredOutputParser
 import asyncio
 import json
+import logging
+from components.llm_cache import LLMResponseCache
+from components.llm_scheduler import LLMScheduler, estimate_tokens
+from components.llm_batching import chunk, format_articles, parse_batch_response, parse_fused_response
+
+# Completion budget assumed per call when reserving tokens-per-minute capacity
+EXPECTED_COMPLETION_TOKENS = 400
 
 class LLMOrchestrator:
-    def __init__(self, model_name: str, api_key: str):
+    def __init__(self,
+                 model_name: str,
+                 api_key: str,
+                 cache: Optional[LLMResponseCache] = None,
+                 scheduler: Optional[LLMScheduler] = None,
+                 batch_size: int = 1,
+                 fused: bool = False):
+        self.logger = logging.getLogger(__name__)
+        self.model_name = model_name
+        self.cache = cache
+        self.scheduler = scheduler or LLMScheduler()
+        self.batch_size = batch_size
+        self.fused = fused
         self.llm = ChatOpenAI(
             model_name=model_name,
             openai_api_key=api_key,
@@ -29,6 +48,13 @@ class LLMOrchestrator:
         ]
         self.relevance_parser = StructuredOutputParser.from_response_schemas(relevance_schemas)
         
+        # Same schema plus the summary, for the single-call summarize-and-score chain
+        fused_schemas = [
+            ResponseSchema(name="summary",
+                         description="Technical summary of the article (150 words max)")
+        ] + relevance_schemas
+        self.fused_parser = StructuredOutputParser.from_response_schemas(fused_schemas)
+        
     def _init_prompts(self):
         """Initialize various prompts used by the orchestrator"""
         self.summary_prompt = ChatPromptTemplate.from_template(
@@ -65,29 +91,254 @@ class LLMOrchestrator:
             """
         )
         
+        self.fused_prompt = ChatPromptTemplate.from_template(
+            """You are an expert in sedimentology and geomorphology.
+            Summarize this scientific article for researchers in the field and
+            evaluate its relevance to sedimentology and fluvial geomorphology:
+            
+            Title: {title}
+            Abstract: {abstract}
+            
+            For the summary, focus on:
+            1. Key findings and their significance
+            2. Methodology highlights
+            3. Implications for sedimentology and geomorphology
+            Keep it technical but concise (150 words max).
+            
+            For relevance, consider these key areas: {keywords}
+            Base the relevance score on:
+            - Direct applicability to sedimentology/geomorphology
+            - Methodological innovation
+            - Potential impact on the field
+            
+            Format your response as JSON with:
+            {format_instructions}
+            """
+        )
+        
+        self.batch_prompt = ChatPromptTemplate.from_template(
+            """You are an expert in sedimentology and geomorphology.
+            For each of the {n_articles} articles below:
+            1. Summarize it for researchers in the field (150 words max), focusing on
+               key findings, methodology highlights and implications for sedimentology
+               and geomorphology.
+            2. Evaluate its relevance to sedimentology and fluvial geomorphology,
+               considering these key areas: {keywords}
+            
+            {articles}
+            
+            Respond with only a JSON array holding one object per article, with keys:
+            "id": the article number shown above
+            "summary": the summary
+            "relevance_score": float between 0-1 indicating relevance
+            "key_topics": list of key topics from the article
+            "reasoning": explanation of the relevance score
+            """
+        )
+        
+        self.highlights_prompt = ChatPromptTemplate.from_template(
+            """Create engaging highlights for these top articles in sedimentology:
+            
+            Articles:
+            {article_summaries}
+            
+            Write 2-3 sentences for each article that:
+            1. Capture the most interesting finding
+            2. Explain why it matters to the field
+            3. Use engaging, professional language
+            
+            Format as markdown with article titles as headers."""
+        )
+    
+    @staticmethod
+    def _template_text(prompt: ChatPromptTemplate) -> str:
+        """Raw template text of a prompt, used to version cache keys"""
+        return "\n".join(
+            getattr(getattr(message, 'prompt', None), 'template', repr(message))
+            for message in prompt.messages
+        )
+    
+    @staticmethod
+    def _accepts(validate: Optional[Callable[[str], Any]], response: str) -> bool:
+        if validate is None:
+            return True
+        try:
+            validate(response)
+        except Exception:
+            return False
+        return True
+    
+    async def _run_prompt(self,
+                          prompt: ChatPromptTemplate,
+                          validate: Optional[Callable[[str], Any]] = None,
+                          **inputs) -> str:
+        """
+        Run a prompt through the LLM, serving repeats from the response cache
+        
+        Args:
+            prompt: Prompt template to run
+            validate: The caller's parser; a response it raises on is
+                returned but not cached, so a re-run asks the model again
+            **inputs: Prompt inputs
+        """
+        key = None
+        if self.cache:
+            key = self.cache.make_key(self.model_name, self._template_text(prompt), inputs)
+            cached = self.cache.get(key)
+            if cached is not None and self._accepts(validate, cached):
+                return cached
+        
+        chain = LLMChain(llm=self.llm, prompt=prompt)
+        template = self._template_text(prompt)
+        tokens = estimate_tokens(template + "".join(str(v) for v in inputs.values()))
+        result = await self.scheduler.run(
+            lambda: chain.arun(**inputs),
+            estimated_tokens=tokens + EXPECTED_COMPLETION_TOKENS
+        )
+        
+        if self.cache and self._accepts(validate, result):
+            self.cache.set(key, result, model_name=self.model_name)
+        return result
+        
     async def process_batch(self, articles: List[Dict]) -> List[Dict]:
-        """Process a batch of articles with parallel LLM calls"""
-        tasks = []
-        for article in articles:
-            tasks.append(self.process_single(article))
+        """
+        Process a batch of articles with parallel LLM calls
+        
+        Calls are paced by the scheduler's concurrency and rate budgets.
+        With batch_size > 1, articles are packed into multi-article
+        requests. An article whose calls fail after retries is returned
+        with a zero score and llm_error set instead of failing the batch.
+        """
+        if self.batch_size > 1:
+            groups = chunk(articles, self.batch_size)
+            group_results = await self.scheduler.map(groups, self.process_group)
+            results = []
+            for group, result in zip(groups, group_results):
+                results.extend([result] * len(group) if isinstance(result, Exception) else result)
+        else:
+            results = await self.scheduler.map(articles, self.process_single)
+        
+        processed = []
+        for article, result in zip(articles, results):
+            if isinstance(result, Exception):
+                processed.append(self._mark_failed(article, result))
+            else:
+                processed.append(result)
+        return processed
+    
+    def _mark_failed(self, article: Dict, error: Exception) -> Dict:
+        """Give an article whose LLM calls failed a zero score and llm_error"""
+        self.logger.error(f"LLM processing failed for {article.get('title', '')!r}: {error}")
+        article.update({
+            'relevance_score': 0.0,
+            'key_topics': [],
+            'relevance_reasoning': f"Error processing article: {str(error)}",
+            'llm_error': str(error)
+        })
+        return article
+    
+    async def process_group(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Summarize and score several articles in one structured request
+        
+        Items missing from or malformed in the response are re-requested
+        in smaller groups, down to the single-article path. An article
+        that still fails there is marked with llm_error on its own; the
+        rest of the group keeps its results.
+        
+        Returns:
+            The articles, in input order, updated with LLM fields
+        """
+        if len(articles) == 1:
+            try:
+                return [await self.process_single(articles[0])]
+            except Exception as e:
+                return [self._mark_failed(articles[0], e)]
+        
+        def validate(text: str) -> None:
+            if not parse_batch_response(text, len(articles)):
+                raise ValueError("No usable items in batched response")
+        
+        keywords = sorted({k for article in articles for k in article.get('keywords', [])})
+        try:
+            response = await self._run_prompt(
+                self.batch_prompt,
+                validate=validate,
+                n_articles=len(articles),
+                articles=format_articles(articles),
+                keywords=", ".join(keywords)
+            )
+            parsed = parse_batch_response(response, len(articles))
+        except Exception as e:
+            self.logger.warning(f"Batched request for {len(articles)} articles failed: {e}")
+            parsed = {}
+        
+        for index, fields in parsed.items():
+            articles[index].update(fields)
         
-        return await asyncio.gather(*tasks)
+        failed = [article for index, article in enumerate(articles) if index not in parsed]
+        if not failed:
+            return articles
+        self.logger.info(f"Re-requesting {len(failed)} of {len(articles)} batched articles")
+        # Results are merged into the article dicts in place, so the
+        # input list holds every outcome once the retries complete
+        if len(failed) == len(articles):
+            middle = len(articles) // 2
+            await asyncio.gather(
+                self.process_group(articles[:middle]),
+                self.process_group(articles[middle:])
+            )
+        else:
+            await self.process_group(failed)
+        return articles
     
     async def process_single(self, article: Dict) -> Dict:
         """Process a single article with LLM analysis"""
-        # Create chains
-        summary_chain = LLMChain(llm=self.llm, prompt=self.summary_prompt)
-        relevance_chain = LLMChain(llm=self.llm, prompt=self.relevance_prompt)
+        if self.fused:
+            return await self._process_fused(article)
+        return await self._process_two_stage(article)
+    
+    async def _process_fused(self, article: Dict) -> Dict:
+        """
+        Summarize and score an article in one LLM call
+
+        A response that does not parse is never used as the summary;
+        the article is re-processed with the two-call chain instead.
+        """
+        result = await self._run_prompt(
+            self.fused_prompt,
+            validate=parse_fused_response,
+            title=article['title'],
+            abstract=article['abstract'],
+            keywords=", ".join(article.get('keywords', [])),
+            format_instructions=self.fused_parser.get_format_instructions()
+        )
+        
+        try:
+            article.update(parse_fused_response(result))
+        except ValueError as e:
+            self.logger.warning(
+                f"Unusable fused response for {article.get('title', '')!r} ({e}); "
+                f"falling back to separate summary and relevance calls"
+            )
+            return await self._process_two_stage(article)
         
+        return article
+    
+    async def _process_two_stage(self, article: Dict) -> Dict:
+        """Summarize an article, then score the summary in a second call"""
         # Generate summary
-        summary_result = await summary_chain.arun(
+        summary_result = await self._run_prompt(
+            self.summary_prompt,
             title=article['title'],
             abstract=article['abstract']
         )
         article['llm_summary'] = summary_result
         
         # Generate relevance analysis
-        relevance_result = await relevance_chain.arun(
+        relevance_result = await self._run_prompt(
+            self.relevance_prompt,
+            validate=self.relevance_parser.parse,
             title=article['title'],
             summary=summary_result,
             keywords=", ".join(article.get('keywords', [])),
@@ -105,27 +356,14 @@ class LLMOrchestrator:
             article.update({
                 'relevance_score': 0.0,
                 'key_topics': [],
-                'relevance_reasoning': f"Error parsing relevance: {str(e)}"
+                'relevance_reasoning': f"Error parsing relevance: {str(e)}",
+                'llm_error': str(e)
             })
         
         return article
 
     async def get_article_highlights(self, articles: List[Dict], n_highlights: int = 3) -> str:
         """Generate engaging highlights for the newsletter"""
-        highlights_prompt = ChatPromptTemplate.from_template(
-            """Create engaging highlights for these top articles in sedimentology:
-            
-            Articles:
-            {article_summaries}
-            
-            Write 2-3 sentences for each article that:
-            1. Capture the most interesting finding
-            2. Explain why it matters to the field
-            3. Use engaging, professional language
-            
-            Format as markdown with article titles as headers."""
-        )
-        
         # Sort by relevance and take top n
         sorted_articles = sorted(articles, 
                                key=lambda x: x.get('relevance_score', 0), 
@@ -137,5 +375,4 @@ class LLMOrchestrator:
             for a in sorted_articles
         ])
         
-        highlights_chain = LLMChain(llm=self.llm, prompt=highlights_prompt)
-        return await highlights_chain.arun(article_summaries=summaries)
\ No newline at end of file
+        return await self._run_prompt(self.highlights_prompt, article_summaries=summaries)
\ No newline at end of file
@@ -0,0 +1,150 @@
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, TypeVar, Union
+import asyncio
+import logging
+import random
+import time
+
+T = TypeVar('T')
+
+# Exception class names raised by the OpenAI client for transient failures
+RETRYABLE_ERROR_NAMES = {
+    'RateLimitError', 'APITimeoutError', 'APIConnectionError',
+    'InternalServerError', 'ServiceUnavailableError', 'Timeout'
+}
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+def is_retryable(error: BaseException) -> bool:
+    """True for rate limits (429), server errors (5xx) and timeouts"""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    status = getattr(error, 'status_code', None) or getattr(error, 'http_status', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+class RateLimiter:
+    """Token bucket refilled continuously at `rate` units per `period` seconds"""
+
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = rate
+        self.refill_per_second = rate / period
+        self.available = rate
+        self.updated = time.monotonic()
+        # Created inside the running loop; on Python 3.9 a lock made in
+        # __init__ binds to whatever loop get_event_loop() returned then
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        # Requests larger than the bucket wait for a full bucket rather than forever
+        amount = min(amount, self.capacity)
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                self.available = min(
+                    self.capacity,
+                    self.available + (now - self.updated) * self.refill_per_second
+                )
+                self.updated = now
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                await asyncio.sleep((amount - self.available) / self.refill_per_second)
+
+class LLMScheduler:
+    def __init__(self,
+                 max_in_flight: int = 8,
+                 requests_per_minute: Optional[float] = 60,
+                 tokens_per_minute: Optional[float] = 40000,
+                 max_retries: int = 5,
+                 backoff_base: float = 1.0,
+                 max_backoff: float = 60.0):
+        """
+        Schedule LLM calls within concurrency, request and token budgets
+
+        Args:
+            max_in_flight: Maximum concurrent API calls
+            requests_per_minute: Request budget; None disables the limit
+            tokens_per_minute: Token budget; None disables the limit
+            max_retries: Attempts per call for 429/5xx/timeout errors
+            backoff_base: Base delay in seconds for jittered backoff
+            max_backoff: Upper bound on a single backoff delay
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_in_flight = max_in_flight
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.request_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        self.token_limiter = RateLimiter(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.calls = 0
+        self.retries = 0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """In-flight limit, created lazily in (and rebound to) the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, call: Callable[[], Awaitable[T]], estimated_tokens: int = 0) -> T:
+        """
+        Run one API call once budgets allow, retrying transient failures
+
+        Args:
+            call: Zero-argument coroutine factory making the API call
+            estimated_tokens: Prompt plus expected completion tokens
+
+        Raises:
+            The last error if retries are exhausted or it is not retryable
+        """
+        for attempt in range(self.max_retries):
+            if self.request_limiter:
+                await self.request_limiter.acquire(1)
+            if self.token_limiter and estimated_tokens:
+                await self.token_limiter.acquire(estimated_tokens)
+            try:
+                async with self.semaphore:
+                    self.calls += 1
+                    return await call()
+            except Exception as e:
+                if not is_retryable(e) or attempt == self.max_retries - 1:
+                    raise
+                delay = min(self.max_backoff, self.backoff_base * (2 ** attempt))
+                delay = random.uniform(delay / 2, delay)  # jitter spreads retries out
+                self.retries += 1
+                self.logger.warning(
+                    f"LLM call failed ({type(e).__name__}); retry {attempt + 1} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def map(self,
+                  items: Sequence[Any],
+                  worker: Callable[[Any], Awaitable[T]]) -> List[Union[T, Exception]]:
+        """
+        Apply worker to every item concurrently, isolating failures
+
+        Returns:
+            One entry per item: the worker's result, or the exception it
+            raised, so a single bad article cannot sink the whole batch
+        """
+        return await asyncio.gather(
+            *[worker(item) for item in items],
+            return_exceptions=True
+        )
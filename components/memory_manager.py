@@ -1,16 +1,51 @@
 from typing import List, Dict, Optional
+import glob
 import json
 import os
 from datetime import datetime, timedelta
 import duckdb
+import pandas as pd
+from components.async_db import AsyncDuckDB
+from components.article_id import article_doi, content_id
+from components.vector_index import VectorIndex
+
+# Column order of the articles table. relevance_score is the final ranking
+# score; llm_relevance is the LLM's own score, kept as pre-filter training labels
+ARTICLE_COLUMNS = ['id', 'title', 'journal', 'published_date', 'relevance_score',
+                   'summary', 'processed_date', 'url', 'doi', 'llm_relevance', 'abstract']
+# Columns exposed by article_history; archives written before llm_relevance
+# and abstract existed do not have them
+HISTORY_COLUMNS = ARTICLE_COLUMNS[:9]
 
 class MemoryManager:
-    def __init__(self, db_path: str = "data/newsletter.ddb"):
-        """Initialize with DuckDB for efficient storage and querying"""
+    def __init__(self,
+                 db_path: str = "data/newsletter.ddb",
+                 vector_store_path: Optional[str] = None,
+                 archive_path: Optional[str] = None,
+                 max_readers: int = 4):
+        """
+        Initialize with DuckDB for efficient storage and querying
+
+        Queries run on background threads (see AsyncDuckDB), so the async
+        methods never block the event loop; call close() or use
+        `async with` when done.
+
+        Args:
+            db_path: DuckDB file holding processed articles
+            vector_store_path: Directory for the summary embedding index;
+                None disables semantic context retrieval
+            archive_path: Directory for the year/month-partitioned Parquet
+                archive of old rows; None disables archiving
+            max_readers: Threads serving concurrent read queries
+        """
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
+        self.archive_path = archive_path
         self.conn = duckdb.connect(db_path)
+        self.vector_index = VectorIndex(vector_store_path) if vector_store_path else None
         self._init_db()
+        self._refresh_history_view(self.conn)
+        self.db = AsyncDuckDB(self.conn, max_readers=max_readers)
 
     def _init_db(self):
         """Initialize DuckDB database"""
@@ -22,96 +57,284 @@ class MemoryManager:
                 published_date TIMESTAMP,
                 relevance_score DOUBLE,
                 summary VARCHAR,
-                processed_date TIMESTAMP
+                processed_date TIMESTAMP,
+                url VARCHAR,
+                doi VARCHAR,
+                llm_relevance DOUBLE,
+                abstract VARCHAR
             )
         """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info('articles')").fetchall()}
+        if 'doi' not in columns:
+            self._migrate_ids()
+        elif 'llm_relevance' not in columns:
+            self.conn.execute("ALTER TABLE articles ADD COLUMN llm_relevance DOUBLE")
+            self.conn.execute("ALTER TABLE articles ADD COLUMN abstract VARCHAR")
+
+    def _archive_files(self) -> List[str]:
+        if self.archive_path is None:
+            return []
+        return glob.glob(os.path.join(self.archive_path, 'year=*', 'month=*', '*.parquet'))
+
+    def _refresh_history_view(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """
+        (Re)create the article_history view over hot and archived rows
+
+        Both sides expose year and month partition columns; filters on them
+        let DuckDB skip archive partitions without opening their files.
+        Rows re-processed after archiving shadow their archived copy.
+        """
+        columns = ', '.join(HISTORY_COLUMNS)
+        hot = f"""
+            SELECT {columns},
+                   year(COALESCE(published_date, processed_date))::BIGINT AS year,
+                   month(COALESCE(published_date, processed_date))::BIGINT AS month
+            FROM articles
+        """
+        if self._archive_files():
+            pattern = os.path.join(self.archive_path, '*', '*', '*.parquet').replace("'", "''")
+            hot += f"""
+            UNION ALL
+            SELECT {columns}, year::BIGINT AS year, month::BIGINT AS month
+            FROM read_parquet('{pattern}', hive_partitioning = true, union_by_name = true)
+            WHERE id NOT IN (SELECT id FROM articles)
+            """
+        # Not TEMPORARY: the view must be visible to every thread's cursor
+        cursor.execute(f"CREATE OR REPLACE VIEW article_history AS {hot}")
+
+    def _migrate_ids(self) -> None:
+        """
+        One-time migration from per-process hash() IDs to content IDs
+
+        Tables written before content IDs hold one row per run for the same
+        article; rows are re-keyed and collapsed to the most recently
+        processed one.
+        """
+        rows = self.conn.execute("""
+            SELECT id, title, journal, published_date, relevance_score, summary, processed_date
+            FROM articles
+        """).fetchdf()
+        for column in ('url', 'doi', 'llm_relevance', 'abstract'):
+            rows[column] = None
+        rows['id'] = [
+            content_id({'title': title, 'published_date': published})
+            for title, published in zip(rows['title'], rows['published_date'])
+        ]
+        rows = (rows.sort_values('processed_date', ascending=False, na_position='last')
+                    .drop_duplicates('id'))
+
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("DROP TABLE articles")
+            self._init_db()
+            self.conn.register('migrated_articles', rows[ARTICLE_COLUMNS])
+            self.conn.execute("INSERT INTO articles SELECT * FROM migrated_articles")
+            self.conn.unregister('migrated_articles')
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        if self.vector_index is not None and len(rows):
+            self.vector_index.add(
+                list(rows['id']),
+                [f"{title} {summary}" for title, summary in zip(rows['title'], rows['summary'])]
+            )
     
     async def update(self, articles: List[Dict]) -> None:
-        """Store new articles in DuckDB using efficient batch insert"""
+        """Store new articles in DuckDB using a single columnar merge"""
         if not articles:
             return
-            
-        # Create a temporary table for the batch insert
-        self.conn.execute("""
-            CREATE TEMPORARY TABLE IF NOT EXISTS temp_articles (
-                id VARCHAR,
-                title VARCHAR,
-                journal VARCHAR,
-                published_date TIMESTAMP,
-                relevance_score DOUBLE,
-                summary VARCHAR,
-                processed_date TIMESTAMP
-            )
-        """)
-        
-        # Convert articles to tuples for batch insert
-        values = [
-            (
-                self._generate_article_id(article),
-                article['title'],
-                article.get('journal', ''),
-                article['published_date'],
-                float(article.get('relevance_score', 0.0)),
-                article.get('llm_summary', ''),
-                datetime.now().isoformat()
+        await self.db.run_write(self._merge_articles, articles)
+
+    def _merge_articles(self, cursor: duckdb.DuckDBPyConnection, articles: List[Dict]) -> None:
+        self._merge_frame(cursor, pd.DataFrame({
+            'id': [self._generate_article_id(article) for article in articles],
+            'title': [article['title'] for article in articles],
+            'journal': [article.get('journal', '') for article in articles],
+            'published_date': [article['published_date'] for article in articles],
+            'relevance_score': [float(article.get('relevance_score', 0.0)) for article in articles],
+            'summary': [article.get('llm_summary', '') for article in articles],
+            'url': [article.get('url') for article in articles],
+            'doi': [article_doi(article) for article in articles],
+            'llm_relevance': [article.get('llm_relevance') for article in articles],
+            'abstract': [article.get('abstract') for article in articles],
+        }))
+
+    async def update_frame(self, frame: pd.DataFrame) -> None:
+        """
+        Bulk upsert a DataFrame of articles in one transaction
+
+        The frame is registered with DuckDB as a view (no copy) and merged
+        with a single INSERT OR REPLACE on the writer thread's cursor.
+
+        Args:
+            frame: Columns id, title, journal, published_date (ISO strings
+                or datetimes), relevance_score and summary; url, doi,
+                llm_relevance, abstract and processed_date are optional
+        """
+        if not frame.empty:
+            await self.db.run_write(self._merge_frame, frame)
+
+    def _merge_frame(self, cursor: duckdb.DuckDBPyConnection, frame: pd.DataFrame) -> None:
+        frame = frame.drop_duplicates('id', keep='last').reset_index(drop=True)
+        frame['published_date'] = pd.to_datetime(
+            frame['published_date'], utc=True, errors='coerce', format='ISO8601'
+        ).dt.tz_localize(None)
+        if 'processed_date' not in frame:
+            frame['processed_date'] = pd.Timestamp.now()
+        for column in ('url', 'doi', 'llm_relevance', 'abstract'):
+            if column not in frame:
+                frame[column] = None
+
+        cursor.register('article_batch', frame)
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            try:
+                cursor.execute(f"""
+                    INSERT OR REPLACE INTO articles
+                    SELECT {', '.join(ARTICLE_COLUMNS)} FROM article_batch
+                """)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        finally:
+            cursor.unregister('article_batch')
+
+        if self.vector_index is not None:
+            self.vector_index.add(
+                list(frame['id']),
+                list(frame['title'].fillna('') + ' ' + frame['summary'].fillna(''))
             )
-            for article in articles
-        ]
-        
-        # Batch insert into temporary table
-        self.conn.executemany("""
-            INSERT INTO temp_articles 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, values)
-        
-        # Use UPSERT to handle duplicates efficiently
-        self.conn.execute("""
-            INSERT OR REPLACE INTO articles 
-            SELECT * FROM temp_articles
-        """)
-        
-        # Cleanup temporary table
-        self.conn.execute("DROP TABLE temp_articles")
     
     def _generate_article_id(self, article: Dict) -> str:
-        """Generate a unique ID for the article"""
-        unique_string = f"{article['title']}-{article['published_date']}"
-        return str(hash(unique_string))
+        """Generate a stable ID for the article (DOI, then URL, then title and date)"""
+        return content_id(article)
     
     async def get_relevant_context(self, 
                                  n_results: int = 5,
-                                 days_back: int = 14) -> List[Dict]:
-        """Get recent relevant articles using efficient date filtering"""
-        cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
+                                 days_back: int = 14,
+                                 query: Optional[str] = None) -> List[Dict]:
+        """
+        Get historical articles for newsletter context
+
+        With a query and a vector index, returns the stored articles whose
+        title and summary are most similar to it across the full history.
+        Otherwise returns the highest-scored articles from the last days_back days.
+        """
+        return await self.db.run(self._relevant_context, n_results, days_back, query)
+
+    def _relevant_context(self,
+                          cursor: duckdb.DuckDBPyConnection,
+                          n_results: int,
+                          days_back: int,
+                          query: Optional[str]) -> List[Dict]:
+        columns = HISTORY_COLUMNS
+        if query and self.vector_index is not None:
+            # Over-fetch since ids removed by cleanup_old_entries stay in the index
+            matches = self.vector_index.search(query, k=n_results * 4)
+            if not matches:
+                return []
+            rows = cursor.execute(f"""
+                SELECT {', '.join(columns)}
+                FROM article_history WHERE list_contains(?::VARCHAR[], id)
+            """, [[article_id for article_id, _ in matches]]).fetchall()
+            by_id = {row[0]: dict(zip(columns, row)) for row in rows}
+            results = []
+            for article_id, similarity in matches:
+                if article_id in by_id:
+                    results.append({**by_id[article_id], 'similarity': similarity})
+            return results[:n_results]
+
+        cutoff_date = datetime.now() - timedelta(days=days_back)
         
-        # Use parameterized query for safety and efficiency
-        result = self.conn.execute("""
-            SELECT *
-            FROM articles 
+        # Use parameterized query for safety and efficiency; the year/month
+        # predicate prunes archive partitions before the date filter runs
+        result = cursor.execute(f"""
+            SELECT {', '.join(columns)}
+            FROM article_history 
             WHERE published_date >= ?
+                AND (year > ? OR (year = ? AND month >= ?))
                 AND relevance_score IS NOT NULL  -- Optimization for NULL handling
             ORDER BY relevance_score DESC
             LIMIT ?
-        """, [cutoff_date, n_results]).fetchall()
+        """, [cutoff_date, cutoff_date.year, cutoff_date.year, cutoff_date.month,
+              n_results]).fetchall()
         
         # Convert to list of dicts
-        columns = ['id', 'title', 'journal', 'published_date', 
-                  'relevance_score', 'summary', 'processed_date']
         return [dict(zip(columns, row)) for row in result]
     
     async def cleanup_old_entries(self, days: int = 90) -> None:
         """Remove entries older than specified days using efficient batch delete"""
-        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+        cutoff_date = datetime.now() - timedelta(days=days)
         
-        self.conn.execute("""
+        await self.db.execute("""
             DELETE FROM articles 
             WHERE processed_date < ?
         """, [cutoff_date])
     
-    def __del__(self):
-        """Ensure connection is closed properly"""
-        if hasattr(self, 'conn'):
-            try:
-                self.conn.close()
-            except:
-                pass  # Ignore errors during cleanup
\ No newline at end of file
+    async def archive_old_entries(self, days: int = 90) -> int:
+        """
+        Move rows processed more than `days` ago into the Parquet archive
+
+        Rows are written under archive_path/year=YYYY/month=M/ by
+        publication date and then deleted from the hot table, in one
+        transaction. They remain queryable through get_relevant_context.
+
+        Returns:
+            Number of rows archived
+        """
+        if self.archive_path is None:
+            raise ValueError("MemoryManager was created without an archive_path")
+        return await self.db.run_write(self._archive, days)
+
+    def _archive(self, cursor: duckdb.DuckDBPyConnection, days: int) -> int:
+        cutoff_date = datetime.now() - timedelta(days=days)
+        count = cursor.execute("""
+            SELECT COUNT(*) FROM articles WHERE processed_date < ?
+        """, [cutoff_date]).fetchone()[0]
+        if not count:
+            return 0
+
+        os.makedirs(self.archive_path, exist_ok=True)
+        # COPY does not take bound parameters; both values are generated here
+        cutoff_literal = cutoff_date.strftime('%Y-%m-%d %H:%M:%S.%f')
+        target = self.archive_path.replace("'", "''")
+        cursor.execute("BEGIN TRANSACTION")
+        try:
+            cursor.execute(f"""
+                COPY (
+                    SELECT {', '.join(ARTICLE_COLUMNS)},
+                           year(COALESCE(published_date, processed_date)) AS year,
+                           month(COALESCE(published_date, processed_date)) AS month
+                    FROM articles
+                    WHERE processed_date < TIMESTAMP '{cutoff_literal}'
+                ) TO '{target}' (
+                    FORMAT PARQUET,
+                    PARTITION_BY (year, month),
+                    OVERWRITE_OR_IGNORE,
+                    FILENAME_PATTERN 'articles_{{uuid}}'
+                )
+            """)
+            cursor.execute("""
+                DELETE FROM articles WHERE processed_date < ?
+            """, [cutoff_date])
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        self._refresh_history_view(cursor)
+        return count
+
+    def close(self) -> None:
+        """Finish queued queries, then close the cursors and the connection"""
+        self.db.close()
+        self.conn.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,205 @@
+from typing import Dict, List, Optional, Set, Tuple
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime
+import duckdb
+import numpy as np
+from components.article_id import content_id
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+# Mersenne prime above the 32-bit shingle hashes, as in standard MinHash
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """Word n-grams of lower-cased alphanumeric text"""
+    words = WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+class NearDuplicateIndex:
+    def __init__(self,
+                 db_path: str = "data/near_duplicates.ddb",
+                 num_perm: int = 128,
+                 bands: int = 32,
+                 threshold: float = 0.8,
+                 seed: int = 1):
+        """
+        Persistent MinHash-LSH index clustering near-duplicate articles
+
+        Title and abstract are reduced to word-shingle MinHash signatures.
+        Each signature is split into bands whose hashes are stored as
+        buckets, so finding candidates is an indexed lookup instead of a scan
+        of the archive. Candidates are confirmed by estimated Jaccard
+        similarity.
+
+        Args:
+            db_path: DuckDB file holding signatures and band buckets
+            num_perm: MinHash permutations per signature
+            bands: LSH bands; num_perm must divide evenly into them
+            threshold: Estimated Jaccard similarity for a near-duplicate
+            seed: Seed for the permutations; must not change once stored
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self.conn = duckdb.connect(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize DuckDB signature and bucket tables"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS minhash_signatures (
+                id VARCHAR PRIMARY KEY,
+                cluster_id VARCHAR,
+                signature BLOB,
+                first_seen TIMESTAMP
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                bucket BIGINT,
+                id VARCHAR
+            )
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS lsh_bucket_idx ON lsh_buckets (bucket)
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key VARCHAR PRIMARY KEY,
+                value VARCHAR
+            )
+        """)
+        self._reset_legacy_ids()
+
+    def _reset_legacy_ids(self) -> None:
+        """
+        Clear signatures stored under the old raw-URL key, once
+
+        The index holds no DOI, URL or title to re-key them by content_id
+        with, and keeping them would make each article seen before look
+        like a near-duplicate of its own old entry.
+        """
+        scheme = self.conn.execute(
+            "SELECT value FROM index_meta WHERE key = 'id_scheme'"
+        ).fetchone()
+        if scheme is not None:
+            return
+        stored = self.conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0]
+        if stored:
+            self.logger.warning(f"Rebuilding near-duplicate index: dropping {stored} signatures keyed by URL")
+            self.conn.execute("DELETE FROM lsh_buckets")
+            self.conn.execute("DELETE FROM minhash_signatures")
+        self.conn.execute("INSERT INTO index_meta VALUES ('id_scheme', 'content_id')")
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of the text's shingles, or None if it has none"""
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=4).digest(), 'little')
+             for gram in grams),
+            dtype=np.uint64, count=len(grams)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_buckets(self, signature: np.ndarray) -> List[int]:
+        """One 64-bit bucket per band; the band number is part of the hash"""
+        return [
+            int.from_bytes(
+                hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(),
+                                digest_size=8, salt=band.to_bytes(2, 'little')).digest(),
+                'little', signed=True)
+            for band in range(self.bands)
+        ]
+
+    def _find_cluster(self, signature: np.ndarray, buckets: List[int]) -> Optional[str]:
+        """Cluster of the most similar stored signature above the threshold"""
+        candidates = self.conn.execute(f"""
+            SELECT id, cluster_id, signature
+            FROM minhash_signatures
+            WHERE id IN (
+                SELECT id FROM lsh_buckets
+                WHERE bucket IN ({', '.join('?' * len(buckets))})
+            )
+        """, buckets).fetchall()
+
+        best_cluster, best_similarity = None, self.threshold
+        for _, cluster_id, stored in candidates:
+            similarity = float(np.mean(np.frombuffer(stored, dtype=np.uint32) == signature))
+            if similarity >= best_similarity:
+                best_cluster, best_similarity = cluster_id, similarity
+        return best_cluster
+
+    def deduplicate(self, articles: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Assign articles to near-duplicate clusters and drop repeats
+
+        An article is kept when it is the first member of its cluster,
+        whether that was in this batch or an earlier run; the rest are
+        returned separately with duplicate_of set to the cluster id.
+
+        Returns:
+            Tuple of (unique articles, duplicate articles)
+        """
+        if not articles:
+            return [], []
+
+        keys = [content_id(article) for article in articles]
+        known = dict(self.conn.execute("""
+            SELECT id, cluster_id FROM minhash_signatures
+            WHERE list_contains(?::VARCHAR[], id)
+        """, [sorted(set(keys))]).fetchall())
+
+        unique, duplicates = [], []
+        kept: Set[str] = set()
+        now = datetime.now()
+        for article, key in zip(articles, keys):
+            cluster_id = known.get(key)
+            if cluster_id is None:
+                signature = self.signature(f"{article.get('title') or ''} {article.get('abstract') or ''}")
+                if signature is None:
+                    unique.append(article)
+                    continue
+                buckets = self._band_buckets(signature)
+                cluster_id = self._find_cluster(signature, buckets) or key
+                self.conn.execute("""
+                    INSERT INTO minhash_signatures VALUES (?, ?, ?, ?)
+                """, [key, cluster_id, signature.tobytes(), now])
+                self.conn.executemany("""
+                    INSERT INTO lsh_buckets VALUES (?, ?)
+                """, [[bucket, key] for bucket in buckets])
+                known[key] = cluster_id
+
+            if cluster_id == key and key not in kept:
+                # A later copy with the same content_id in this batch is a duplicate
+                kept.add(key)
+                unique.append(article)
+            else:
+                duplicates.append({**article, 'duplicate_of': cluster_id})
+
+        if duplicates:
+            self.logger.info(f"Dropped {len(duplicates)} near-duplicate articles")
+        return unique, duplicates
+
+    def close(self) -> None:
+        """Close the underlying DuckDB connection"""
+        self.conn.close()
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Optional
+import logging
+
+class NewsletterComposer:
+    def __init__(self, n_featured: int = 5, n_other: int = 15):
+        """
+        Arrange scored articles into the sections of the email template
+
+        Args:
+            n_featured: Articles shown with their summaries
+            n_other: Further articles listed by title
+        """
+        self.logger = logging.getLogger(__name__)
+        self.n_featured = n_featured
+        self.n_other = n_other
+
+    @staticmethod
+    def _entry(article: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'title': article.get('title', ''),
+            'journal': article.get('journal', ''),
+            'url': article.get('url', ''),
+            'summary': article.get('llm_summary') or article.get('abstract') or article.get('summary', ''),
+        }
+
+    def compose(self,
+                scored_articles: List[Dict[str, Any]],
+                historical_context: Optional[List[Dict[str, Any]]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Build the newsletter content passed to EmailSender.send
+
+        Args:
+            scored_articles: Articles with a relevance_score
+            historical_context: Related stored articles from MemoryManager
+
+        Returns:
+            Dict with 'featured_articles', 'other_articles' and 'related_articles'
+        """
+        ranked = sorted(scored_articles, key=lambda a: a.get('relevance_score', 0), reverse=True)
+        featured = ranked[:self.n_featured]
+        other = ranked[self.n_featured:self.n_featured + self.n_other]
+        shown = {article.get('url') for article in featured + other}
+        related = [entry for entry in (historical_context or []) if entry.get('url') not in shown]
+        self.logger.info(f"Composed newsletter with {len(featured)} featured and {len(other)} other articles")
+        return {
+            'featured_articles': [self._entry(article) for article in featured],
+            'other_articles': [self._entry(article) for article in other],
+            'related_articles': [self._entry(entry) for entry in related],
+        }
@@ -0,0 +1,163 @@
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+BatchFn = Callable[[List[Any]], Awaitable[List[Any]]]
+
+_DONE = object()
+
+class PipelineError(Exception):
+    """Raised by Pipeline.run when any batch failed; carries the items that made it through"""
+
+    def __init__(self, message: str, results: List[Any]):
+        super().__init__(message)
+        self.results = results
+
+class PipelineStage:
+    """One step of a Pipeline: a batch coroutine run by one or more workers"""
+
+    def __init__(self, name: str, fn: BatchFn, workers: int = 1,
+                 batch_size: int = 1, batch_timeout: float = 0.5):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.items_in = 0
+        self.items_out = 0
+        self.busy_seconds = 0.0
+        self.errors = 0
+
+class Pipeline:
+    def __init__(self, maxsize: int = 100):
+        """
+        Chain of async stages connected by bounded queues
+
+        Each stage pulls batches from its inbox as soon as items arrive, so
+        downstream stages start while upstream ones are still producing.
+        Queues hold at most maxsize items, and a full queue blocks its
+        producer, which keeps memory bounded however large the run is.
+
+        Args:
+            maxsize: Capacity of each inter-stage queue
+        """
+        self.logger = logging.getLogger(__name__)
+        self.maxsize = maxsize
+        self.stages: List[PipelineStage] = []
+
+    def add_stage(self, name: str, fn: BatchFn, workers: int = 1,
+                  batch_size: int = 1, batch_timeout: float = 0.5) -> 'Pipeline':
+        """
+        Append a stage
+
+        Args:
+            name: Label used in logs and stats
+            fn: Coroutine taking a batch and returning the items to pass on
+            workers: Batches this stage processes concurrently
+            batch_size: Most items handed to fn at once
+            batch_timeout: Longest wait to fill a batch once it has one item
+        """
+        self.stages.append(PipelineStage(name, fn, workers, batch_size, batch_timeout))
+        return self
+
+    async def _next_batch(self, inbox: asyncio.Queue, stage: PipelineStage) -> Optional[List[Any]]:
+        """Up to batch_size items, or None once the inbox is exhausted"""
+        item = await inbox.get()
+        if item is _DONE:
+            await inbox.put(_DONE)  # let sibling workers see the end too
+            return None
+        batch = [item]
+        deadline = time.monotonic() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            try:
+                item = await asyncio.wait_for(inbox.get(), max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                break
+            if item is _DONE:
+                await inbox.put(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    async def _worker(self, stage: PipelineStage, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        while True:
+            batch = await self._next_batch(inbox, stage)
+            if batch is None:
+                return
+            stage.items_in += len(batch)
+            start = time.perf_counter()
+            try:
+                results = await stage.fn(batch)
+            except Exception as e:
+                # One failed batch should not stall the stages around it;
+                # run() reports the failure once everything has drained
+                stage.errors += 1
+                self.logger.error(f"Pipeline stage {stage.name} failed on {len(batch)} items: {str(e)}")
+                continue
+            finally:
+                stage.busy_seconds += time.perf_counter() - start
+            for result in results:
+                await outbox.put(result)
+            stage.items_out += len(results)
+
+    async def _run_stage(self, stage: PipelineStage, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        try:
+            await asyncio.gather(*[self._worker(stage, inbox, outbox) for _ in range(stage.workers)])
+        finally:
+            await outbox.put(_DONE)
+
+    async def _feed(self, source: AsyncIterable[Any], outbox: asyncio.Queue) -> None:
+        try:
+            async for item in source:
+                await outbox.put(item)
+        finally:
+            await outbox.put(_DONE)
+
+    async def run(self, source: AsyncIterable[Any]) -> List[Any]:
+        """
+        Push every item from source through the stages
+
+        A failed batch does not stop the other batches, but its items are
+        lost, so the run is reported as failed once all stages drain.
+
+        Returns:
+            Items emitted by the last stage, in completion order
+
+        Raises:
+            PipelineError: If any batch failed in any stage
+        """
+        queues = [asyncio.Queue(maxsize=self.maxsize) for _ in range(len(self.stages) + 1)]
+        tasks = [asyncio.create_task(self._feed(source, queues[0]))]
+        for stage, inbox, outbox in zip(self.stages, queues, queues[1:]):
+            tasks.append(asyncio.create_task(self._run_stage(stage, inbox, outbox)))
+
+        results = []
+        try:
+            while True:
+                item = await queues[-1].get()
+                if item is _DONE:
+                    break
+                results.append(item)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        failed = {stage.name: stage.errors for stage in self.stages if stage.errors}
+        if failed:
+            raise PipelineError(f"Pipeline batches failed: {failed}", results)
+        return results
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage item counts, failed batches and busy time"""
+        return {
+            stage.name: {
+                'items_in': stage.items_in,
+                'items_out': stage.items_out,
+                'errors': stage.errors,
+                'busy_seconds': round(stage.busy_seconds, 3),
+            }
+            for stage in self.stages
+        }
@@ -0,0 +1,139 @@
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import logging
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from components.relevance_scorer import RelevanceScorer
+
+class RelevanceCascade:
+    def __init__(self,
+                 keyword_scorer: Optional[RelevanceScorer] = None,
+                 keyword_threshold: float = 0.0,
+                 model_threshold: float = 0.2,
+                 label_threshold: float = 0.5,
+                 min_training_rows: int = 50,
+                 llm_cost_per_article: float = 0.03):
+        """
+        Cheap local filters that decide which articles reach the LLM
+
+        Tier 1: keyword score above keyword_threshold sends an article
+        straight to the LLM. Tier 2: otherwise a TF-IDF + logistic model
+        trained on past LLM scores must rate it at least model_threshold.
+        Until enough history exists to train, tier 2 lets everything through.
+
+        Args:
+            keyword_scorer: Keyword scorer used for tier 1
+            keyword_threshold: Keyword score an article must exceed to skip tier 2
+            model_threshold: Minimum predicted probability of relevance
+            label_threshold: LLM score treated as relevant when training
+            min_training_rows: History needed before the model is trusted
+            llm_cost_per_article: Estimated LLM spend per article, for reporting
+        """
+        self.logger = logging.getLogger(__name__)
+        self.keyword_scorer = keyword_scorer or RelevanceScorer()
+        self.keyword_threshold = keyword_threshold
+        self.model_threshold = model_threshold
+        self.label_threshold = label_threshold
+        self.min_training_rows = min_training_rows
+        self.llm_cost_per_article = llm_cost_per_article
+        self.model: Optional[Pipeline] = None
+
+    @staticmethod
+    def _text(article: Dict[str, Any]) -> str:
+        return f"{article.get('title') or ''} {article.get('abstract') or ''}"
+
+    def fit(self, texts: Sequence[str], scores: Sequence[float]) -> bool:
+        """
+        Train the tier-2 model on texts labelled by past LLM scores
+
+        Returns:
+            True if a model was trained, False if history was insufficient
+        """
+        labels = np.asarray(scores, dtype=float) >= self.label_threshold
+        if len(texts) < self.min_training_rows or labels.all() or not labels.any():
+            self.logger.info(f"Not enough labelled history to train pre-filter ({len(texts)} rows)")
+            self.model = None
+            return False
+
+        self.model = Pipeline([
+            ('tfidf', TfidfVectorizer(ngram_range=(1, 2), min_df=2, sublinear_tf=True,
+                                      stop_words='english')),
+            ('classifier', LogisticRegression(class_weight='balanced', max_iter=1000))
+        ])
+        self.model.fit(list(texts), labels)
+        self.logger.info(f"Trained pre-filter on {len(texts)} articles ({int(labels.sum())} relevant)")
+        return True
+
+    def fit_from_db(self, conn) -> bool:
+        """
+        Train on the LLM scores stored in the articles table
+
+        Uses the same title + abstract text that filter() scores, and the
+        llm_relevance column rather than the final keyword-boosted score.
+        """
+        rows = conn.execute("""
+            SELECT title, abstract, llm_relevance
+            FROM articles
+            WHERE llm_relevance IS NOT NULL
+                AND abstract IS NOT NULL AND abstract != ''
+        """).fetchall()
+        return self.fit([self._text({'title': title, 'abstract': abstract}) for title, abstract, _ in rows],
+                        [score for _, _, score in rows])
+
+    def filter(self, articles: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict], Dict[str, Any]]:
+        """
+        Run articles through the cascade
+
+        Returns:
+            Tuple of (articles for the LLM, rejected articles, report with
+            per-tier counts and estimated spend saved). Rejected articles
+            carry a zero relevance_score and their prefilter_score.
+        """
+        report = {
+            'total': len(articles),
+            'keyword_passed': 0,
+            'model_passed': 0,
+            'model_rejected': 0,
+            'model_trained': self.model is not None,
+        }
+        if not articles:
+            report.update({'sent_to_llm': 0, 'estimated_savings': 0.0})
+            return [], [], report
+
+        keyword_scores = self.keyword_scorer.scores(articles)
+        passed, rejected, undecided = [], [], []
+        for article, keyword_score in zip(articles, keyword_scores):
+            if keyword_score > self.keyword_threshold:
+                passed.append(article)
+            else:
+                undecided.append(article)
+        report['keyword_passed'] = len(passed)
+
+        if undecided and self.model is not None:
+            probabilities = self.model.predict_proba([self._text(a) for a in undecided])[:, 1]
+            for article, probability in zip(undecided, probabilities):
+                if probability >= self.model_threshold:
+                    passed.append(article)
+                    report['model_passed'] += 1
+                else:
+                    rejected.append({
+                        **article,
+                        'prefilter_score': float(probability),
+                        'relevance_score': 0.0,
+                        'key_topics': [],
+                        'relevance_reasoning': 'Filtered out before LLM processing'
+                    })
+                    report['model_rejected'] += 1
+        else:
+            passed.extend(undecided)
+            report['model_passed'] = len(undecided)
+
+        report['sent_to_llm'] = len(passed)
+        report['estimated_savings'] = round(len(rejected) * self.llm_cost_per_article, 2)
+        self.logger.info(
+            f"Pre-filter: {report['keyword_passed']} keyword matches, "
+            f"{report['model_passed']} passed model, {report['model_rejected']} rejected; "
+            f"~${report['estimated_savings']:.2f} LLM spend saved"
+        )
+        return passed, rejected, report
@@ -1,144 +1,384 @@
-from typing import List, Dict, Optional, Any, Union
-import feedparser
-import requests
+from typing import List, Dict, Optional, Any, AsyncIterator, NamedTuple
+import asyncio
+import csv
+import hashlib
 import logging
-from datetime import datetime
+import time
+import xml.etree.ElementTree as ET
 from urllib.parse import urlparse
-import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
-import pandas as pd
 from feedparser.util import FeedParserDict
+from components.feed_cache import FeedCache
+from components.fetch_engine import FetchEngine
+from components.feed_stream import StreamingFeedParser
+from components.parse_executor import ParseStage, clean_abstracts, parse_journal_feed, standardize_entry
+
+# Sent with every feed request; some publishers reject requests without them
+FEED_HEADERS = {
+    'Accept': 'application/rss+xml,application/atom+xml,application/xml;q=0.9,text/html;q=0.8,*/*;q=0.5',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'DNT': '1',
+}
+
+class FeedTiming(NamedTuple):
+    """How one feed fared in the last fetch"""
+    name: str
+    url: str
+    status: str  # 'ok', 'not_modified', 'unchanged' or 'error'
+    articles: int
+    fetch_seconds: float
+    parse_seconds: float
+
+    @property
+    def seconds(self) -> float:
+        return self.fetch_seconds + self.parse_seconds
+
+def load_journals(csv_file: str) -> List[Dict[str, str]]:
+    """Rows of journals.csv: 'Journal Name', 'RSS URL' and 'Format'"""
+    logger = logging.getLogger(__name__)
+    try:
+        with open(csv_file, 'r', newline='') as file:
+            journals = [row for row in csv.DictReader(file) if row.get('RSS URL')]
+    except FileNotFoundError:
+        logger.error(f"CSV file not found: {csv_file}")
+        return []
+    except csv.Error as e:
+        logger.error(f"Error reading CSV file: {e}")
+        return []
+    if journals:
+        logger.info(f"Successfully loaded {len(journals)} journals from {csv_file}")
+    else:
+        logger.warning(f"No journals loaded from {csv_file}")
+    return journals
 
 class RSSFeedFetcher:
-    def __init__(self, timeout: int = 30):
-        """Initialize RSS feed fetcher with configurable timeout"""
+    def __init__(self,
+                 csv_file: Optional[str] = 'journals.csv',
+                 timeout: int = 30,
+                 cache: Optional[FeedCache] = None,
+                 engine: Optional[FetchEngine] = None,
+                 streaming: bool = False,
+                 chunk_size: int = 16384,
+                 parse_stage: Optional[ParseStage] = None):
+        """
+        Fetch journal feeds through one async engine
+
+        Journals from csv_file are parsed with the format parser named in
+        their Format column; bare URLs passed to fetch_all use the generic
+        parser. fetch_all_sync and fetch_journal wrap the async API for
+        scripts.
+
+        Args:
+            csv_file: Journal list; None starts with no journals
+            timeout: Request timeout in seconds
+            cache: Optional validator store used for conditional GETs
+            engine: Shared fetch engine; one is created if not provided
+            streaming: Parse format-less feeds incrementally from the response stream
+            chunk_size: Bytes read per chunk in streaming mode
+            parse_stage: Executor stage for parsing and HTML cleaning;
+                defaults to a process pool sized to the number of cores
+        """
         self.logger = logging.getLogger(__name__)
+        self.journals = load_journals(csv_file) if csv_file else []
         self.timeout = timeout
-        
-    async def fetch_all(self, feed_urls: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        self.cache = cache
+        self.engine = engine or FetchEngine(timeout=timeout)
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.parse_stage = parse_stage or ParseStage()
+        self._owns_parse_stage = parse_stage is None
+        self.feed_timings: Dict[str, FeedTiming] = {}
+
+    @staticmethod
+    def _targets(feed_urls: Optional[List[str]], journals: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        if feed_urls is None:
+            return journals
+        return [{'Journal Name': url, 'RSS URL': url, 'Format': ''} for url in feed_urls]
+
+    async def fetch_all(self,
+                        feed_urls: Optional[List[str]] = None,
+                        max_articles: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch multiple RSS feeds concurrently
-        
+
+        Concurrency is bounded globally and per host by the fetch engine,
+        so wall-clock time tracks the slowest host rather than the sum
+        of all feeds. A feed that fails is logged and skipped.
+
         Args:
-            feed_urls: List of RSS feed URLs. If None, uses configured feeds.
-            
+            feed_urls: RSS feed URLs. If None, uses the journals from the CSV.
+            max_articles: Per-feed article cap
+
         Returns:
             List of standardized article dictionaries
         """
-        if not feed_urls:
+        targets = self._targets(feed_urls, self.journals)
+        if not targets:
             self.logger.warning("No feed URLs provided")
             return []
-            
-        async with aiohttp.ClientSession() as session:
-            tasks = [self.fetch_single(url, session) for url in feed_urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-        # Flatten results and filter out errors
-        articles = []
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Failed to fetch feed: {str(result)}")
-                continue
-            if isinstance(result, list):  # Type guard
-                articles.extend(result)
-            
+
+        if self.streaming:
+            return [article async for article in self.stream_all(feed_urls, max_articles)]
+
+        owns_session = not self.engine.is_open
+        if owns_session:
+            await self.engine.open()
+        try:
+            results = await asyncio.gather(
+                *[self.fetch_journal_async(journal, self.engine, max_articles) for journal in targets]
+            )
+        finally:
+            if owns_session:
+                await self.engine.close()
+
+        articles = [article for feed_articles in results for article in feed_articles]
+        self.logger.info(f"Fetched a total of {len(articles)} articles from {len(targets)} feeds")
+        self._log_slowest()
         return articles
-    
-    async def fetch_single(self, url: str, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
+
+    async def fetch_journal_async(self,
+                                  journal: Dict[str, str],
+                                  engine: FetchEngine,
+                                  max_articles: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Fetch one journal, logging and returning [] on failure"""
+        try:
+            return await self.fetch_feed(journal, engine, max_articles)
+        except FetchError as e:
+            self.logger.error(f"Failed to fetch {journal['Journal Name']}: {str(e)}")
+            return []
+
+    async def fetch_single(self, url: str, engine: FetchEngine) -> List[Dict[str, Any]]:
+        """Fetch and parse one feed URL with the generic parser; raises FetchError"""
+        return await self.fetch_feed(self._targets([url], [])[0], engine)
+
+    async def fetch_feed(self,
+                         journal: Dict[str, str],
+                         engine: FetchEngine,
+                         max_articles: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Fetch and parse a single RSS feed
-        
+        Fetch and parse a single feed, recording its timing
+
         Args:
-            url: RSS feed URL
-            session: Aiohttp session for making requests
-            
+            journal: Row with 'Journal Name', 'RSS URL' and optional 'Format'
+            engine: Fetch engine used for the request
+            max_articles: Stop parsing after this many articles
+
         Returns:
-            List of article dictionaries from this feed
-        
+            List of article dictionaries from this feed. Empty when the
+            feed is unchanged since the last fetch (304 or identical body).
+
         Raises:
-            ValueError: If URL is invalid
+            FetchError: If the URL is invalid
             RequestError: If feed cannot be fetched
             ParseError: If feed cannot be parsed
         """
+        name, url = journal['Journal Name'], journal['RSS URL']
+        parsed = urlparse(url)
+        if not all([parsed.scheme, parsed.netloc]):
+            raise FetchError(f"Invalid URL: {url}")
+
+        start = time.perf_counter()
+        fetch_seconds = parse_seconds = 0.0
+        status, articles = 'error', []
         try:
-            # Validate URL
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
-                raise ValueError(f"Invalid URL: {url}")
-            
-            # Fetch feed content
-            async with session.get(url, timeout=self.timeout) as response:
-                response.raise_for_status()
-                content = await response.text()
-            
-            # Parse feed
-            feed = feedparser.parse(content)
-            if feed.bozo:  # feedparser's error flag
-                raise ParseError(f"Feed parsing error: {feed.bozo_exception}")
-            
-            # Extract and standardize articles
-            articles = []
-            for entry in feed.entries:
-                try:
-                    article = self._standardize_entry(entry, feed.feed)
-                    articles.append(article)
-                except Exception as e:
-                    self.logger.warning(f"Failed to process entry: {str(e)}")
-                    continue
-                    
+            # Fetch feed content, conditionally if validators are cached
+            headers = dict(FEED_HEADERS)
+            if self.cache:
+                headers.update(self.cache.conditional_headers(url))
+            try:
+                response = await engine.fetch(url, headers=headers)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 403:
+                    raise RequestError(f"Access forbidden for {url}")
+                raise RequestError(f"Failed to fetch feed {url}: {str(e)}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise RequestError(f"Failed to fetch feed {url}: {str(e) or type(e).__name__}")
+            fetch_seconds = time.perf_counter() - start
+
+            if response.status == 304:
+                self.logger.info(f"Feed not modified: {name}")
+                if self.cache:
+                    self.cache.touch(url)
+                status = 'not_modified'
+                return []
+            content = response.body
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+            # Skip parsing entirely if the body is byte-identical to last time
+            if self.cache and self.cache.is_unchanged(url, content):
+                self.logger.info(f"Feed content unchanged: {name}")
+                self.cache.store(url, etag, last_modified, content)
+                status = 'unchanged'
+                return []
+
+            # Parse and clean off the event loop so other fetches keep flowing
+            parse_start = time.perf_counter()
+            articles, error = await self.parse_stage.run(
+                parse_journal_feed, content, journal.get('Format') or None, name, max_articles
+            )
+            parse_seconds = time.perf_counter() - parse_start
+            if error:
+                raise ParseError(f"{name}: {error}")
+
+            if self.cache:
+                self.cache.store(url, etag, last_modified, content)
+            status = 'ok'
             return articles
-            
-        except aiohttp.ClientError as e:
-            raise RequestError(f"Failed to fetch feed {url}: {str(e)}")
-        except Exception as e:
-            raise FetchError(f"Unexpected error fetching {url}: {str(e)}")
-    
-    def _standardize_entry(self, entry: FeedParserDict, feed_info: FeedParserDict) -> Dict[str, Any]:
+        finally:
+            self.feed_timings[name] = FeedTiming(name, url, status, len(articles),
+                                                 fetch_seconds, parse_seconds)
+
+    async def stream_all(self,
+                         feed_urls: Optional[List[str]] = None,
+                         max_articles: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
         """
-        Convert feed entry to standardized article format
-        
+        Stream articles from multiple feeds in the order they are parsed
+
         Args:
-            entry: Raw feed entry
-            feed_info: Feed metadata
-            
-        Returns:
-            Standardized article dictionary
+            feed_urls: RSS feed URLs. If None, uses the journals from the CSV.
+            max_articles: Per-feed article cap; stops streamed downloads early
+
+        Yields:
+            Standardized article dictionaries from whichever feed is ready
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        done = object()
+
+        async def pump(journal: Dict[str, str]) -> None:
+            try:
+                if self.streaming and not journal.get('Format'):
+                    async for article in self.stream_single(journal['RSS URL'], self.engine, max_articles):
+                        await queue.put(article)
+                else:
+                    for article in await self.fetch_journal_async(journal, self.engine, max_articles):
+                        await queue.put(article)
+            except FetchError as e:
+                self.logger.error(f"Failed to fetch feed: {str(e)}")
+            finally:
+                await queue.put(done)
+
+        targets = self._targets(feed_urls, self.journals)
+        owns_session = not self.engine.is_open
+        if owns_session:
+            await self.engine.open()
+        tasks = [asyncio.create_task(pump(journal)) for journal in targets]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owns_session:
+                await self.engine.close()
+
+    async def stream_single(self,
+                            url: str,
+                            engine: FetchEngine,
+                            max_articles: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
         """
-        # Extract date with fallbacks
-        published_date = None
-        for date_field in ['published_parsed', 'updated_parsed', 'created_parsed']:
-            if hasattr(entry, date_field):
-                parsed_time = getattr(entry, date_field)
-                if parsed_time:
-                    published_date = datetime(*parsed_time[:6]).isoformat()
-                    break
-        if not published_date:
-            published_date = datetime.now().isoformat()
-            
-        # Extract text content
-        content: str = ''
-        if hasattr(entry, 'content') and entry.content:
-            content = str(entry.content[0].get('value', ''))
-        elif hasattr(entry, 'summary'):
-            content = str(entry.summary)
-        
-        # Clean content
-        if content:
-            soup = BeautifulSoup(str(content), 'html.parser')
-            content = soup.get_text(separator=' ', strip=True)
-        
-        return {
-            'title': getattr(entry, 'title', ''),
-            'journal': getattr(feed_info, 'title', ''),
-            'published_date': published_date,
-            'abstract': content[:1000] if content else '',  # Limit abstract length
-            'url': getattr(entry, 'link', ''),
-            'authors': [
-                getattr(author, 'name', '') 
-                for author in getattr(entry, 'authors', [])
-            ]
-        }
+        Fetch a single RSS feed and yield articles as they are parsed
+
+        The document is fed chunk by chunk to an incremental XML parser,
+        so only one entry is held in memory at a time. Reaching
+        max_articles closes the connection before the rest is downloaded.
+
+        Args:
+            url: RSS feed URL
+            engine: Fetch engine used for the request
+            max_articles: Stop after this many articles
+
+        Yields:
+            Standardized article dictionaries
+
+        Raises:
+            RequestError: If feed cannot be fetched
+            ParseError: If feed cannot be parsed
+        """
+        parsed = urlparse(url)
+        if not all([parsed.scheme, parsed.netloc]):
+            raise FetchError(f"Invalid URL: {url}")
+
+        headers = dict(FEED_HEADERS)
+        if self.cache:
+            headers.update(self.cache.conditional_headers(url))
+        parser = StreamingFeedParser(clean=self.parse_stage.inline)
+        digest = hashlib.sha256()
+        count = 0
+        try:
+            async with engine.stream(url, headers=headers) as response:
+                if response.status == 304:
+                    self.logger.info(f"Feed not modified: {url}")
+                    if self.cache:
+                        self.cache.touch(url)
+                    return
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    digest.update(chunk)
+                    for article in await self._finish_streamed(list(parser.feed(chunk))):
+                        yield article
+                        count += 1
+                        if max_articles is not None and count >= max_articles:
+                            return
+                for article in await self._finish_streamed(list(parser.close())):
+                    yield article
+                    count += 1
+                    if max_articles is not None and count >= max_articles:
+                        return
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        except aiohttp.ClientError as e:
+            raise RequestError(f"Failed to fetch feed {url}: {str(e)}")
+        except ET.ParseError as e:
+            raise ParseError(f"Feed parsing error for {url}: {str(e)}")
+
+        # Only a fully consumed document has a meaningful hash
+        if self.cache:
+            self.cache.store(url, etag, last_modified, content_hash=digest.hexdigest())
+
+    async def _finish_streamed(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Clean a chunk's worth of streamed abstracts in the parse stage"""
+        if not articles or self.parse_stage.inline:
+            return articles
+        return await self.parse_stage.run(clean_abstracts, articles)
+
+    def _standardize_entry(self, entry: FeedParserDict, feed_info: FeedParserDict) -> Dict[str, Any]:
+        """Convert feed entry to standardized article format"""
+        return standardize_entry(entry, feed_info)
+
+    def timing_report(self) -> List[FeedTiming]:
+        """Per-feed timings from the last fetch, slowest first"""
+        return sorted(self.feed_timings.values(), key=lambda timing: timing.seconds, reverse=True)
+
+    def _log_slowest(self, n: int = 5) -> None:
+        for timing in self.timing_report()[:n]:
+            self.logger.info(
+                f"{timing.name}: {timing.status}, {timing.articles} articles, "
+                f"fetch {timing.fetch_seconds:.2f}s, parse {timing.parse_seconds:.2f}s"
+            )
+
+    def fetch_all_sync(self,
+                       feed_urls: Optional[List[str]] = None,
+                       max_articles: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Blocking fetch_all for scripts; must not be called from a running event loop"""
+        return asyncio.run(self.fetch_all(feed_urls, max_articles))
+
+    def fetch_journal(self, journal: Dict[str, str], max_articles: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Blocking fetch of one journal for scripts; returns [] on failure"""
+        async def fetch() -> List[Dict[str, Any]]:
+            async with FetchEngine(timeout=self.timeout) as engine:
+                return await self.fetch_journal_async(journal, engine, max_articles)
+        return asyncio.run(fetch())
+
+    def close(self) -> None:
+        """Shut down the parse worker processes if this fetcher created them"""
+        if self._owns_parse_stage:
+            self.parse_stage.shutdown()
 
 class FetchError(Exception):
     """Base class for feed fetching errors"""
@@ -150,4 +390,4 @@ class RequestError(FetchError):
 
 class ParseError(FetchError):
     """Error occurred while parsing feed"""
-    pass 
\ No newline at end of file
+    pass
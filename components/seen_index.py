@@ -0,0 +1,174 @@
+from typing import List, Dict, Optional, Tuple
+import os
+from datetime import datetime
+import duckdb
+from components.article_id import article_doi, canonical_url, content_id, content_id_from_keys, title_digest
+
+# LLM outputs rehydrated onto articles that were processed in an earlier run
+CACHED_FIELDS = ('llm_summary', 'relevance_score', 'key_topics', 'relevance_reasoning')
+
+class SeenArticleIndex:
+    def __init__(self, db_path: str = "data/seen_articles.ddb"):
+        """Persistent index of articles already sent through the LLM stage"""
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.conn = duckdb.connect(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize DuckDB seen-article table"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                id VARCHAR PRIMARY KEY,
+                doi VARCHAR,
+                url_key VARCHAR,
+                title_key VARCHAR,
+                llm_summary VARCHAR,
+                relevance_score DOUBLE,
+                key_topics VARCHAR[],
+                relevance_reasoning VARCHAR,
+                first_seen TIMESTAMP,
+                last_seen TIMESTAMP
+            )
+        """)
+        self._migrate_ids()
+
+    def _migrate_ids(self) -> None:
+        """
+        One-time re-key of rows stored under the old raw-URL key
+
+        Rows with a DOI or canonical URL are keyed by content_id, and URL
+        variants of one paper collapse to the most recently seen row.
+        Title-only rows keep their key: the index stores a title digest,
+        not the title content_id is built from, and lookups go through
+        the title_key column anyway.
+        """
+        sample = self.conn.execute("""
+            SELECT id, doi, url_key FROM seen_articles
+            WHERE doi IS NOT NULL OR url_key IS NOT NULL
+            LIMIT 1
+        """).fetchone()
+        if sample is None or sample[0] == content_id_from_keys(sample[1], sample[2]):
+            return
+
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info('seen_articles')").fetchall()]
+        rows = self.conn.execute(
+            f"SELECT {', '.join(columns)} FROM seen_articles ORDER BY last_seen"
+        ).fetchall()
+        rekeyed = {}
+        for row in rows:
+            row = dict(zip(columns, row))
+            if row['doi'] or row['url_key']:
+                row['id'] = content_id_from_keys(row['doi'], row['url_key'])
+            earlier = rekeyed.get(row['id'])
+            if earlier is not None:
+                row['first_seen'] = min(earlier['first_seen'], row['first_seen'])
+            rekeyed[row['id']] = row
+
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("DELETE FROM seen_articles")
+            self.conn.executemany(
+                f"INSERT INTO seen_articles VALUES ({', '.join('?' for _ in columns)})",
+                [[row[column] for column in columns] for row in rekeyed.values()]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def lookup_keys(article: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """DOI, canonical URL and normalized title hash for an article"""
+        return (
+            article_doi(article),
+            canonical_url(article.get('url') or article.get('link')),
+            title_digest(article.get('title'))
+        )
+
+    def partition(self, articles: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split articles into unseen ones and previously processed ones
+
+        Articles match on DOI or canonical URL; the title is only used
+        for articles that have neither.
+
+        Returns:
+            Tuple of (new articles, cached articles with LLM fields restored)
+        """
+        if not articles:
+            return [], []
+
+        keys = [self.lookup_keys(article) for article in articles]
+        dois = sorted({doi for doi, _, _ in keys if doi})
+        urls = sorted({url for _, url, _ in keys if url})
+        titles = sorted({title for _, _, title in keys if title})
+
+        rows = self.conn.execute(f"""
+            SELECT doi, url_key, title_key, {', '.join(CACHED_FIELDS)}
+            FROM seen_articles
+            WHERE list_contains(?::VARCHAR[], doi)
+                OR list_contains(?::VARCHAR[], url_key)
+                OR list_contains(?::VARCHAR[], title_key)
+        """, [dois, urls, titles]).fetchall()
+
+        by_doi, by_url, by_title = {}, {}, {}
+        for doi, url_key, title_key, *cached in rows:
+            cached = dict(zip(CACHED_FIELDS, cached))
+            if doi:
+                by_doi[doi] = cached
+            if url_key:
+                by_url[url_key] = cached
+            if title_key:
+                by_title[title_key] = cached
+
+        new_articles, cached_articles = [], []
+        for article, (doi, url, title) in zip(articles, keys):
+            if doi or url:
+                cached = by_doi.get(doi) or by_url.get(url)
+            else:
+                # Titles like "Editorial" repeat across papers; only trust
+                # them for articles with nothing more specific to match on
+                cached = by_title.get(title)
+            if cached is None:
+                new_articles.append(article)
+            else:
+                rehydrated = dict(article)
+                rehydrated.update(cached)
+                rehydrated['key_topics'] = list(cached['key_topics'] or [])
+                cached_articles.append(rehydrated)
+        return new_articles, cached_articles
+
+    def record(self, articles: List[Dict]) -> None:
+        """Remember processed articles; failed LLM results are not cached"""
+        now = datetime.now()
+        values = []
+        for article in articles:
+            if not article.get('llm_summary') or article.get('llm_error'):
+                continue
+            doi, url, title = self.lookup_keys(article)
+            values.append((
+                content_id(article), doi, url, title,
+                article['llm_summary'],
+                float(article.get('relevance_score', 0.0)),
+                list(article.get('key_topics') or []),
+                article.get('relevance_reasoning', ''),
+                now, now
+            ))
+        if not values:
+            return
+
+        self.conn.executemany("""
+            INSERT INTO seen_articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                llm_summary = excluded.llm_summary,
+                relevance_score = excluded.relevance_score,
+                key_topics = excluded.key_topics,
+                relevance_reasoning = excluded.relevance_reasoning,
+                last_seen = excluded.last_seen
+        """, values)
+
+    def close(self) -> None:
+        """Close the underlying DuckDB connection"""
+        self.conn.close()
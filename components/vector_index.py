@@ -0,0 +1,120 @@
+from typing import Dict, List, Sequence, Tuple
+import json
+import logging
+import os
+import threading
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+class VectorIndex:
+    def __init__(self, path: str = "data/vector_store", dim: int = 512):
+        """
+        Persistent cosine-similarity index over article text
+
+        Text is embedded offline with signed feature hashing of word
+        unigrams and bigrams (a random projection of the TF vector), so no
+        model download is needed. Vectors live in a memory-mapped float32
+        matrix that grows by appending rows. add and search may run on
+        different threads, so both hold a lock while touching the matrix.
+
+        Args:
+            path: Directory holding vectors.f32, ids.txt and meta.json
+            dim: Embedding width; fixed once the index has been created
+        """
+        os.makedirs(path, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.vectors_path = os.path.join(path, "vectors.f32")
+        self.ids_path = os.path.join(path, "ids.txt")
+        meta_path = os.path.join(path, "meta.json")
+
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                dim = json.load(f)['dim']
+        else:
+            with open(meta_path, 'w') as f:
+                json.dump({'dim': dim}, f)
+        self.dim = dim
+        self.vectorizer = HashingVectorizer(
+            n_features=dim,
+            ngram_range=(1, 2),
+            stop_words='english',
+            binary=True,
+            norm='l2'
+        )
+
+        ids = []
+        if os.path.exists(self.ids_path):
+            with open(self.ids_path) as f:
+                ids = f.read().splitlines()
+        # A crash between the two appends leaves them uneven; trust the shorter
+        rows = os.path.getsize(self.vectors_path) // (4 * dim) if os.path.exists(self.vectors_path) else 0
+        self.ids: List[str] = ids[:rows]
+        self.positions: Dict[str, int] = {article_id: i for i, article_id in enumerate(self.ids)}
+        self._matrix = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Unit-length float32 embeddings, one row per text"""
+        return self.vectorizer.transform(texts).toarray().astype(np.float32)
+
+    def _vectors(self) -> np.ndarray:
+        if self._matrix is None or len(self._matrix) != len(self.ids):
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode='r+',
+                                     shape=(len(self.ids), self.dim))
+        return self._matrix
+
+    def add(self, ids: Sequence[str], texts: Sequence[str]) -> None:
+        """
+        Embed and store texts; ids already indexed are overwritten in place
+        """
+        if not ids:
+            return
+        vectors = self.embed(texts)
+        with self._lock:
+            new_rows, new_ids = [], []
+            for article_id, vector in zip(ids, vectors):
+                position = self.positions.get(article_id)
+                if position is not None:
+                    self._vectors()[position] = vector
+                elif article_id in new_ids:
+                    new_rows[new_ids.index(article_id)] = vector
+                else:
+                    new_rows.append(vector)
+                    new_ids.append(article_id)
+
+            if self._matrix is not None:
+                self._matrix.flush()
+            if not new_ids:
+                return
+            with open(self.vectors_path, 'ab') as f:
+                f.write(np.asarray(new_rows, dtype=np.float32).tobytes())
+            with open(self.ids_path, 'a') as f:
+                f.write(''.join(f"{article_id}\n" for article_id in new_ids))
+            for article_id in new_ids:
+                self.positions[article_id] = len(self.ids)
+                self.ids.append(article_id)
+            self._matrix = None
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Top-k stored ids by cosine similarity to the query text
+
+        Returns:
+            (id, similarity) pairs, most similar first
+        """
+        if not self.ids or k <= 0:
+            return []
+        query_vector = self.embed([query])[0]
+        if not query_vector.any():
+            return []
+        with self._lock:
+            similarities = self._vectors() @ query_vector
+            ids = self.ids[:len(similarities)]
+        k = min(k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [(ids[i], float(similarities[i])) for i in top]
@@ -5,9 +5,71 @@ from typing import Dict
 LLM_MODEL = "gpt-4"  # or "gpt-3.5-turbo" for faster, cheaper processing
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# HTTP validators and body hashes of fetched feeds, so unchanged feeds are
+# answered with 304 Not Modified or skipped before parsing
+FEED_CACHE_PATH = "data/feed_cache.ddb"
+
+# LLM response cache; unchanged prompts and inputs are served without an API call
+LLM_CACHE_PATH = "data/llm_cache.ddb"
+LLM_CACHE_TTL_DAYS = 30
+LLM_CACHE_MAX_MB = 100
+
+# LLM request scheduling; set to your API tier's limits
+LLM_MAX_IN_FLIGHT = 8
+LLM_REQUESTS_PER_MINUTE = 500
+LLM_TOKENS_PER_MINUTE = 40000
+# Articles packed into one summarize-and-score request; 1 disables batching
+LLM_BATCH_SIZE = 10
+# Summarize and score in one call; False uses the two-call summary-then-relevance chain
+LLM_FUSED_CHAIN = True
+
+# Local pre-filter run before the LLM; articles with no keyword match need a
+# model probability of at least PREFILTER_MODEL_THRESHOLD to be sent on
+PREFILTER_MODEL_THRESHOLD = 0.2
+# Past LLM score (llm_relevance) at or above which an article counts as relevant for training
+PREFILTER_LABEL_THRESHOLD = 0.5
+# Estimated LLM spend per article in USD, used to report pre-filter savings
+LLM_COST_PER_ARTICLE = 0.03
+
+# Overlap fetching, LLM processing and scoring instead of running them one after
+# another. A pipelined run only sees articles fetched in that run, and feeds left
+# unchanged since the last fetch contribute none, so it is off by default
+PIPELINED_RUN = False
+# Items each inter-stage queue holds before its producer waits
+PIPELINE_QUEUE_SIZE = 100
+# Articles handed to process_articles at once, and how many such batches run concurrently
+PIPELINE_BATCH_SIZE = 20
+PIPELINE_LLM_WORKERS = 4
+
+# Per-stage outputs of each run, so `python main.py --resume` restarts from the
+# last completed stage; checkpoints of older runs are pruned after a successful send
+CHECKPOINT_PATH = "data/checkpoints.ddb"
+CHECKPOINT_RETENTION_DAYS = 14
+
+# Daemon mode (`python main.py --daemon`): each feed is polled at half its typical
+# publication gap, clamped to these bounds; newsletters go out on their own schedule
+DAEMON_MIN_POLL_MINUTES = 60
+DAEMON_MAX_POLL_HOURS = 48
+DAEMON_DEFAULT_POLL_HOURS = 6
+DAEMON_RETRY_MINUTES = 15
+NEWSLETTER_INTERVAL_HOURS = 168
+
 # Vector Store Configuration
 VECTOR_STORE_PATH = "data/vector_store"
 
+# Processed articles older than HOT_RETENTION_DAYS move from the DuckDB file
+# to a year/month-partitioned Parquet archive that queries still read
+ARCHIVE_PATH = "data/archive"
+HOT_RETENTION_DAYS = 90
+
+# Index of articles already processed by the LLM, used to skip them on later runs
+SEEN_INDEX_PATH = "data/seen_articles.ddb"
+
+# MinHash-LSH index of title+abstract signatures; articles whose estimated
+# Jaccard similarity to an earlier one reaches the threshold are dropped
+NEAR_DUPLICATE_PATH = "data/near_duplicates.ddb"
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
 # Keywords for relevance scoring
 KEYWORDS = [
     "sedimentology",
@@ -0,0 +1,207 @@
+# feed_profiles.py
+"""
+Declarative feed-format profiles.
+
+A profile describes how to turn a feedparser entry into a StandardArticle
+without writing a parser module. Profiles live in feed_profiles.json next
+to journals.csv and are compiled once into extractor objects; a journal
+uses one by putting the profile name in its Format column.
+
+Field specs accept:
+    from        entry keys tried in order; dotted paths index into lists
+                and dicts (e.g. "content.0.value")
+    clean       strip HTML tags and unescape entities (default true)
+    pattern     regex applied to the value; group 1 (or the whole match)
+                is kept, and a miss yields the default
+    remove      regexes deleted from the value
+    max_length  truncate to this many characters, appending "..."
+    default     fallback value; "{journal_name}" is substituted
+
+published_date additionally accepts "formats" (strptime patterns tried
+as hints before the shared date normalizer). authors and keywords accept "split"
+(a regex separator), "key" (attribute of list items such as
+entry.authors), "strip_prefix" and "max".
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import json
+import os
+import re
+from components.date_normalizer import normalizer
+from parser_common import StandardArticle, clean_html, struct_time_to_datetime
+
+PROFILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'feed_profiles.json')
+
+# Specs used for any field a profile leaves out
+DEFAULT_FIELDS: Dict[str, Dict[str, Any]] = {
+    'title': {'from': ['title']},
+    'link': {'from': ['link'], 'clean': False},
+    'summary': {'from': ['summary']},
+    'journal': {'from': [], 'default': '{journal_name}'},
+    'doi': {'from': ['prism_doi']},
+    'full_text_link': {'from': ['link'], 'clean': False},
+    'published_date': {'from': ['published_parsed', 'updated_parsed']},
+    'authors': {'from': ['authors'], 'key': 'name'},
+    'keywords': {'from': ['tags'], 'key': 'term'},
+}
+
+TEXT_FIELDS = ('title', 'link', 'summary', 'journal', 'doi', 'full_text_link')
+
+class ProfileError(ValueError):
+    """Raised when a profile definition is invalid"""
+    pass
+
+def _lookup(entry: Any, path: str) -> Any:
+    """Resolve a dotted path against a feedparser entry"""
+    value = entry
+    for part in path.split('.'):
+        if value is None:
+            return None
+        if isinstance(value, (list, tuple)):
+            index = int(part) if part.isdigit() else None
+            value = value[index] if index is not None and index < len(value) else None
+        elif hasattr(value, 'get'):
+            value = value.get(part)
+        else:
+            value = getattr(value, part, None)
+    return value
+
+class _FieldExtractor:
+    """Compiled form of a single text field spec"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.sources: List[str] = spec.get('from', [])
+        self.clean: bool = spec.get('clean', True)
+        self.pattern: Optional[re.Pattern] = re.compile(spec['pattern'], re.DOTALL) if 'pattern' in spec else None
+        self.remove: List[re.Pattern] = [re.compile(p, re.DOTALL) for p in spec.get('remove', [])]
+        self.max_length: Optional[int] = spec.get('max_length')
+        self.default: Optional[str] = spec.get('default')
+
+    def raw(self, entry: Any) -> Any:
+        for source in self.sources:
+            value = _lookup(entry, source)
+            if value:
+                return value
+        return None
+
+    def text(self, value: Any, journal_name: str) -> Optional[str]:
+        if value is None or value == '':
+            return self._default(journal_name)
+        value = str(value)
+        if self.clean:
+            value = clean_html(value)
+        if self.pattern is not None:
+            match = self.pattern.search(value)
+            if not match:
+                return self._default(journal_name)
+            value = match.group(1) if self.pattern.groups else match.group(0)
+        for pattern in self.remove:
+            value = pattern.sub('', value)
+        value = value.strip()
+        if self.max_length and len(value) > self.max_length:
+            value = value[:self.max_length] + '...'
+        return value
+
+    def extract(self, entry: Any, journal_name: str) -> Optional[str]:
+        return self.text(self.raw(entry), journal_name)
+
+    def _default(self, journal_name: str) -> Optional[str]:
+        if self.default is None:
+            return None
+        return self.default.replace('{journal_name}', journal_name)
+
+class _DateExtractor(_FieldExtractor):
+    """Compiled published_date spec"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        super().__init__(spec)
+        self.formats: List[str] = spec.get('formats', [])
+
+    def extract(self, entry: Any, journal_name: str) -> Optional[datetime]:
+        value = self.raw(entry)
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            return struct_time_to_datetime(value)
+        text = self.text(value, journal_name)
+        if not text:
+            return None
+        for fmt in self.formats:
+            try:
+                return normalizer.normalize(datetime.strptime(text, fmt))
+            except ValueError:
+                continue
+        return normalizer.normalize(text, feed=journal_name)
+
+class _ListExtractor(_FieldExtractor):
+    """Compiled authors/keywords spec"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        super().__init__(spec)
+        self.split: Optional[re.Pattern] = re.compile(spec['split']) if 'split' in spec else None
+        self.key: Optional[str] = spec.get('key')
+        self.strip_prefix: List[str] = spec.get('strip_prefix', [])
+        self.max: Optional[int] = spec.get('max')
+
+    def extract(self, entry: Any, journal_name: str) -> List[str]:
+        value = self.raw(entry)
+        if value is None:
+            return []
+        if isinstance(value, list):
+            items = [str((_lookup(item, self.key) if self.key else item) or '') for item in value]
+        else:
+            text = self.text(value, journal_name) or ''
+            items = self.split.split(text) if self.split else [text]
+
+        cleaned = []
+        for item in items:
+            item = item.strip()
+            for prefix in self.strip_prefix:
+                if item.startswith(prefix):
+                    item = item[len(prefix):].strip()
+            if item:
+                cleaned.append(item)
+        return cleaned[:self.max] if self.max else cleaned
+
+class CompiledProfile:
+    """A feed profile compiled into a callable (entry, journal_name) parser"""
+
+    def __init__(self, name: str, spec: Dict[str, Any]):
+        self.name = name
+        self.description = spec.get('description', '')
+        fields = spec.get('fields', {})
+        unknown = set(fields) - set(DEFAULT_FIELDS)
+        if unknown:
+            raise ProfileError(f"Profile {name!r} has unknown fields: {sorted(unknown)}")
+        specs = {**DEFAULT_FIELDS, **fields}
+        try:
+            self.text_fields = {field: _FieldExtractor(specs[field]) for field in TEXT_FIELDS}
+            self.published_date = _DateExtractor(specs['published_date'])
+            self.authors = _ListExtractor(specs['authors'])
+            self.keywords = _ListExtractor(specs['keywords'])
+        except re.error as e:
+            raise ProfileError(f"Profile {name!r} has an invalid pattern: {e}")
+
+    def __call__(self, entry: Any, journal_name: str) -> StandardArticle:
+        title = self.text_fields['title'].extract(entry, journal_name)
+        if not title:
+            raise ValueError(f"Entry has no title (profile {self.name!r})")
+        return StandardArticle(
+            title=title,
+            link=self.text_fields['link'].extract(entry, journal_name) or '',
+            authors=self.authors.extract(entry, journal_name),
+            published_date=self.published_date.extract(entry, journal_name),
+            summary=self.text_fields['summary'].extract(entry, journal_name) or '',
+            journal=self.text_fields['journal'].extract(entry, journal_name),
+            doi=self.text_fields['doi'].extract(entry, journal_name),
+            keywords=self.keywords.extract(entry, journal_name),
+            full_text_link=self.text_fields['full_text_link'].extract(entry, journal_name)
+        )
+
+def load_profiles(path: str = PROFILES_PATH) -> Dict[str, CompiledProfile]:
+    """Load and compile every profile in a JSON profile file"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as file:
+        specs = json.load(file)
+    return {name: CompiledProfile(name, spec) for name, spec in specs.items()}
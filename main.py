@@ -8,98 +8,379 @@ from components import (
     MemoryManager,    # new
     EmailSender       # new
 )
-from typing import List, Dict
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+import asyncio
 import config  # we'll create this for managing API keys and settings
+from components.seen_index import SeenArticleIndex
+from components.llm_cache import LLMResponseCache
+from components.llm_scheduler import LLMScheduler
+from components.prefilter import RelevanceCascade
+from components.near_duplicates import NearDuplicateIndex
+from components.pipeline import Pipeline
+from components.checkpoints import RunCheckpoints
+from components.feed_scheduler import FeedScheduler
+from components.fetch_engine import FetchEngine
+from components.feed_cache import FeedCache
 
 class SedRSSSystem:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
         # Initialize components
-        self.rss_fetcher = RSSFeedFetcher()
+        self.feed_cache = FeedCache(config.FEED_CACHE_PATH)
+        self.rss_fetcher = RSSFeedFetcher(cache=self.feed_cache)
         self.data_standardizer = DataStandardizer()
         self.article_db = ArticleDatabase()
         
         # New LLM components
+        self.llm_cache = LLMResponseCache(
+            db_path=config.LLM_CACHE_PATH,
+            ttl=timedelta(days=config.LLM_CACHE_TTL_DAYS),
+            max_bytes=config.LLM_CACHE_MAX_MB * 1024 * 1024
+        )
         self.llm_orchestrator = LLMOrchestrator(
             model_name=config.LLM_MODEL,
-            api_key=config.OPENAI_API_KEY
+            api_key=config.OPENAI_API_KEY,
+            cache=self.llm_cache,
+            scheduler=LLMScheduler(
+                max_in_flight=config.LLM_MAX_IN_FLIGHT,
+                requests_per_minute=config.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute=config.LLM_TOKENS_PER_MINUTE
+            ),
+            batch_size=config.LLM_BATCH_SIZE,
+            fused=config.LLM_FUSED_CHAIN
         )
         self.memory_manager = MemoryManager(
-            vector_store_path=config.VECTOR_STORE_PATH
+            vector_store_path=config.VECTOR_STORE_PATH,
+            archive_path=config.ARCHIVE_PATH
+        )
+        self.seen_index = SeenArticleIndex(config.SEEN_INDEX_PATH)
+        self.near_duplicates = NearDuplicateIndex(
+            config.NEAR_DUPLICATE_PATH,
+            threshold=config.NEAR_DUPLICATE_THRESHOLD
+        )
+        self.prefilter = RelevanceCascade(
+            keyword_scorer=RelevanceScorer(keywords=config.KEYWORDS),
+            model_threshold=config.PREFILTER_MODEL_THRESHOLD,
+            label_threshold=config.PREFILTER_LABEL_THRESHOLD,
+            llm_cost_per_article=config.LLM_COST_PER_ARTICLE
         )
         
         # Enhanced scoring and composition
         self.relevance_scorer = RelevanceScorer(
-            impact_factors=config.JOURNAL_IMPACT_FACTORS,
             keywords=config.KEYWORDS,
-            llm_orchestrator=self.llm_orchestrator
-        )
-        self.newsletter_composer = NewsletterComposer(
-            llm_orchestrator=self.llm_orchestrator,
-            memory_manager=self.memory_manager
+            impact_factors=config.JOURNAL_IMPACT_FACTORS
         )
+        self.newsletter_composer = NewsletterComposer()
         
         self.email_sender = EmailSender(
             smtp_config=config.SMTP_CONFIG
         )
+        self.checkpoints = RunCheckpoints(config.CHECKPOINT_PATH)
 
     async def process_articles(self, articles: List[Dict]) -> List[Dict]:
-        """Process articles with LLM for enhanced understanding"""
-        return await self.llm_orchestrator.process_batch(articles)
+        """
+        Process articles with LLM, reusing results from earlier runs
+
+        Call train_prefilter() once per run before the first batch.
+        """
+        articles, _ = self.near_duplicates.deduplicate(articles)
+        new_articles, cached_articles = self.seen_index.partition(articles)
+        self.logger.info(
+            f"{len(cached_articles)} articles already processed; "
+            f"{len(new_articles)} new articles to pre-filter"
+        )
+        new_articles, rejected_articles, _ = self.prefilter.filter(new_articles)
+        processed_articles = []
+        if new_articles:
+            processed_articles = await self.llm_orchestrator.process_batch(new_articles)
+            self.seen_index.record(processed_articles)
+        # Keep the LLM's score as the pre-filter's training label; scoring
+        # later replaces relevance_score with the final ranking score
+        for article in processed_articles + cached_articles:
+            if not article.get('llm_error'):
+                article['llm_relevance'] = article.get('relevance_score')
+        return processed_articles + cached_articles + rejected_articles
+
+    async def train_prefilter(self) -> None:
+        """Retrain the pre-filter on LLM scores stored by earlier runs"""
+        await self.memory_manager.db.run(self.prefilter.fit_from_db)
+
+    async def score_and_remember(self, articles: List[Dict]) -> List[Dict]:
+        """Score processed articles and store them in the memory system"""
+        scored_articles = self.relevance_scorer.score(articles)
+        await self.memory_manager.update(scored_articles)
+        return scored_articles
+
+    async def _checkpointed(self, run_id: str, stage: str,
+                            produce: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a stage's saved output for this run, or produce and save it"""
+        saved = self.checkpoints.load(run_id, stage)
+        if saved is not None:
+            self.logger.info(f"Run {run_id}: reusing checkpointed '{stage}' stage")
+            return saved
+        result = await produce()
+        self.checkpoints.save(run_id, stage, result)
+        return result
+
+    async def run(self, run_id: Optional[str] = None, refresh_feeds: bool = True):
+        """
+        Run every stage in sequence, checkpointing each one
+
+        Passing the ID of an earlier run resumes it: stages that already
+        completed are loaded from their checkpoints instead of re-run, so a
+        failed send does not refetch feeds or repeat LLM calls.
 
-    async def run(self):
+        With refresh_feeds=False no feeds are fetched and the newsletter is
+        built from articles already stored, as the daemon does.
+        """
+        run_id = run_id or self.checkpoints.new_run_id()
+        self.logger.info(f"Starting run {run_id}")
         try:
             # 1. Fetch and standardize data
-            self.logger.info("Fetching RSS feeds...")
-            raw_data = await self.rss_fetcher.fetch_all()
-            self.logger.info(f"Fetched {len(raw_data)} articles")
+            async def fetch() -> List[Dict]:
+                if not refresh_feeds:
+                    return []
+                self.logger.info("Fetching RSS feeds...")
+                raw_data = await self.rss_fetcher.fetch_all()
+                self.logger.info(f"Fetched {len(raw_data)} articles")
+                return raw_data
 
-            standardized_data = self.data_standardizer.standardize(raw_data)
-            self.article_db.store(standardized_data)
+            async def standardize() -> List[Dict]:
+                raw_data = await self._checkpointed(run_id, 'fetched', fetch)
+                standardized_data = self.data_standardizer.standardize(raw_data)
+                self.article_db.store(standardized_data)
+                return self.article_db.get_recent_articles()
 
             # 2. LLM Processing and Scoring
-            articles = self.article_db.get_recent_articles()
-            
-            self.logger.info("Processing articles with LLM...")
-            processed_articles = await self.process_articles(articles)
+            async def process() -> List[Dict]:
+                articles = await self._checkpointed(run_id, 'standardized', standardize)
+                self.logger.info("Processing articles with LLM...")
+                await self.train_prefilter()
+                return await self.process_articles(articles)
+
+            processed_articles = await self._checkpointed(run_id, 'processed', process)
             
-            self.logger.info("Scoring articles...")
-            scored_articles = await self.relevance_scorer.score(processed_articles)
+            # 3. Score and update memory system
+            self.logger.info("Scoring articles and updating memory system...")
+            scored_articles = await self.score_and_remember(processed_articles)
 
-            # 3. Update memory system
-            self.logger.info("Updating memory system...")
-            await self.memory_manager.update(scored_articles)
+            await self.publish(scored_articles, run_id)
 
-            # 4. Compose newsletter with context
-            self.logger.info("Composing newsletter...")
-            newsletter_content = await self.newsletter_composer.compose(
-                scored_articles,
-                historical_context=await self.memory_manager.get_relevant_context()
-            )
+        except Exception as e:
+            self.logger.error(f"Run {run_id} failed: {str(e)}; resume with --resume {run_id}")
+            raise
+
+    async def run_pipelined(self, run_id: Optional[str] = None):
+        """
+        Run fetch, LLM processing and scoring as overlapping stages
+
+        Articles from the first feed to return are standardized, stored and
+        sent to the LLM while slower feeds are still downloading; bounded
+        queues between stages apply backpressure. Unlike run(), only
+        articles fetched in this run are processed, not everything stored
+        in the last week. The pipeline's output is checkpointed as the
+        'processed' stage, so a failed composition or send can be resumed
+        with run(). If any pipeline batch fails, the run fails before
+        checkpointing rather than sending a newsletter missing those
+        articles.
+        """
+        run_id = run_id or self.checkpoints.new_run_id()
+        self.logger.info(f"Starting pipelined run {run_id}")
+        try:
+            await self.train_prefilter()
+
+            async def standardize_and_store(batch: List[Dict]) -> List[Dict]:
+                standardized = self.data_standardizer.standardize(batch)
+                self.article_db.store(standardized)
+                return standardized
 
-            # 5. Send newsletter
-            self.logger.info("Sending newsletter...")
-            await self.email_sender.send(
-                subject=f"SedRSS Newsletter - {datetime.now().strftime('%Y-%m-%d')}",
-                content=newsletter_content,
-                recipients=config.SUBSCRIBER_LIST
+            pipeline = (
+                Pipeline(maxsize=config.PIPELINE_QUEUE_SIZE)
+                .add_stage('standardize', standardize_and_store, batch_size=50)
+                .add_stage('llm', self.process_articles,
+                           workers=config.PIPELINE_LLM_WORKERS,
+                           batch_size=config.PIPELINE_BATCH_SIZE)
+                .add_stage('score', self.score_and_remember, batch_size=50)
             )
+            self.logger.info("Running pipelined fetch and processing...")
+            scored_articles = await pipeline.run(self.rss_fetcher.stream_all())
+            self.logger.info(f"Pipeline stats: {pipeline.stats()}")
+            self.checkpoints.save(run_id, 'processed', scored_articles)
 
-            self.logger.info("Newsletter process complete")
+            await self.publish(scored_articles, run_id)
 
         except Exception as e:
-            self.logger.error(f"An error occurred: {str(e)}")
+            self.logger.error(f"Run {run_id} failed: {str(e)}; resume with --resume {run_id}")
             raise
 
+    async def poll_feeds(self, journals: List[Dict[str, str]],
+                         engine: FetchEngine) -> Tuple[int, List[Dict[str, str]]]:
+        """
+        Fetch some journals and store their standardized articles
+
+        Each journal is fetched and stored on its own, so one journal's
+        failure (a network error, a parse worker crash, a database error)
+        does not lose the others. The fetch has already saved the feed's
+        validators, so a failed store forgets them; otherwise the retry
+        would see a 304 and the articles would never be stored.
+
+        Returns:
+            Tuple of (articles stored, journals that failed)
+        """
+        async def poll(journal: Dict[str, str]) -> int:
+            articles = await self.rss_fetcher.fetch_feed(journal, engine)
+            if articles:
+                try:
+                    self.article_db.store(self.data_standardizer.standardize(articles))
+                except Exception:
+                    if self.rss_fetcher.cache:
+                        self.rss_fetcher.cache.forget(journal['RSS URL'])
+                    raise
+            return len(articles)
+
+        results = await asyncio.gather(*[poll(journal) for journal in journals],
+                                       return_exceptions=True)
+        stored, failed = 0, []
+        for journal, result in zip(journals, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Polling {journal['Journal Name']} failed: {str(result)}")
+                failed.append(journal)
+            else:
+                stored += result
+        return stored, failed
+
+    async def run_daemon(self):
+        """
+        Poll each feed on its own adaptive schedule and send newsletters periodically
+
+        Busy journals are polled often and quiet ones rarely, based on the
+        publication cadence of stored articles. Every
+        NEWSLETTER_INTERVAL_HOURS a newsletter is built from what has
+        accumulated; a failed one is retried, resuming the same run.
+        """
+        scheduler = FeedScheduler(
+            self.rss_fetcher.journals,
+            min_interval=timedelta(minutes=config.DAEMON_MIN_POLL_MINUTES),
+            max_interval=timedelta(hours=config.DAEMON_MAX_POLL_HOURS),
+            default_interval=timedelta(hours=config.DAEMON_DEFAULT_POLL_HOURS)
+        )
+        scheduler.update_cadence(self.article_db.publication_cadence())
+        scheduler.start(datetime.now())
+        self.logger.info(
+            f"Daemon polling {len(scheduler.journals)} feeds, "
+            f"~{scheduler.polls_per_day():.0f} requests/day"
+        )
+
+        newsletter_interval = timedelta(hours=config.NEWSLETTER_INTERVAL_HOURS)
+        next_newsletter = datetime.now() + newsletter_interval
+        pending_run_id = None
+        async with FetchEngine() as engine:
+            while True:
+                now = datetime.now()
+                due = scheduler.due(now)
+                if due:
+                    failed = due
+                    try:
+                        stored, failed = await self.poll_feeds(due, engine)
+                        self.logger.info(f"Polled {len(due)} feeds, {stored} articles")
+                        scheduler.update_cadence(self.article_db.publication_cadence())
+                    except Exception as e:
+                        self.logger.error(f"Feed poll failed: {str(e)}")
+                    finally:
+                        # Every due journal goes back on the schedule; failed
+                        # ones are retried sooner than their usual interval
+                        retry = timedelta(minutes=config.DAEMON_RETRY_MINUTES)
+                        for journal in due:
+                            scheduler.reschedule(journal, now, retry if journal in failed else None)
+
+                if now >= next_newsletter:
+                    pending_run_id = pending_run_id or self.checkpoints.new_run_id()
+                    try:
+                        await self.run(pending_run_id, refresh_feeds=False)
+                        pending_run_id = None
+                        next_newsletter = now + newsletter_interval
+                    except Exception:
+                        next_newsletter = now + timedelta(minutes=config.DAEMON_RETRY_MINUTES)
+
+                wake_at = min(filter(None, [scheduler.next_poll(), next_newsletter]))
+                await asyncio.sleep(max(1.0, (wake_at - datetime.now()).total_seconds()))
+
+    async def publish(self, scored_articles: List[Dict], run_id: str) -> None:
+        """Archive old memory, then compose and send the newsletter"""
+        if self.checkpoints.load(run_id, 'sent') is not None:
+            self.logger.info(f"Run {run_id} was already sent")
+            return
+        await self.memory_manager.archive_old_entries(days=config.HOT_RETENTION_DAYS)
+
+        # 4. Compose newsletter with context
+        async def compose() -> Dict[str, List[Dict]]:
+            self.logger.info("Composing newsletter...")
+            return self.newsletter_composer.compose(
+                scored_articles,
+                historical_context=await self.memory_manager.get_relevant_context(
+                    query=" ".join(
+                        article['title'] for article in sorted(
+                            scored_articles, key=lambda a: a.get('relevance_score', 0), reverse=True
+                        )[:10]
+                    )
+                )
+            )
+
+        newsletter_content = await self._checkpointed(run_id, 'composed', compose)
+
+        # 5. Send newsletter
+        self.logger.info("Sending newsletter...")
+        await self.email_sender.send(
+            subject=f"SedRSS Newsletter - {datetime.now().strftime('%Y-%m-%d')}",
+            content=newsletter_content,
+            recipients=config.SUBSCRIBER_LIST
+        )
+        self.checkpoints.save(run_id, 'sent', datetime.now())
+        self.checkpoints.prune(days=config.CHECKPOINT_RETENTION_DAYS)
+
+        self.logger.info(f"LLM cache stats: {self.llm_cache.stats()}")
+        self.logger.info("Newsletter process complete")
+
+    def close(self):
+        """Close the DuckDB-backed stores and stop the feed parse workers"""
+        self.rss_fetcher.close()
+        self.memory_manager.close()
+        self.seen_index.close()
+        self.near_duplicates.close()
+        self.llm_cache.close()
+        self.article_db.close()
+        self.checkpoints.close()
+        self.feed_cache.close()
+
 if __name__ == "__main__":
-    import asyncio
+    import argparse
+    parser = argparse.ArgumentParser(description="Fetch, summarize and send the SedRSS newsletter")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running, polling feeds adaptively and sending on a schedule")
+    parser.add_argument('--resume', nargs='?', const='latest', metavar='RUN_ID',
+                        help="Resume a failed run from its last completed stage "
+                             "(default: the most recent unsent run)")
+    args = parser.parse_args()
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
     sedrss = SedRSSSystem()
-    asyncio.run(sedrss.run())
\ No newline at end of file
+    try:
+        run_id = args.resume
+        if run_id == 'latest':
+            run_id = sedrss.checkpoints.latest_unfinished()
+            if run_id is None:
+                logging.getLogger(__name__).info("No unfinished run to resume; starting a new one")
+        if args.daemon:
+            asyncio.run(sedrss.run_daemon())
+        elif run_id:
+            asyncio.run(sedrss.run(run_id))
+        else:
+            asyncio.run(sedrss.run_pipelined() if config.PIPELINED_RUN else sedrss.run())
+    finally:
+        sedrss.close()
\ No newline at end of file
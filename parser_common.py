@@ -0,0 +1,47 @@
+# parser_common.py
+from datetime import datetime
+from typing import List, Optional, TypedDict
+import re
+from html import unescape
+from components.date_normalizer import normalizer
+
+TAG_RE = re.compile('<.*?>')
+
+class StandardArticle(TypedDict):
+    title: str
+    link: str
+    authors: List[str]
+    published_date: Optional[datetime]
+    summary: str
+    journal: str
+    doi: Optional[str]
+    keywords: List[str]
+    full_text_link: Optional[str]
+
+def clean_html(raw_html: str) -> str:
+    """Remove HTML tags from a string and unescape HTML entities."""
+    return unescape(TAG_RE.sub('', raw_html).strip())
+
+def struct_time_to_datetime(parsed) -> Optional[datetime]:
+    """Convert a feedparser *_parsed struct_time to an aware UTC datetime."""
+    return normalizer.normalize(parsed) if parsed else None
+
+def print_example(url: str, parser) -> None:
+    """Fetch a feed and print the first article parsed by a format parser."""
+    import feedparser
+    feed = feedparser.parse(url)
+    journal_name = feed.feed.get('title', url)
+    parsed_articles = [parser(entry, journal_name) for entry in feed.entries]
+    print(f"Parsed {len(parsed_articles)} articles from {journal_name}")
+
+    if parsed_articles:
+        print("\nFirst article details:")
+        for key, value in parsed_articles[0].items():
+            if isinstance(value, list):
+                print(f"{key}:")
+                for item in value:
+                    print(f"  - {item}")
+            elif isinstance(value, datetime):
+                print(f"{key}: {value.isoformat()}")
+            else:
+                print(f"{key}: {value}")
@@ -1,4 +1,9 @@
 # parser_factory.py
+from typing import Callable, Dict, Iterable, List, Optional, Union
+import logging
+import time
+from parser_common import StandardArticle
+from feed_profiles import load_profiles
 from parser_format1 import parse_format_1
 from parser_format2 import parse_format_2
 from parser_format3 import parse_format_3
@@ -6,13 +11,82 @@ from parser_format4 import parse_format_4
 from parser_format5 import parse_format_5
 from parser_format6 import parse_format_6
 
+EntryParser = Callable[..., StandardArticle]
+
+class JournalParser:
+    """A format parser resolved once and bound to one journal's feed"""
+
+    def __init__(self, parse: EntryParser, journal_name: str, format_type: Union[int, str]):
+        self.parse = parse
+        self.journal_name = journal_name
+        self.format_type = format_type
+        self.logger = logging.getLogger(__name__)
+        self.entries_parsed = 0
+        self.parse_seconds = 0.0
+
+    def parse_entries(self, entries: Iterable, max_articles: Optional[int] = None) -> List[StandardArticle]:
+        """Parse a batch of feed entries, skipping entries that fail"""
+        start = time.perf_counter()
+        articles = []
+        for entry in entries:
+            try:
+                article = self.parse(entry, self.journal_name)
+            except Exception as e:
+                self.logger.error(f"Error parsing entry for {self.journal_name}: {str(e)}")
+                continue
+            if article:
+                articles.append(article)
+            if max_articles is not None and len(articles) >= max_articles:
+                break
+        self.entries_parsed += len(articles)
+        self.parse_seconds += time.perf_counter() - start
+        return articles
+
+    @property
+    def seconds_per_entry(self) -> float:
+        return self.parse_seconds / self.entries_parsed if self.entries_parsed else 0.0
+
+class ParserRegistry:
+    """
+    Table of format parsers keyed by the Format column of journals.csv
+
+    Integer keys map to the parser_formatN modules; string keys map to
+    compiled profiles from feed_profiles.json.
+    """
+
+    def __init__(self):
+        self._parsers: Dict[Union[int, str], EntryParser] = {}
+
+    def register(self, format_type: Union[int, str], parser: EntryParser) -> None:
+        self._parsers[self._key(format_type)] = parser
+
+    def get(self, format_type: Union[int, str]) -> Optional[EntryParser]:
+        return self._parsers.get(self._key(format_type))
+
+    def resolve(self, format_type: Union[int, str], journal_name: str) -> Optional[JournalParser]:
+        """Look up a format once and bind it to a journal for batch parsing"""
+        parser = self.get(format_type)
+        if parser is None:
+            return None
+        return JournalParser(parser, journal_name, format_type)
+
+    @staticmethod
+    def _key(format_type: Union[int, str]) -> Union[int, str]:
+        if isinstance(format_type, str) and format_type.strip().isdigit():
+            return int(format_type)
+        return format_type
+
+registry = ParserRegistry()
+registry.register(1, parse_format_1)
+registry.register(2, parse_format_2)
+registry.register(3, parse_format_3)
+registry.register(4, parse_format_4)
+registry.register(5, parse_format_5)
+registry.register(6, parse_format_6)
+
+# Declarative profiles from feed_profiles.json, addressable by name in journals.csv
+for profile_name, profile in load_profiles().items():
+    registry.register(profile_name, profile)
+
 def get_parser(format_type):
-    parsers = {
-        1: parse_format_1,
-        2: parse_format_2,
-        3: parse_format_3,
-        4: parse_format_4,
-        5: parse_format_5,
-        6: parse_format_6,
-    }
-    return parsers.get(format_type) 
\ No newline at end of file
+    return registry.get(format_type)
@@ -1,27 +1,12 @@
-import feedparser
-from datetime import datetime
-from typing import List, Optional, TypedDict
 import re
-from html import unescape
+from components.date_normalizer import normalizer
+from parser_common import StandardArticle, clean_html, print_example
 
-class StandardArticle(TypedDict):
-    title: str
-    link: str
-    authors: List[str]
-    published_date: Optional[datetime]
-    summary: str
-    journal: str
-    doi: Optional[str]
-    keywords: List[str]
-    full_text_link: Optional[str]
+PUB_DATE_RE = re.compile(r'Publication date: (\d+ \w+ \d{4})')
+AUTHORS_RE = re.compile(r'Author\(s\): (.+)')
+SOURCE_RE = re.compile(r'Source: (.+)')
 
-def clean_html(raw_html: str) -> str:
-    """Remove HTML tags from a string."""
-    cleanr = re.compile('<.*?>')
-    cleantext = re.sub(cleanr, '', raw_html)
-    return unescape(cleantext.strip())
-
-def parse_format_1(entry, journal_name):
+def parse_format_1(entry, journal_name) -> StandardArticle:
     """
     Parse RSS feeds for Format 1 (ScienceDirect journals).
     
@@ -30,28 +15,23 @@ def parse_format_1(entry, journal_name):
         journal_name: The name of the journal.
     
     Returns:
-        List[StandardArticle]: A list of parsed articles in the standard format.
+        StandardArticle: The parsed article in the standard format.
     """
     description = clean_html(entry.description)
     
     # Extract publication date
-    pub_date_match = re.search(r'Publication date: (\d+ \w+ \d{4})', description)
+    pub_date_match = PUB_DATE_RE.search(description)
     pub_date_str = pub_date_match.group(1) if pub_date_match else None
-    pub_date = None
-    if pub_date_str:
-        try:
-            pub_date = datetime.strptime(pub_date_str, "%d %B %Y")
-        except ValueError:
-            # If parsing fails, keep pub_date as None
-            pass
+    # The normalizer learns this feed's format and returns None if it cannot parse
+    pub_date = normalizer.normalize(pub_date_str, feed=journal_name)
 
     # Extract authors
-    authors_match = re.search(r'Author\(s\): (.+)', description)
+    authors_match = AUTHORS_RE.search(description)
     authors = authors_match.group(1).split(', ') if authors_match else []
 
     # Create a clean summary
     summary_parts = []
-    source_match = re.search(r'Source: (.+)', description)
+    source_match = SOURCE_RE.search(description)
     if source_match:
         summary_parts.append(f"Source: {source_match.group(1)}")
     if pub_date_str:
@@ -73,19 +53,4 @@ def parse_format_1(entry, journal_name):
 
 # Example usage
 if __name__ == "__main__":
-    url = "https://rss.sciencedirect.com/publication/science/0169555X"  # Geomorphology
-    parsed_articles = parse_format_1(url)
-    print(f"Parsed {len(parsed_articles)} articles from {parsed_articles[0]['journal']}")
-    
-    # Print details of the first article
-    if parsed_articles:
-        print("\nFirst article details:")
-        for key, value in parsed_articles[0].items():
-            if isinstance(value, list):
-                print(f"{key}:")
-                for item in value:
-                    print(f"  - {item}")
-            elif isinstance(value, datetime):
-                print(f"{key}: {value.isoformat()}")
-            else:
-                print(f"{key}: {value}")
\ No newline at end of file
+    print_example("https://rss.sciencedirect.com/publication/science/0169555X", parse_format_1)  # Geomorphology
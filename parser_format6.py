@@ -1,44 +1,38 @@
-import feedparser
+from parser_common import StandardArticle, clean_html, struct_time_to_datetime, print_example
 
-def parse_format_6():
-    url = 'https://www.nature.com/ngeo.rss'
-    print(f"Parsing feed from: {url}")
-    
-    feed = feedparser.parse(url)
-    
-    if feed.bozo:
-        print(f"Error parsing feed: {feed.bozo_exception}")
-        return
-    
-    print(f"Feed title: {feed.feed.title}")
-    print(f"Number of entries: {len(feed.entries)}")
-    
-    for entry in feed.entries:
-        print(f"- {entry.title}")
-        print(f"  Link: {entry.link}")
-        
-        # Adaptive date extraction
-        date_fields = ['published', 'updated', 'created', 'pubDate']
-        for field in date_fields:
-            if hasattr(entry, field):
-                print(f"  Date ({field}): {getattr(entry, field)}")
-                break
-        else:
-            print("  No date information available")
-        
-        # Flexible content extraction
-        content_fields = ['summary', 'description', 'content']
-        for field in content_fields:
-            if hasattr(entry, field):
-                content = getattr(entry, field)
-                if isinstance(content, list) and content:
-                    content = content[0].value
-                print(f"  {field.capitalize()}: {content[:100]}...")  # Print first 100 characters
-                break
-        else:
-            print("  No content available")
-        
-        print()
+DATE_FIELDS = ('published_parsed', 'updated_parsed', 'created_parsed')
 
+def parse_format_6(entry, journal_name) -> StandardArticle:
+    """Parse RSS feeds for Format 6 (Nature journals)."""
+    # Adaptive date extraction
+    pub_date = None
+    for field in DATE_FIELDS:
+        pub_date = struct_time_to_datetime(entry.get(field))
+        if pub_date:
+            break
+
+    # Flexible content extraction
+    summary = ''
+    if entry.get('content'):
+        summary = entry.content[0].get('value', '')
+    else:
+        summary = entry.get('summary', entry.get('description', ''))
+
+    doi = entry.get('prism_doi') or entry.get('dc_identifier', '').replace('doi:', '') or None
+
+    article = StandardArticle(
+        title=clean_html(entry.title),
+        link=entry.link,
+        authors=[author.get('name', '') for author in entry.get('authors', []) if author.get('name')],
+        published_date=pub_date,
+        summary=clean_html(summary),
+        journal=journal_name,
+        doi=doi,
+        keywords=[],
+        full_text_link=entry.link
+    )
+    return article
+
+# Example usage
 if __name__ == "__main__":
-    parse_format_6()
\ No newline at end of file
+    print_example("https://www.nature.com/ngeo.rss", parse_format_6)  # Nature Geoscience
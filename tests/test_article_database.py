@@ -0,0 +1,148 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from components.article_database import ArticleDatabase
+
+@pytest.fixture
+def article_db(tmp_path):
+    """Create a test article database"""
+    db = ArticleDatabase(str(tmp_path / "articles.ddb"))
+    yield db
+    db.close()
+
+@pytest.fixture
+def sample_articles():
+    """Create sample feed articles with mixed date representations"""
+    return [
+        {
+            'title': 'Recent Article',
+            'authors': ['Jane Doe', 'John Smith'],
+            'journal': 'Geomorphology',
+            'abstract': 'Recent abstract',
+            'published_date': datetime.now() - timedelta(days=1),
+            'url': 'http://example.com/recent'
+        },
+        {
+            'title': 'Tz-aware Article',
+            'authors': [],
+            'journal': 'Geology',
+            'abstract': 'Aware abstract',
+            'published_date': (datetime.now(timezone.utc) - timedelta(days=2)).isoformat(),
+            'url': 'http://example.com/aware'
+        },
+        {
+            'title': 'Old Article',
+            'authors': ['A. Author'],
+            'journal': 'Sedimentology',
+            'abstract': 'Old abstract',
+            'published_date': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
+            'url': 'http://example.com/old'
+        }
+    ]
+
+def test_recent_articles(article_db, sample_articles):
+    """Test range queries on the native timestamp column"""
+    article_db.store(sample_articles)
+
+    recent = article_db.get_recent_articles(days=7)
+
+    assert [a['title'] for a in recent] == ['Recent Article', 'Tz-aware Article']
+    assert isinstance(recent[0]['published_date'], datetime)
+    assert recent[0]['authors'] == ['Jane Doe', 'John Smith']
+
+def test_upsert_by_stable_key(article_db, sample_articles):
+    """Test re-storing the same articles replaces rather than duplicates"""
+    article_db.store(sample_articles)
+    updated = dict(sample_articles[0], abstract='Corrected abstract')
+    article_db.store([updated, updated])
+
+    assert article_db.count() == 3
+    assert article_db.get_recent_articles()[0]['abstract'] == 'Corrected abstract'
+
+def test_persists_across_instances(tmp_path, sample_articles):
+    """Test articles survive closing and reopening the database"""
+    path = str(tmp_path / "articles.ddb")
+    db = ArticleDatabase(path)
+    db.store(sample_articles)
+    db.close()
+
+    reopened = ArticleDatabase(path)
+    assert reopened.count() == 3
+    reopened.clear()
+    assert reopened.count() == 0
+    reopened.close()
+
+def test_publication_cadence(article_db):
+    """Test the median gap counts same-time releases as one event"""
+    start = datetime.now() - timedelta(days=20)
+    articles = []
+    for day in range(0, 20, 2):
+        for n in range(3):  # three articles released together
+            articles.append({'title': f'Busy {day}-{n}', 'journal': 'GRL',
+                             'published_date': start + timedelta(days=day),
+                             'url': f'http://example.com/busy/{day}/{n}'})
+    articles.append({'title': 'Quiet 1', 'journal': 'Basin Research',
+                     'published_date': start, 'url': 'http://example.com/q1'})
+    articles.append({'title': 'Quiet 2', 'journal': 'Basin Research',
+                     'published_date': start + timedelta(days=15), 'url': 'http://example.com/q2'})
+    article_db.store(articles)
+
+    cadence = article_db.publication_cadence(days=30)
+
+    assert cadence['GRL'] == timedelta(days=2)
+    assert cadence['Basin Research'] == timedelta(days=15)
+
+def test_recent_articles_are_utc_and_keep_undated(article_db, sample_articles):
+    """Test results are aware UTC and undated articles are not dropped"""
+    undated = {'title': 'Undated Article', 'journal': 'Geology',
+               'published_date': 'garbled', 'url': 'http://example.com/undated'}
+    article_db.store(sample_articles + [undated])
+
+    recent = article_db.get_recent_articles(days=7)
+
+    assert [a['title'] for a in recent] == ['Recent Article', 'Tz-aware Article', 'Undated Article']
+    assert recent[0]['published_date'].tzinfo == timezone.utc
+    assert recent[-1]['published_date'] is None
+
+def test_url_variants_stored_once(article_db):
+    """Test www./query-string variants and a DOI on another host share one row"""
+    article_db.store([
+        {'title': 'Deltas', 'url': 'https://www.example.com/paper/1?utm_source=rss',
+         'published_date': datetime.now(timezone.utc)},
+        {'title': 'Deltas', 'url': 'https://example.com/paper/1/',
+         'published_date': datetime.now(timezone.utc)},
+        {'title': 'Rivers', 'url': 'https://onlinelibrary.wiley.com/doi/10.1029/2024GL000001',
+         'published_date': datetime.now(timezone.utc)},
+        {'title': 'Rivers', 'url': 'https://agupubs.onlinelibrary.wiley.com/doi/10.1029/2024gl000001',
+         'published_date': datetime.now(timezone.utc)},
+    ])
+
+    assert article_db.count() == 2
+
+def test_migrates_raw_url_keys(tmp_path):
+    """Test rows keyed by the old raw-URL hash are re-keyed and collapsed"""
+    db_path = str(tmp_path / "legacy.ddb")
+    db = ArticleDatabase(db_path)
+    now = datetime.now()
+    db.conn.executemany("INSERT INTO feed_articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+        ('old-1', 'Deltas', [], 'Geology', 'first', 'https://www.example.com/1?x=1', None, now, now - timedelta(hours=1)),
+        ('old-2', 'Deltas', [], 'Geology', 'second', 'https://example.com/1', None, now, now),
+    ])
+    db.close()
+
+    db = ArticleDatabase(db_path)
+    try:
+        rows = db.conn.execute("SELECT id, abstract FROM feed_articles").fetchall()
+        assert len(rows) == 1
+        assert rows[0][1] == 'second'
+        assert not rows[0][0].startswith('old')
+    finally:
+        db.close()
+
+def test_store_learns_journal_date_format(article_db):
+    """Test stored dates are normalized with the article's journal as the feed"""
+    from components.date_normalizer import normalizer
+
+    article_db.store([{'title': 'Deltas', 'url': 'https://example.com/fmt',
+                       'journal': 'Format Test Journal', 'published_date': '7 March 2025'}])
+
+    assert normalizer.feed_formats['Format Test Journal'] == '%d %B %Y'
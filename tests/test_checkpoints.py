@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime, timezone
+from components.checkpoints import RunCheckpoints
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    """Create a test checkpoint store"""
+    store = RunCheckpoints(str(tmp_path / "checkpoints.ddb"))
+    yield store
+    store.close()
+
+def test_save_and_load(checkpoints):
+    """Test stage payloads round-trip through JSON with typed article dates"""
+    run_id = checkpoints.new_run_id()
+    published = datetime(2024, 1, 2, 9, 30, tzinfo=timezone.utc)
+    checkpoints.save(run_id, 'processed', [{'title': 'A', 'published_date': published},
+                                           {'title': 'B', 'published_date': None}])
+    checkpoints.save(run_id, 'fetched', [])
+
+    assert checkpoints.load(run_id, 'processed') == [{'title': 'A', 'published_date': published},
+                                                     {'title': 'B', 'published_date': None}]
+    assert checkpoints.load(run_id, 'fetched') == []
+    assert checkpoints.load(run_id, 'composed') is None
+    assert checkpoints.completed_stages(run_id) == ['fetched', 'processed']
+
+def test_latest_unfinished_skips_sent_runs(checkpoints):
+    """Test resume picks the newest run that never reached 'sent'"""
+    checkpoints.save('run-1', 'fetched', [])
+    checkpoints.save('run-2', 'composed', 'newsletter')
+    assert checkpoints.latest_unfinished() == 'run-2'
+
+    checkpoints.save('run-2', 'sent', datetime.now())
+    assert checkpoints.latest_unfinished() == 'run-1'
+
+def test_unknown_stage_and_prune(checkpoints):
+    """Test stage names are validated and recent runs survive pruning"""
+    with pytest.raises(ValueError):
+        checkpoints.save('run-1', 'emailed', None)
+    checkpoints.save('run-1', 'fetched', [])
+
+    assert checkpoints.prune(days=14) == 0
+    assert checkpoints.prune(days=-1) == 1
+    assert checkpoints.latest_unfinished() is None
@@ -0,0 +1,75 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from components.article_id import content_id
+from components.data_standardizer import DataStandardizer
+from components.date_normalizer import DateNormalizer
+
+def test_values_become_aware_utc():
+    """Test every supported representation comes back as aware UTC"""
+    normalizer = DateNormalizer()
+    expected = datetime(2024, 12, 2, 9, 0, tzinfo=timezone.utc)
+
+    assert normalizer.normalize('Mon, 02 Dec 2024 10:00:00 +0100') == expected
+    assert normalizer.normalize('2024-12-02T09:00:00Z') == expected
+    assert normalizer.normalize(datetime(2024, 12, 2, 9, 0)) == expected
+    assert normalizer.normalize(datetime(2024, 12, 2, 4, 0, tzinfo=timezone(timedelta(hours=-5)))) == expected
+    assert normalizer.normalize(time.strptime('2024-12-02 09:00', '%Y-%m-%d %H:%M')) == expected
+    assert normalizer.normalize(date(2024, 12, 2)) == datetime(2024, 12, 2, tzinfo=timezone.utc)
+    assert normalizer.normalize('1 March 2025') == datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+def test_unparseable_values_are_none():
+    """Test bad dates are reported as missing instead of a sentinel date"""
+    normalizer = DateNormalizer()
+
+    assert normalizer.normalize(None) is None
+    assert normalizer.normalize('') is None
+    assert normalizer.normalize('not a date') is None
+
+def test_partial_dates_do_not_borrow_today():
+    """Test missing fields get fixed defaults and yearless dates are rejected"""
+    normalizer = DateNormalizer()
+
+    assert normalizer.normalize('March 2024') == datetime(2024, 3, 1, tzinfo=timezone.utc)
+    assert normalizer.normalize('2024') == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert normalizer.normalize('March 5') is None
+
+def test_winning_format_cached_per_feed():
+    """Test a feed's format is learned once and relearned when it changes"""
+    normalizer = DateNormalizer()
+
+    normalizer.normalize('1 March 2025', feed='Geomorphology')
+    normalizer.normalize('2 March 2025', feed='Geomorphology')
+    normalizer.normalize('Mon, 02 Dec 2024 10:00:00 GMT', feed='Basin Research')
+
+    assert normalizer.feed_formats == {'Geomorphology': '%d %B %Y', 'Basin Research': 'rfc822'}
+    assert normalizer.stats() == {'hits': 1, 'misses': 2, 'feeds': 2}
+
+    assert normalizer.normalize('2025-03-03', feed='Geomorphology') == datetime(2025, 3, 3, tzinfo=timezone.utc)
+    assert normalizer.feed_formats['Geomorphology'] == 'iso8601'
+
+def test_standardizer_emits_datetimes():
+    """Test standardized articles carry typed dates, keyed by journal"""
+    normalizer = DateNormalizer()
+    standardizer = DataStandardizer(date_normalizer=normalizer)
+
+    articles = standardizer.standardize([
+        {'title': 'a', 'journal': 'Geology', 'published_date': 'Mon, 02 Dec 2024 10:00:00 GMT'},
+        {'title': 'b', 'journal': 'Geology', 'published_date': 'garbled'},
+    ])
+
+    assert articles[0]['published_date'] == datetime(2024, 12, 2, 10, 0, tzinfo=timezone.utc)
+    assert articles[1]['published_date'] is None
+    assert normalizer.feed_formats == {'Geology': 'rfc822'}
+
+def test_standardizer_keeps_doi_and_keywords():
+    """Test feed DOIs survive standardization so content_id is unchanged"""
+    article = {'title': 'Delta avulsion', 'journal': 'Nature Geoscience',
+               'url': 'https://www.nature.com/articles/s41561-024-01234-5',
+               'doi': 'doi:10.1038/s41561-024-01234-5', 'keywords': [' deltas ', '', 'avulsion'],
+               'published_date': '2024-12-02T10:00:00Z'}
+
+    standardized = DataStandardizer().standardize([article])[0]
+
+    assert standardized['doi'] == '10.1038/s41561-024-01234-5'
+    assert standardized['keywords'] == ['deltas', 'avulsion']
+    assert content_id(standardized) == content_id(article)
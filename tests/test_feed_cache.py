@@ -0,0 +1,91 @@
+import pytest
+from aiohttp import web
+from components.feed_cache import FeedCache
+from components.fetch_engine import FetchEngine
+from components.rss_feed_fetcher import RSSFeedFetcher
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Journal</title>
+    <item>
+      <title>Sediment Transport in Braided Rivers</title>
+      <link>http://example.com/1</link>
+      <description>&lt;p&gt;Test abstract&lt;/p&gt;</description>
+      <pubDate>Mon, 02 Dec 2024 10:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>"""
+
+@pytest.fixture
+def feed_cache(tmp_path):
+    """Create a test feed cache instance"""
+    cache = FeedCache(str(tmp_path / "feed_cache.ddb"))
+    yield cache
+    cache.close()
+
+@pytest.fixture
+async def feed_server():
+    """Serve a feed that honours If-None-Match and counts requests"""
+    state = {'requests': 0, 'etag': '"v1"'}
+
+    async def handler(request):
+        state['requests'] += 1
+        if state['etag'] and request.headers.get('If-None-Match') == state['etag']:
+            return web.Response(status=304)
+        headers = {'ETag': state['etag']} if state['etag'] else {}
+        return web.Response(body=SAMPLE_FEED, headers=headers,
+                            content_type='application/rss+xml')
+
+    app = web.Application()
+    app.router.add_get('/feed', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/feed", state
+    await runner.cleanup()
+
+def test_conditional_headers(feed_cache):
+    """Test validators round-trip into request headers"""
+    url = 'http://example.com/feed'
+    assert feed_cache.conditional_headers(url) == {}
+
+    feed_cache.store(url, etag='"abc"', last_modified='Mon, 02 Dec 2024 10:00:00 GMT',
+                     content=SAMPLE_FEED)
+
+    assert feed_cache.conditional_headers(url) == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Mon, 02 Dec 2024 10:00:00 GMT'
+    }
+    assert feed_cache.is_unchanged(url, SAMPLE_FEED)
+    assert not feed_cache.is_unchanged(url, SAMPLE_FEED + b' ')
+
+@pytest.mark.asyncio
+async def test_not_modified_skips_parsing(feed_cache, feed_server):
+    """Test a 304 response short-circuits the second fetch"""
+    url, state = feed_server
+    fetcher = RSSFeedFetcher(cache=feed_cache)
+
+    async with FetchEngine(min_host_interval=0) as engine:
+        first = await fetcher.fetch_single(url, engine)
+        second = await fetcher.fetch_single(url, engine)
+
+    assert len(first) == 1
+    assert second == []
+    assert state['requests'] == 2
+
+@pytest.mark.asyncio
+async def test_identical_body_skips_parsing(feed_cache, feed_server):
+    """Test an unchanged body is detected by hash when no ETag is sent"""
+    url, state = feed_server
+    state['etag'] = None
+    fetcher = RSSFeedFetcher(cache=feed_cache)
+
+    async with FetchEngine(min_host_interval=0) as engine:
+        first = await fetcher.fetch_single(url, engine)
+        second = await fetcher.fetch_single(url, engine)
+
+    assert len(first) == 1
+    assert second == []
@@ -0,0 +1,44 @@
+import random
+from datetime import datetime, timedelta
+from components.feed_scheduler import FeedScheduler
+
+JOURNALS = [{'Journal Name': 'GRL'}, {'Journal Name': 'Basin Research'}, {'Journal Name': 'New'}]
+
+def make_scheduler():
+    scheduler = FeedScheduler(
+        JOURNALS,
+        min_interval=timedelta(hours=1),
+        max_interval=timedelta(hours=48),
+        default_interval=timedelta(hours=6),
+        rng=random.Random(0)
+    )
+    scheduler.update_cadence({'GRL': timedelta(hours=4), 'Basin Research': timedelta(days=15)})
+    return scheduler
+
+def test_intervals_follow_cadence():
+    """Test busy feeds poll often, quiet ones hit the cap, unknown use the default"""
+    scheduler = make_scheduler()
+
+    assert scheduler.interval('GRL') == timedelta(hours=2)
+    assert scheduler.interval('Basin Research') == timedelta(hours=48)
+    assert scheduler.interval('New') == timedelta(hours=6)
+    # 12 + 0.5 + 4 polls a day instead of 3 feeds every run
+    assert round(scheduler.polls_per_day(), 1) == 16.5
+
+def test_first_polls_are_staggered_and_rescheduled():
+    """Test first polls fall within one interval and come back in order"""
+    scheduler = make_scheduler()
+    now = datetime(2024, 1, 1)
+    scheduler.start(now)
+
+    assert scheduler.due(now) == []
+    assert now < scheduler.next_poll() <= now + timedelta(hours=48)
+
+    later = now + timedelta(hours=48)
+    due = scheduler.due(later)
+    assert sorted(j['Journal Name'] for j in due) == ['Basin Research', 'GRL', 'New']
+    assert scheduler.next_poll() is None
+
+    assert scheduler.reschedule(due[0], later) == later + scheduler.interval(due[0]['Journal Name'])
+    assert scheduler.reschedule(due[1], later, timedelta(minutes=15)) == later + timedelta(minutes=15)
+    assert scheduler.due(later) == []
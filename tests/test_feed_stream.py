@@ -0,0 +1,89 @@
+import pytest
+from datetime import datetime, timezone
+from aiohttp import web
+from components.feed_stream import StreamingFeedParser
+from components.fetch_engine import FetchEngine
+from components.rss_feed_fetcher import RSSFeedFetcher
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Test Journal</title>
+""" + b"".join(
+    b"""    <item>
+      <title>Article %d</title>
+      <link>http://example.com/%d</link>
+      <description>&lt;p&gt;Abstract %d&lt;/p&gt;</description>
+      <dc:creator>Author %d</dc:creator>
+      <pubDate>Mon, 02 Dec 2024 10:00:00 +0100</pubDate>
+    </item>
+""" % (i, i, i, i) for i in range(50)
+) + b"""  </channel>
+</rss>"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Journal</title>
+  <entry>
+    <title>Atom Article</title>
+    <link rel="alternate" href="http://example.com/atom"/>
+    <author><name>Jane Doe</name></author>
+    <updated>2024-12-02T10:00:00Z</updated>
+    <summary>Plain summary</summary>
+  </entry>
+</feed>"""
+
+def _parse_in_chunks(document: bytes, size: int):
+    parser = StreamingFeedParser()
+    articles = []
+    for i in range(0, len(document), size):
+        articles.extend(parser.feed(document[i:i + size]))
+    articles.extend(parser.close())
+    return articles
+
+def test_rss_parsed_incrementally():
+    """Test RSS items are standardized regardless of chunk boundaries"""
+    articles = _parse_in_chunks(RSS_FEED, 7)
+
+    assert len(articles) == 50
+    assert articles[0] == {
+        'title': 'Article 0',
+        'journal': 'Test Journal',
+        'published_date': datetime(2024, 12, 2, 9, 0, tzinfo=timezone.utc),
+        'abstract': 'Abstract 0',
+        'url': 'http://example.com/0',
+        'authors': ['Author 0']
+    }
+
+def test_atom_entries():
+    """Test Atom links, authors and ISO dates"""
+    articles = _parse_in_chunks(ATOM_FEED, 64)
+
+    assert len(articles) == 1
+    assert articles[0]['journal'] == 'Atom Journal'
+    assert articles[0]['url'] == 'http://example.com/atom'
+    assert articles[0]['authors'] == ['Jane Doe']
+    assert articles[0]['published_date'] == datetime(2024, 12, 2, 10, 0, tzinfo=timezone.utc)
+
+@pytest.mark.asyncio
+async def test_stream_single_stops_at_max_articles():
+    """Test max_articles ends the stream early"""
+    async def handler(request):
+        return web.Response(body=RSS_FEED, content_type='application/rss+xml')
+
+    app = web.Application()
+    app.router.add_get('/feed', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        fetcher = RSSFeedFetcher(streaming=True, chunk_size=256,
+                                 engine=FetchEngine(min_host_interval=0))
+        articles = await fetcher.fetch_all([f"http://127.0.0.1:{port}/feed"], max_articles=5)
+    finally:
+        await runner.cleanup()
+
+    assert [a['title'] for a in articles] == [f"Article {i}" for i in range(5)]
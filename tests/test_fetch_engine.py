@@ -0,0 +1,105 @@
+import pytest
+import asyncio
+import aiohttp
+from aiohttp import web
+from components.fetch_engine import FetchEngine
+
+@pytest.fixture
+async def server():
+    """Serve endpoints that track concurrency and simulate failures"""
+    state = {'in_flight': 0, 'max_in_flight': 0, 'flaky_calls': 0, 'forbidden_calls': 0}
+
+    async def slow(request):
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        await asyncio.sleep(0.05)
+        state['in_flight'] -= 1
+        return web.Response(body=b'ok')
+
+    async def sleepy(request):
+        await asyncio.sleep(0.2)
+        return web.Response(body=b'ok')
+
+    async def fast(request):
+        return web.Response(body=b'fast')
+
+    async def flaky(request):
+        state['flaky_calls'] += 1
+        if state['flaky_calls'] < 3:
+            return web.Response(status=503)
+        return web.Response(body=b'recovered')
+
+    async def forbidden(request):
+        state['forbidden_calls'] += 1
+        return web.Response(status=403)
+
+    app = web.Application()
+    app.router.add_get('/slow/{n}', slow)
+    app.router.add_get('/sleepy/{n}', sleepy)
+    app.router.add_get('/fast', fast)
+    app.router.add_get('/flaky', flaky)
+    app.router.add_get('/forbidden', forbidden)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", state
+    await runner.cleanup()
+
+@pytest.mark.asyncio
+async def test_per_host_limit(server):
+    """Test concurrent requests to one host never exceed the per-host cap"""
+    base, state = server
+    async with FetchEngine(per_host_limit=2, min_host_interval=0) as engine:
+        responses = await asyncio.gather(
+            *[engine.fetch(f"{base}/slow/{i}") for i in range(8)]
+        )
+
+    assert all(r.status == 200 for r in responses)
+    assert state['max_in_flight'] == 2
+
+@pytest.mark.asyncio
+async def test_busy_host_does_not_block_other_hosts(server):
+    """Test requests queued for one host do not hold global slots"""
+    base, _ = server
+    other_host = base.replace('127.0.0.1', 'localhost')
+    loop = asyncio.get_running_loop()
+    async with FetchEngine(max_concurrency=4, per_host_limit=1, min_host_interval=0) as engine:
+        busy = [asyncio.create_task(engine.fetch(f"{base}/sleepy/{i}")) for i in range(6)]
+        await asyncio.sleep(0.05)
+        start = loop.time()
+        response = await engine.fetch(f"{other_host}/fast")
+        elapsed = loop.time() - start
+        await asyncio.gather(*busy)
+
+    assert response.body == b'fast'
+    assert elapsed < 0.2
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(server):
+    """Test 5xx responses are retried with backoff"""
+    base, state = server
+    async with FetchEngine(min_host_interval=0, backoff_base=0.01) as engine:
+        response = await engine.fetch(f"{base}/flaky")
+
+    assert response.body == b'recovered'
+    assert state['flaky_calls'] == 3
+
+@pytest.mark.asyncio
+async def test_forbidden_is_not_retried(server):
+    """Test 403 responses fail immediately"""
+    base, state = server
+    async with FetchEngine(min_host_interval=0, backoff_base=0.01) as engine:
+        with pytest.raises(aiohttp.ClientResponseError):
+            await engine.fetch(f"{base}/forbidden")
+
+    assert state['forbidden_calls'] == 1
+
+def test_retry_after_is_capped():
+    """Test an over-long Retry-After is bounded by max_retry_after"""
+    engine = FetchEngine(backoff_base=0.01, max_retry_after=30)
+
+    assert engine._backoff_delay(0, '5') == 5.0
+    assert engine._backoff_delay(0, '86400') == 30.0
+    assert engine._backoff_delay(0, 'soon') < 1.0
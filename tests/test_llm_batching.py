@@ -0,0 +1,68 @@
+import pytest
+from components.llm_batching import chunk, format_articles, parse_batch_response, parse_fused_response
+
+def test_chunk_and_format():
+    """Test articles are grouped and numbered by position"""
+    articles = [{'title': f'T{i}', 'abstract': f'A{i}'} for i in range(5)]
+
+    groups = chunk(articles, 2)
+
+    assert [len(g) for g in groups] == [2, 2, 1]
+    assert format_articles(groups[1]) == "Article 0:\nTitle: T2\nAbstract: A2\n\nArticle 1:\nTitle: T3\nAbstract: A3"
+
+def test_parse_fenced_response():
+    """Test a fenced JSON array is split into per-article fields"""
+    response = """Here you go:
+```json
+[
+  {"id": 1, "summary": "Second", "relevance_score": "0.4", "key_topics": "deltas, avulsion", "reasoning": "r1"},
+  {"id": 0, "summary": "First", "relevance_score": 0.9, "key_topics": ["rivers"], "reasoning": "r0"}
+]
+```"""
+    parsed = parse_batch_response(response, 2)
+
+    assert parsed[0] == {
+        'llm_summary': 'First',
+        'relevance_score': 0.9,
+        'key_topics': ['rivers'],
+        'relevance_reasoning': 'r0'
+    }
+    assert parsed[1]['key_topics'] == ['deltas', 'avulsion']
+    assert parsed[1]['relevance_score'] == 0.4
+
+def test_parse_drops_invalid_items():
+    """Test bad items are omitted so only they get re-requested"""
+    response = """[
+        {"id": 0, "summary": "ok", "relevance_score": 0.5},
+        {"id": 1, "summary": "", "relevance_score": 0.5},
+        {"id": 2, "summary": "score too high", "relevance_score": 7},
+        {"id": 9, "summary": "id out of range", "relevance_score": 0.1},
+        {"summary": "no id", "relevance_score": 0.1}
+    ]"""
+
+    assert list(parse_batch_response(response, 3)) == [0]
+    assert parse_batch_response("not json at all", 3) == {}
+    assert parse_batch_response("[{broken", 3) == {}
+
+def test_parse_fused_response():
+    """Test a single-article object is validated like a batch item"""
+    response = '```json\n{"summary": "Deltas", "relevance_score": "0.7", "key_topics": "deltas", "reasoning": "r"}\n```'
+
+    assert parse_fused_response(response) == {
+        'llm_summary': 'Deltas',
+        'relevance_score': 0.7,
+        'key_topics': ['deltas'],
+        'relevance_reasoning': 'r'
+    }
+
+@pytest.mark.parametrize("response", [
+    'Sorry, I cannot help with that.',
+    '{"summary": "Deltas", "relevance_score": 0.7',
+    '{"summary": "Deltas"}',
+    '{"summary": "", "relevance_score": 0.7}',
+    '{"summary": "Deltas", "relevance_score": 3}',
+])
+def test_parse_fused_response_rejects_bad_output(response):
+    """Test unusable responses raise instead of leaking into the summary"""
+    with pytest.raises(ValueError):
+        parse_fused_response(response)
@@ -0,0 +1,54 @@
+import pytest
+from datetime import datetime, timedelta
+from components.llm_cache import LLMResponseCache
+
+@pytest.fixture
+def llm_cache(tmp_path):
+    """Create a test LLM response cache"""
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.ddb"), max_bytes=1000)
+    yield cache
+    cache.close()
+
+def test_key_depends_on_model_template_and_inputs():
+    """Test every part of the request contributes to the cache key"""
+    key = LLMResponseCache.make_key('gpt-4', 'Summarize {title}', {'title': 'A'})
+
+    assert key == LLMResponseCache.make_key('gpt-4', 'Summarize {title}', {'title': 'A'})
+    assert key != LLMResponseCache.make_key('gpt-3.5-turbo', 'Summarize {title}', {'title': 'A'})
+    assert key != LLMResponseCache.make_key('gpt-4', 'Summarise {title}', {'title': 'A'})
+    assert key != LLMResponseCache.make_key('gpt-4', 'Summarize {title}', {'title': 'B'})
+
+def test_hit_and_miss_counters(llm_cache):
+    """Test cached responses are returned and counted"""
+    assert llm_cache.get('k1') is None
+    llm_cache.set('k1', 'summary')
+
+    assert llm_cache.get('k1') == 'summary'
+    assert llm_cache.stats()['hits'] == 1
+    assert llm_cache.stats()['misses'] == 1
+
+def test_ttl_expiry(llm_cache):
+    """Test entries older than the TTL are treated as misses"""
+    llm_cache.set('k1', 'summary')
+    llm_cache.conn.execute(
+        "UPDATE llm_responses SET created_at = ?", [datetime.now() - timedelta(days=31)]
+    )
+
+    assert llm_cache.get('k1') is None
+    assert llm_cache.stats()['size_bytes'] == 0
+
+def test_lru_eviction(llm_cache):
+    """Test least recently used entries are evicted past max_bytes"""
+    llm_cache.set('old', 'x' * 400)
+    llm_cache.set('recent', 'y' * 400)
+    llm_cache.conn.execute(
+        "UPDATE llm_responses SET last_accessed = ? WHERE key = 'old'",
+        [datetime.now() - timedelta(hours=1)]
+    )
+    llm_cache.set('new', 'z' * 400)
+
+    assert llm_cache.get('old') is None
+    assert llm_cache.get('recent') == 'y' * 400
+    assert llm_cache.get('new') == 'z' * 400
+    assert llm_cache.stats()['evictions'] == 1
+    assert llm_cache.stats()['size_bytes'] == 800
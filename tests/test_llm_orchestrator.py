@@ -0,0 +1,123 @@
+import json
+import pytest
+
+pytest.importorskip("langchain")
+
+from components.llm_cache import LLMResponseCache
+from components.llm_orchestrator import LLMOrchestrator
+from components.llm_scheduler import LLMScheduler
+
+def make_orchestrator(responses, **kwargs):
+    """
+    Orchestrator whose prompts are answered by a stub instead of the API
+
+    responses maps a prompt attribute name ('batch_prompt', 'fused_prompt',
+    ...) to a function of the prompt inputs returning the response text,
+    or raising to simulate a failed call.
+    """
+    orchestrator = LLMOrchestrator(
+        model_name='gpt-4', api_key='test',
+        scheduler=LLMScheduler(requests_per_minute=None, tokens_per_minute=None),
+        **kwargs
+    )
+    calls = []
+
+    async def run_prompt(prompt, **inputs):
+        name = next(attr for attr in responses if getattr(orchestrator, attr) is prompt)
+        calls.append(name)
+        return responses[name](inputs)
+
+    orchestrator._run_prompt = run_prompt
+    return orchestrator, calls
+
+def fused_json(summary='Summary', score=0.8):
+    return json.dumps({'summary': summary, 'relevance_score': score,
+                       'key_topics': ['deltas'], 'reasoning': 'r'})
+
+@pytest.mark.asyncio
+async def test_failing_article_does_not_sink_its_group():
+    """Test only the article whose single-article call fails is marked"""
+    articles = [{'title': f'T{i}', 'abstract': f'A{i}'} for i in range(4)]
+
+    def single(inputs):
+        if inputs['title'] == 'T2':
+            raise RuntimeError('bad request')
+        return fused_json(summary=f"S {inputs['title']}")
+
+    orchestrator, _ = make_orchestrator(
+        {'batch_prompt': lambda inputs: 'not json', 'fused_prompt': single},
+        batch_size=4, fused=True
+    )
+
+    processed = await orchestrator.process_batch(articles)
+
+    assert [article['title'] for article in processed] == ['T0', 'T1', 'T2', 'T3']
+    assert [bool(article.get('llm_error')) for article in processed] == [False, False, True, False]
+    assert processed[0]['llm_summary'] == 'S T0'
+    assert processed[2]['relevance_score'] == 0.0
+
+@pytest.mark.asyncio
+async def test_fused_call_fills_fields():
+    """Test a well-formed fused response is merged in one call"""
+    orchestrator, calls = make_orchestrator({'fused_prompt': lambda inputs: fused_json()}, fused=True)
+
+    article = await orchestrator.process_single({'title': 'T', 'abstract': 'A'})
+
+    assert calls == ['fused_prompt']
+    assert article['llm_summary'] == 'Summary'
+    assert article['relevance_score'] == 0.8
+    assert article['key_topics'] == ['deltas']
+    assert 'llm_error' not in article
+
+@pytest.mark.asyncio
+async def test_unparseable_fused_response_falls_back_to_two_calls():
+    """Test raw model output is never stored as the summary"""
+    raw = '{"summary": "Truncated JSON'
+    relevance = '```json\n' + json.dumps(
+        {'relevance_score': 0.6, 'key_topics': ['rivers'], 'reasoning': 'r'}
+    ) + '\n```'
+    orchestrator, calls = make_orchestrator({
+        'fused_prompt': lambda inputs: raw,
+        'summary_prompt': lambda inputs: 'Two-stage summary',
+        'relevance_prompt': lambda inputs: relevance,
+    }, fused=True)
+
+    article = await orchestrator.process_single({'title': 'T', 'abstract': 'A'})
+
+    assert calls == ['fused_prompt', 'summary_prompt', 'relevance_prompt']
+    assert article['llm_summary'] == 'Two-stage summary'
+    assert article['relevance_score'] == 0.6
+    assert 'llm_error' not in article
+
+class ScriptedScheduler:
+    """Scheduler stub answering each API call with the next scripted response"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def run(self, call, estimated_tokens=0):
+        self.calls += 1
+        return self.responses.pop(0)
+
+@pytest.mark.asyncio
+async def test_unparseable_response_is_not_cached(tmp_path):
+    """Test a response the parser rejects is requested again on the next run"""
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.ddb"))
+    relevance = json.dumps({'relevance_score': 0.7, 'key_topics': ['deltas'], 'reasoning': 'r'})
+    scheduler = ScriptedScheduler(['Summary', 'not json', relevance])
+    orchestrator = LLMOrchestrator(model_name='gpt-4', api_key='test', cache=cache, scheduler=scheduler)
+
+    try:
+        first = await orchestrator.process_single({'title': 'T', 'abstract': 'A'})
+        second = await orchestrator.process_single({'title': 'T', 'abstract': 'A'})
+        third = await orchestrator.process_single({'title': 'T', 'abstract': 'A'})
+    finally:
+        cache.close()
+
+    assert first['llm_error']
+    assert 'llm_error' not in second
+    assert second['relevance_score'] == 0.7
+    assert third['relevance_score'] == 0.7
+    # The summary is served from cache after the first run; the good relevance after the second
+    assert scheduler.calls == 3
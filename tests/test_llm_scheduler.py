@@ -0,0 +1,95 @@
+import pytest
+import asyncio
+import time
+from components.llm_scheduler import LLMScheduler, RateLimiter, is_retryable
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+@pytest.mark.asyncio
+async def test_max_in_flight():
+    """Test concurrent calls never exceed max_in_flight"""
+    scheduler = LLMScheduler(max_in_flight=3, requests_per_minute=None, tokens_per_minute=None)
+    state = {'in_flight': 0, 'peak': 0}
+
+    async def call():
+        state['in_flight'] += 1
+        state['peak'] = max(state['peak'], state['in_flight'])
+        await asyncio.sleep(0.01)
+        state['in_flight'] -= 1
+        return 'ok'
+
+    results = await asyncio.gather(*[scheduler.run(call) for _ in range(10)])
+
+    assert results == ['ok'] * 10
+    assert state['peak'] == 3
+
+@pytest.mark.asyncio
+async def test_retries_rate_limits_only():
+    """Test 429s are retried while 400s fail immediately"""
+    scheduler = LLMScheduler(requests_per_minute=None, tokens_per_minute=None, backoff_base=0.001)
+    attempts = {'n': 0}
+
+    async def rate_limited_then_ok():
+        attempts['n'] += 1
+        if attempts['n'] < 3:
+            raise FakeAPIError(429)
+        return 'ok'
+
+    async def bad_request():
+        raise FakeAPIError(400)
+
+    assert await scheduler.run(rate_limited_then_ok) == 'ok'
+    assert scheduler.retries == 2
+    with pytest.raises(FakeAPIError):
+        await scheduler.run(bad_request)
+    assert scheduler.retries == 2
+
+@pytest.mark.asyncio
+async def test_token_budget_paces_calls():
+    """Test a spent token budget delays the next call until it refills"""
+    limiter = RateLimiter(rate=100, period=0.2)
+    await limiter.acquire(100)
+
+    start = time.monotonic()
+    await limiter.acquire(50)
+
+    assert time.monotonic() - start >= 0.09
+
+@pytest.mark.asyncio
+async def test_map_isolates_failures():
+    """Test one failing item does not discard the others"""
+    scheduler = LLMScheduler()
+
+    async def worker(item):
+        if item == 2:
+            raise ValueError("bad article")
+        return item * 10
+
+    results = await scheduler.map([1, 2, 3], worker)
+
+    assert results[0] == 10 and results[2] == 30
+    assert isinstance(results[1], ValueError)
+
+def test_is_retryable():
+    """Test classification of transient errors"""
+    assert is_retryable(FakeAPIError(503))
+    assert is_retryable(asyncio.TimeoutError())
+    assert not is_retryable(FakeAPIError(401))
+    assert not is_retryable(ValueError())
+
+def test_reusable_across_event_loops():
+    """Test a scheduler built outside any loop works across separate runs"""
+    scheduler = LLMScheduler(max_in_flight=2, requests_per_minute=600, tokens_per_minute=None)
+
+    async def call():
+        await asyncio.sleep(0)
+        return 'ok'
+
+    async def batch():
+        return await asyncio.gather(*[scheduler.run(call) for _ in range(4)])
+
+    assert asyncio.run(batch()) == ['ok'] * 4
+    assert asyncio.run(batch()) == ['ok'] * 4
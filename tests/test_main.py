@@ -0,0 +1,133 @@
+import logging
+import pytest
+
+pytest.importorskip("langchain")
+
+from aiohttp import web
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from components.checkpoints import RunCheckpoints
+from components.data_standardizer import DataStandardizer
+from components.feed_cache import FeedCache
+from components.fetch_engine import FetchEngine
+from components.parse_executor import ParseStage
+from components.rss_feed_fetcher import FetchError, RSSFeedFetcher
+from main import SedRSSSystem
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Journal</title>
+    <item>
+      <title>Sediment Transport in Braided Rivers</title>
+      <link>http://example.com/1</link>
+      <pubDate>Mon, 02 Dec 2024 10:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>"""
+
+class StubFetcher:
+    cache = None
+
+    async def fetch_feed(self, journal, engine, max_articles=None):
+        if journal['Journal Name'] == 'Broken':
+            raise BrokenProcessPool("parse worker died")
+        if journal['Journal Name'] == 'Offline':
+            raise FetchError("Failed to fetch feed: connection refused")
+        return [{'title': f"{journal['Journal Name']} article", 'journal': journal['Journal Name'],
+                 'published_date': '2024-12-02T10:00:00Z', 'url': f"http://example.com/{journal['Journal Name']}"}]
+
+class StubArticleDatabase:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.stored = []
+
+    def store(self, articles):
+        if self.failures or any(article['journal'] == 'Locked' for article in articles):
+            self.failures = max(0, self.failures - 1)
+            raise RuntimeError("database is locked")
+        self.stored.extend(articles)
+
+def make_system(fetcher, article_db):
+    system = SedRSSSystem.__new__(SedRSSSystem)
+    system.logger = logging.getLogger(__name__)
+    system.rss_fetcher = fetcher
+    system.data_standardizer = DataStandardizer()
+    system.article_db = article_db
+    return system
+
+@pytest.fixture
+async def feed_server():
+    """Serve a feed that honours If-None-Match"""
+    async def handler(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(body=SAMPLE_FEED, headers={'ETag': '"v1"'},
+                            content_type='application/rss+xml')
+
+    app = web.Application()
+    app.router.add_get('/feed', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/feed"
+    await runner.cleanup()
+
+@pytest.mark.asyncio
+async def test_poll_feeds_isolates_failing_journals():
+    """Test fetch and store errors fail only their own journal"""
+    system = make_system(StubFetcher(), StubArticleDatabase())
+    journals = [{'Journal Name': name, 'RSS URL': f"http://example.com/{name}"}
+                for name in ('Geology', 'Broken', 'Offline', 'Locked', 'Sedimentology')]
+
+    stored, failed = await system.poll_feeds(journals, engine=None)
+
+    assert stored == 2
+    assert [journal['Journal Name'] for journal in failed] == ['Broken', 'Offline', 'Locked']
+    assert sorted(article['journal'] for article in system.article_db.stored) == ['Geology', 'Sedimentology']
+
+@pytest.mark.asyncio
+async def test_failed_store_is_recovered_on_retry(tmp_path, feed_server):
+    """Test a failed store does not leave validators that hide the articles from the retry"""
+    cache = FeedCache(str(tmp_path / "feed_cache.ddb"))
+    fetcher = RSSFeedFetcher(csv_file=None, cache=cache, parse_stage=ParseStage(workers=0))
+    article_db = StubArticleDatabase(failures=1)
+    system = make_system(fetcher, article_db)
+    journals = [{'Journal Name': 'Geology', 'RSS URL': feed_server, 'Format': ''}]
+
+    try:
+        async with FetchEngine(min_host_interval=0) as engine:
+            stored, failed = await system.poll_feeds(journals, engine)
+            assert (stored, len(failed)) == (0, 1)
+
+            stored, failed = await system.poll_feeds(journals, engine)
+    finally:
+        cache.close()
+
+    assert (stored, failed) == (1, [])
+    assert len(article_db.stored) == 1
+
+@pytest.mark.asyncio
+async def test_resumed_stage_has_typed_dates(tmp_path):
+    """Test a resumed run hands later stages datetimes, not ISO strings"""
+    system = make_system(StubFetcher(), StubArticleDatabase())
+    system.checkpoints = RunCheckpoints(str(tmp_path / "checkpoints.ddb"))
+
+    async def standardize():
+        return system.data_standardizer.standardize(
+            await system.rss_fetcher.fetch_feed({'Journal Name': 'Geology'}, None)
+        )
+
+    async def unreachable():
+        raise AssertionError("stage should be resumed from its checkpoint")
+
+    try:
+        fresh = await system._checkpointed('run-1', 'standardized', standardize)
+        resumed = await system._checkpointed('run-1', 'standardized', unreachable)
+    finally:
+        system.checkpoints.close()
+
+    assert isinstance(resumed[0]['published_date'], datetime)
+    assert resumed[0]['published_date'] == fresh[0]['published_date']
@@ -13,6 +13,7 @@ def memory_manager(test_db_path):
     """Create a test memory manager instance"""
     manager = MemoryManager(test_db_path)
     yield manager
+    manager.close()
     # Cleanup
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
@@ -71,4 +72,186 @@ async def test_cleanup_old_entries(memory_manager, sample_articles):
     # Should only get recent articles
     results = await memory_manager.get_relevant_context(n_results=10)
     assert len(results) == 2
-    assert all(r['title'] != 'Old Article' for r in results) 
\ No newline at end of file
+    assert all(r['title'] != 'Old Article' for r in results)
+
+@pytest.mark.asyncio
+async def test_semantic_context(tmp_path, sample_articles):
+    """Test a query retrieves articles by summary similarity"""
+    manager = MemoryManager(str(tmp_path / "semantic.ddb"),
+                            vector_store_path=str(tmp_path / "vectors"))
+    sample_articles[1]['llm_summary'] = 'Delta avulsion driven by sediment supply'
+    await manager.update(sample_articles)
+
+    results = await manager.get_relevant_context(n_results=1, query='avulsion on deltas')
+
+    assert [r['title'] for r in results] == ['Test Article 2']
+    assert results[0]['similarity'] > 0
+
+@pytest.mark.asyncio
+async def test_upsert_dedups_across_runs(test_db_path, sample_articles):
+    """Test IDs are stable across instances so re-stored articles are replaced"""
+    first = MemoryManager(test_db_path)
+    await first.update(sample_articles)
+    first.close()
+
+    sample_articles[0]['relevance_score'] = 0.95
+    second = MemoryManager(test_db_path)
+    await second.update(sample_articles)
+
+    assert second.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 2
+    assert second.conn.execute("SELECT MAX(relevance_score) FROM articles").fetchone()[0] == 0.95
+
+def test_ids_prefer_doi_then_url(memory_manager):
+    """Test the same DOI gives the same ID regardless of host or title"""
+    by_doi = memory_manager._generate_article_id(
+        {'title': 'A', 'url': 'https://agupubs.onlinelibrary.wiley.com/doi/10.1029/2024GL1'})
+    same_doi = memory_manager._generate_article_id(
+        {'title': 'B', 'url': 'https://onlinelibrary.wiley.com/doi/10.1029/2024gl1'})
+    by_title = memory_manager._generate_article_id(
+        {'title': 'Deltas!', 'published_date': '2024-01-02T10:00:00'})
+    same_title = memory_manager._generate_article_id(
+        {'title': 'deltas', 'published_date': '2024-01-02 18:30:00'})
+
+    assert by_doi == same_doi
+    assert by_title == same_title
+    assert by_doi != by_title
+
+def test_migrates_legacy_hash_ids(test_db_path):
+    """Test duplicate rows keyed by hash() collapse to one row per article"""
+    import duckdb
+    conn = duckdb.connect(test_db_path)
+    conn.execute("""
+        CREATE TABLE articles (
+            id VARCHAR PRIMARY KEY, title VARCHAR, journal VARCHAR,
+            published_date TIMESTAMP, relevance_score DOUBLE,
+            summary VARCHAR, processed_date TIMESTAMP
+        )
+    """)
+    conn.executemany("INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)", [
+        ('111', 'Deltas', 'Geology', '2024-01-02', 0.5, 'old', '2024-01-03'),
+        ('222', 'Deltas', 'Geology', '2024-01-02', 0.7, 'new', '2024-01-10'),
+        ('333', 'Rivers', 'Geology', '2024-01-05', 0.6, 'only', '2024-01-06'),
+    ])
+    conn.close()
+
+    manager = MemoryManager(test_db_path)
+    rows = manager.conn.execute(
+        "SELECT id, title, summary FROM articles ORDER BY title"
+    ).fetchall()
+
+    assert [(title, summary) for _, title, summary in rows] == [('Deltas', 'new'), ('Rivers', 'only')]
+    assert rows[0][0] == manager._generate_article_id(
+        {'title': 'Deltas', 'published_date': '2024-01-02'})
+
+@pytest.mark.asyncio
+async def test_update_frame_native_timestamps(memory_manager):
+    """Test the bulk path stores native timestamps and keeps the last duplicate"""
+    import pandas as pd
+    await memory_manager.update_frame(pd.DataFrame({
+        'id': ['a', 'a', 'b'],
+        'title': ['First', 'First again', 'Second'],
+        'journal': ['Geology'] * 3,
+        'published_date': ['2024-01-02T10:00:00+02:00', '2024-01-02T10:00:00+02:00', None],
+        'relevance_score': [0.1, 0.2, 0.3],
+        'summary': ['s1', 's2', 's3'],
+    }))
+
+    rows = memory_manager.conn.execute(
+        "SELECT id, title, published_date FROM articles ORDER BY id"
+    ).fetchall()
+    assert rows == [('a', 'First again', datetime(2024, 1, 2, 8, 0)), ('b', 'Second', None)]
+
+@pytest.mark.asyncio
+async def test_archive_old_entries(tmp_path, test_db_path):
+    """Test old rows move to partitioned Parquet and stay queryable"""
+    import pandas as pd
+    archive_path = str(tmp_path / "archive")
+    manager = MemoryManager(test_db_path, archive_path=archive_path)
+    now = datetime.now()
+    await manager.update_frame(pd.DataFrame({
+        'id': ['old', 'recent'],
+        'title': ['Old Article', 'Recent Article'],
+        'journal': ['Geology', 'Geology'],
+        'published_date': [now - timedelta(days=200), now - timedelta(days=1)],
+        'relevance_score': [0.9, 0.5],
+        'summary': ['old summary', 'recent summary'],
+        'processed_date': [now - timedelta(days=199), now],
+    }))
+
+    assert await manager.archive_old_entries(days=90) == 1
+    assert await manager.archive_old_entries(days=90) == 0
+
+    old = now - timedelta(days=200)
+    assert os.listdir(os.path.join(archive_path, f"year={old.year}")) == [f"month={old.month}"]
+    assert manager.conn.execute("SELECT id FROM articles").fetchall() == [('recent',)]
+
+    recent = await manager.get_relevant_context(n_results=5, days_back=14)
+    history = await manager.get_relevant_context(n_results=5, days_back=365)
+    assert [r['id'] for r in recent] == ['recent']
+    assert [r['id'] for r in history] == ['old', 'recent']
+
+    # Reopening finds the archive, and a re-processed row shadows its archived copy
+    manager.close()
+    reopened = MemoryManager(test_db_path, archive_path=archive_path)
+    await reopened.update_frame(pd.DataFrame({
+        'id': ['old'], 'title': ['Old Article'], 'journal': ['Geology'],
+        'published_date': [old], 'relevance_score': [0.1], 'summary': ['redone'],
+    }))
+    history = await reopened.get_relevant_context(n_results=5, days_back=365)
+    assert [(r['id'], r['summary']) for r in history] == [('recent', 'recent summary'), ('old', 'redone')]
+    reopened.close()
+
+@pytest.mark.asyncio
+async def test_queries_do_not_block_event_loop(memory_manager, sample_articles):
+    """Test database work runs off the loop and close is idempotent"""
+    import asyncio
+    import threading
+    loop_thread = threading.get_ident()
+    threads = await asyncio.gather(*[
+        memory_manager.db.run(lambda cursor: threading.get_ident()) for _ in range(8)
+    ])
+    writer = await memory_manager.db.run_write(lambda cursor: threading.get_ident())
+
+    assert loop_thread not in threads and writer != loop_thread
+    await asyncio.gather(memory_manager.update(sample_articles),
+                         memory_manager.get_relevant_context())
+    assert len(await memory_manager.get_relevant_context()) == 2
+
+    memory_manager.db.close()
+    memory_manager.db.close()
+    with pytest.raises(RuntimeError):
+        await memory_manager.get_relevant_context()
+
+@pytest.mark.asyncio
+async def test_llm_score_and_abstract_stored_for_training(memory_manager, sample_articles):
+    """Test the LLM's score and the abstract are kept beside the final score"""
+    articles = [dict(article, llm_relevance=0.2, abstract=f"Abstract {i}")
+                for i, article in enumerate(sample_articles)]
+    await memory_manager.update(articles)
+
+    rows = memory_manager.conn.execute(
+        "SELECT relevance_score, llm_relevance, abstract FROM articles ORDER BY title"
+    ).fetchall()
+    assert rows == [(0.9, 0.2, 'Abstract 0'), (0.7, 0.2, 'Abstract 1')]
+
+def test_adds_training_columns_to_existing_table(test_db_path):
+    """Test tables created before llm_relevance existed gain the new columns"""
+    import duckdb
+    conn = duckdb.connect(test_db_path)
+    conn.execute("""
+        CREATE TABLE articles (
+            id VARCHAR PRIMARY KEY, title VARCHAR, journal VARCHAR,
+            published_date TIMESTAMP, relevance_score DOUBLE,
+            summary VARCHAR, processed_date TIMESTAMP, url VARCHAR, doi VARCHAR
+        )
+    """)
+    conn.execute("INSERT INTO articles VALUES ('a', 'Deltas', 'Geology', NULL, 0.5, 's', NULL, NULL, NULL)")
+    conn.close()
+
+    manager = MemoryManager(test_db_path)
+    try:
+        assert manager.conn.execute(
+            "SELECT title, llm_relevance, abstract FROM articles"
+        ).fetchall() == [('Deltas', None, None)]
+    finally:
+        manager.close()
@@ -0,0 +1,81 @@
+import pytest
+from components.near_duplicates import NearDuplicateIndex, shingles
+
+ABSTRACT = (
+    "We use repeat lidar surveys and numerical modelling to show that avulsion "
+    "frequency on the lower Yellow River delta scales with sediment supply and "
+    "backwater length, and that engineered channels shorten the avulsion cycle."
+)
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "near_duplicates.ddb")
+
+@pytest.fixture
+def dedup(index_path):
+    """Create a test near-duplicate index"""
+    index = NearDuplicateIndex(index_path)
+    yield index
+    index.close()
+
+def make_article(url, title="Avulsion frequency on the Yellow River delta", abstract=ABSTRACT):
+    return {'url': url, 'title': title, 'abstract': abstract}
+
+def test_cross_feed_copies_clustered(dedup):
+    """Test the same paper under another host and a retitled version are duplicates"""
+    original = make_article('https://agupubs.onlinelibrary.wiley.com/doi/10.1029/2024GL1')
+    mirror = make_article('https://onlinelibrary.wiley.com/doi/10.1029/2024GL1')
+    preprint = make_article('https://eartharxiv.org/repository/view/1',
+                            title="Avulsion frequency on the Yellow River Delta (preprint)")
+    unrelated = make_article('https://example.org/glacier', title="Glacier retreat",
+                             abstract="Ice sheet mass balance from satellite gravimetry over two decades.")
+
+    unique, duplicates = dedup.deduplicate([original, mirror, preprint, unrelated])
+
+    assert unique == [original, unrelated]
+    assert [d['url'] for d in duplicates] == [mirror['url'], preprint['url']]
+    assert duplicates[0]['duplicate_of'] == duplicates[1]['duplicate_of']
+
+def test_clusters_persist_between_runs(index_path):
+    """Test a later run keeps the original and drops copies seen before"""
+    original = make_article('https://a.example/1')
+    copy = make_article('https://b.example/1')
+    first = NearDuplicateIndex(index_path)
+    first.deduplicate([original])
+    first.close()
+
+    second = NearDuplicateIndex(index_path)
+    unique, duplicates = second.deduplicate([original, copy])
+    second.close()
+
+    # Re-fetching the same article is not a duplicate of itself
+    assert unique == [original]
+    assert len(duplicates) == 1
+
+def test_shingles_and_empty_text(dedup):
+    """Test short texts still shingle and empty ones pass through"""
+    assert shingles("River Delta") == {"river delta"}
+    article = make_article('https://example.org/empty', title='', abstract='')
+
+    assert dedup.deduplicate([article]) == ([article], [])
+
+def test_legacy_signatures_reset(tmp_path):
+    """Test signatures keyed by the old URL hash are dropped once, not on every open"""
+    db_path = str(tmp_path / "legacy_dedup.ddb")
+    index = NearDuplicateIndex(db_path)
+    article = make_article('https://example.com/1')
+    index.deduplicate([article])
+    index.conn.execute("DELETE FROM index_meta")
+    index.close()
+
+    index = NearDuplicateIndex(db_path)
+    assert index.conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0] == 0
+    index.deduplicate([article])
+    index.close()
+
+    index = NearDuplicateIndex(db_path)
+    try:
+        assert index.conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0] == 1
+        assert index.deduplicate([article]) == ([article], [])
+    finally:
+        index.close()
@@ -0,0 +1,39 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from components.parse_executor import ParseStage, parse_feed_body, clean_abstracts
+from tests.test_feed_cache import SAMPLE_FEED
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stage_kwargs", [{'workers': 0}, {'workers': 2}])
+async def test_parse_feed_body_in_stage(stage_kwargs):
+    """Test feeds parse identically inline and in a process pool"""
+    stage = ParseStage(**stage_kwargs)
+    try:
+        articles, error = await stage.run(parse_feed_body, SAMPLE_FEED)
+    finally:
+        stage.shutdown()
+
+    assert error is None
+    assert len(articles) == 1
+    assert articles[0]['title'] == 'Sediment Transport in Braided Rivers'
+    assert articles[0]['abstract'] == 'Test abstract'
+
+@pytest.mark.asyncio
+async def test_external_executor_not_shut_down():
+    """Test a caller-supplied executor is left running"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    stage = ParseStage(executor=executor)
+
+    cleaned = await stage.run(clean_abstracts, [{'abstract': '<b>Bold</b> text'}])
+    stage.shutdown()
+
+    assert cleaned == [{'abstract': 'Bold text'}]
+    assert executor.submit(lambda: 1).result() == 1
+    executor.shutdown()
+
+def test_malformed_feed_reports_error():
+    """Test bozo feeds return an error instead of raising in the worker"""
+    articles, error = parse_feed_body(b'<rss><channel><item>')
+
+    assert articles == []
+    assert error.startswith('Feed parsing error')
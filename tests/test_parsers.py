@@ -0,0 +1,113 @@
+import pytest
+import feedparser
+from datetime import datetime, timezone
+from parser_factory import registry, get_parser, JournalParser
+from parser_format1 import parse_format_1
+from feed_profiles import CompiledProfile, ProfileError
+
+SCIENCEDIRECT_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>ScienceDirect Publication: Geomorphology</title>
+    <item>
+      <title>Bar migration in a braided river</title>
+      <link>https://www.sciencedirect.com/science/article/pii/S0169555X24000001</link>
+      <description>&lt;p&gt;Publication date: 1 March 2025&lt;/p&gt;&lt;p&gt;&lt;b&gt;Source:&lt;/b&gt; Geomorphology, Volume 472&lt;/p&gt;&lt;p&gt;Author(s): Jane Doe, John Smith&lt;/p&gt;</description>
+    </item>
+  </channel>
+</rss>"""
+
+WILEY_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/">
+  <channel>
+    <title>Wiley: Basin Research: Table of Contents</title>
+    <item>
+      <title>Delta avulsion &amp;amp; stratigraphy</title>
+      <link>https://onlinelibrary.wiley.com/doi/10.1111/bre.70001</link>
+      <description>Abstract text</description>
+      <author>Jane Doe, John Smith</author>
+      <pubDate>Mon, 02 Dec 2024 10:00:00 GMT</pubDate>
+      <prism:doi>10.1111/bre.70001</prism:doi>
+    </item>
+    <item>
+      <link>https://onlinelibrary.wiley.com/doi/10.1111/bre.70002</link>
+    </item>
+  </channel>
+</rss>"""
+
+def test_format_1_entry():
+    """Test ScienceDirect descriptions are mined with the precompiled regexes"""
+    entry = feedparser.parse(SCIENCEDIRECT_FEED).entries[0]
+    article = parse_format_1(entry, 'Geomorphology')
+
+    assert article['published_date'] == datetime(2025, 3, 1, tzinfo=timezone.utc)
+    assert article['authors'] == ['Jane Doe', 'John Smith']
+    assert article['journal'] == 'Geomorphology'
+
+def test_resolve_once_and_parse_batch():
+    """Test a resolved parser handles a whole feed and skips bad entries"""
+    entries = feedparser.parse(WILEY_FEED).entries
+    parser = registry.resolve('2', 'Basin Research')
+
+    assert isinstance(parser, JournalParser)
+    articles = parser.parse_entries(entries)
+
+    assert len(articles) == 1  # second entry has no title
+    assert articles[0]['journal'] == 'Basin Research'
+    assert articles[0]['doi'] == '10.1111/bre.70001'
+    assert articles[0]['authors'] == ['Jane Doe', 'John Smith']
+    assert articles[0]['published_date'] == datetime(2024, 12, 2, 10, 0, tzinfo=timezone.utc)
+    assert parser.entries_parsed == 1
+    assert parser.seconds_per_entry > 0
+
+def test_unknown_format():
+    """Test unknown formats resolve to None"""
+    assert registry.resolve(99, 'Unknown') is None
+    assert get_parser(1) is parse_format_1
+
+def test_profile_matches_module_parser():
+    """Test the sciencedirect profile extracts the same metadata as format 1"""
+    entry = feedparser.parse(SCIENCEDIRECT_FEED).entries[0]
+    article = registry.resolve('sciencedirect', 'Geomorphology').parse_entries([entry])[0]
+
+    assert article['published_date'] == datetime(2025, 3, 1, tzinfo=timezone.utc)
+    assert article['authors'] == ['Jane Doe', 'John Smith']
+    assert article['summary'] == 'Source: Geomorphology, Volume 472'
+    assert article['journal'] == 'Geomorphology'
+
+def test_profile_from_spec():
+    """Test a new journal can be described without a parser module"""
+    profile = CompiledProfile('wiley_test', {
+        'fields': {
+            'authors': {'from': ['author'], 'split': ',\\s*'},
+            'summary': {'from': ['summary'], 'max_length': 5}
+        }
+    })
+    entry = feedparser.parse(WILEY_FEED).entries[0]
+    article = profile(entry, 'Basin Research')
+
+    assert article['title'] == 'Delta avulsion & stratigraphy'
+    assert article['authors'] == ['Jane Doe', 'John Smith']
+    assert article['summary'] == 'Abstr...'
+    assert article['doi'] == '10.1111/bre.70001'
+
+def test_invalid_profile():
+    """Test unknown fields and bad regexes are rejected at compile time"""
+    with pytest.raises(ProfileError):
+        CompiledProfile('bad', {'fields': {'volume': {'from': ['volume']}}})
+    with pytest.raises(ProfileError):
+        CompiledProfile('bad', {'fields': {'title': {'from': ['title'], 'pattern': '('}}})
+
+def test_format_dates_go_through_normalizer():
+    """Test string dates from format parsers and profiles use the shared normalizer"""
+    from components.date_normalizer import normalizer
+
+    entry = feedparser.parse(SCIENCEDIRECT_FEED).entries[0]
+    parse_format_1(entry, 'Normalizer Test Journal')
+    assert normalizer.feed_formats['Normalizer Test Journal'] == '%d %B %Y'
+
+    profile = CompiledProfile('partial', {
+        'fields': {'published_date': {'from': ['description'], 'pattern': 'Published: (.+)'}}
+    })
+    entry = {'title': 'T', 'description': 'Published: March 2025'}
+    assert profile(entry, 'Partial Journal')['published_date'] == datetime(2025, 3, 1, tzinfo=timezone.utc)
@@ -0,0 +1,96 @@
+import asyncio
+import time
+import pytest
+from components.pipeline import Pipeline, PipelineError
+
+async def numbers(n, delay=0.0, produced=None):
+    for i in range(n):
+        if delay:
+            await asyncio.sleep(delay)
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+@pytest.mark.asyncio
+async def test_stages_transform_all_items():
+    """Test every item passes through every stage, in batches"""
+    batch_sizes = []
+
+    async def double(batch):
+        batch_sizes.append(len(batch))
+        return [item * 2 for item in batch]
+
+    async def increment(batch):
+        return [item + 1 for item in batch]
+
+    pipeline = (Pipeline(maxsize=5)
+                .add_stage('double', double, batch_size=4, batch_timeout=0.05)
+                .add_stage('increment', increment, workers=3))
+    results = await pipeline.run(numbers(10))
+
+    assert sorted(results) == [i * 2 + 1 for i in range(10)]
+    assert max(batch_sizes) <= 4
+    assert pipeline.stats()['increment']['items_out'] == 10
+
+@pytest.mark.asyncio
+async def test_downstream_starts_before_source_finishes():
+    """Test the first item is processed while the source is still producing"""
+    produced, seen_at = [], []
+
+    async def record(batch):
+        seen_at.append(len(produced))
+        return batch
+
+    await Pipeline().add_stage('record', record).run(numbers(5, delay=0.02, produced=produced))
+
+    assert seen_at[0] < 5
+
+@pytest.mark.asyncio
+async def test_backpressure_bounds_queued_items():
+    """Test a slow stage holds the source back instead of buffering everything"""
+    produced = []
+    slow_done = [0]
+    max_ahead = 0
+
+    async def slow(batch):
+        nonlocal max_ahead
+        await asyncio.sleep(0.01)
+        max_ahead = max(max_ahead, len(produced) - slow_done[0])
+        slow_done[0] += len(batch)
+        return batch
+
+    await Pipeline(maxsize=2).add_stage('slow', slow).run(numbers(20, produced=produced))
+
+    # Queue capacity plus the item in hand and the one being put
+    assert max_ahead <= 4
+
+@pytest.mark.asyncio
+async def test_failed_batch_fails_run():
+    """Test a failing batch lets the rest flow through but fails the run"""
+    async def flaky(batch):
+        if 3 in batch:
+            raise ValueError("bad item")
+        return batch
+
+    pipeline = Pipeline().add_stage('flaky', flaky)
+    with pytest.raises(PipelineError) as error:
+        await pipeline.run(numbers(6))
+
+    assert sorted(error.value.results) == [0, 1, 2, 4, 5]
+    assert pipeline.stats()['flaky']['errors'] == 1
+
+@pytest.mark.asyncio
+async def test_overlap_shortens_run():
+    """Test concurrent stages take about as long as the slowest path"""
+    async def sleepy(batch):
+        await asyncio.sleep(0.05)
+        return batch
+
+    start = time.perf_counter()
+    await (Pipeline()
+           .add_stage('a', sleepy, workers=5)
+           .add_stage('b', sleepy, workers=5)
+           .run(numbers(5)))
+
+    # Sequential stages would take 2 x 5 x 0.05 = 0.5s
+    assert time.perf_counter() - start < 0.3
@@ -0,0 +1,78 @@
+import pytest
+import duckdb
+from components.prefilter import RelevanceCascade
+from components.relevance_scorer import RelevanceScorer
+
+RELEVANT = "Sediment flux and bedload transport in braided gravel channels"
+IRRELEVANT = "Protein folding kinetics measured in yeast cell cultures"
+
+@pytest.fixture
+def cascade():
+    """Create a cascade whose keywords match none of the training texts"""
+    return RelevanceCascade(
+        keyword_scorer=RelevanceScorer(keywords=["avulsion"]),
+        min_training_rows=10
+    )
+
+@pytest.fixture
+def history():
+    """Past LLM-scored articles: (text, relevance_score)"""
+    rows = []
+    for i in range(20):
+        rows.append((f"{RELEVANT} study {i}", 0.9))
+        rows.append((f"{IRRELEVANT} study {i}", 0.1))
+    return rows
+
+def make_article(title):
+    return {'title': title, 'abstract': ''}
+
+def test_untrained_cascade_passes_everything(cascade):
+    """Test articles reach the LLM until there is history to train on"""
+    articles = [make_article(RELEVANT), make_article(IRRELEVANT)]
+    passed, rejected, report = cascade.filter(articles)
+
+    assert passed == articles
+    assert rejected == []
+    assert report['model_trained'] is False
+
+def test_keyword_match_skips_model(cascade, history):
+    """Test tier 1 keyword matches are never rejected by the model"""
+    cascade.fit([text for text, _ in history], [score for _, score in history])
+    article = make_article(f"Avulsion and {IRRELEVANT}")
+    passed, rejected, report = cascade.filter([article])
+
+    assert passed == [article]
+    assert report['keyword_passed'] == 1
+
+def test_model_rejects_irrelevant(cascade, history):
+    """Test the trained model filters articles unlike past relevant ones"""
+    assert cascade.fit([text for text, _ in history], [score for _, score in history])
+    passed, rejected, report = cascade.filter([
+        make_article(RELEVANT), make_article(IRRELEVANT)
+    ])
+
+    assert [a['title'] for a in passed] == [RELEVANT]
+    assert rejected[0]['title'] == IRRELEVANT
+    assert rejected[0]['relevance_score'] == 0.0
+    assert report['model_rejected'] == 1
+    assert report['sent_to_llm'] == 1
+    assert report['estimated_savings'] == pytest.approx(cascade.llm_cost_per_article)
+
+def test_fit_from_db(cascade, history):
+    """Test training uses stored LLM scores and the title + abstract text"""
+    conn = duckdb.connect(':memory:')
+    conn.execute("""
+        CREATE TABLE articles (title VARCHAR, abstract VARCHAR, summary VARCHAR,
+                               relevance_score DOUBLE, llm_relevance DOUBLE)
+    """)
+    # relevance_score holds the final keyword score, inverted here so that
+    # training on it instead of llm_relevance would flip the model
+    conn.executemany("INSERT INTO articles VALUES (?, ?, ?, ?, ?)",
+                     [('Study', text, 'LLM summary', 1 - score, score) for text, score in history])
+
+    assert cascade.fit_from_db(conn)
+    assert cascade.filter([{'title': 'Study', 'abstract': IRRELEVANT}])[2]['model_rejected'] == 1
+    assert cascade.filter([{'title': 'Study', 'abstract': RELEVANT}])[2]['model_passed'] == 1
+
+    assert cascade.fit_from_db(conn)
+    assert cascade.filter([make_article(IRRELEVANT)])[2]['model_rejected'] == 1
@@ -0,0 +1,51 @@
+import pytest
+from components.relevance_scorer import RelevanceScorer
+
+@pytest.fixture
+def articles():
+    """Create articles with and without keyword matches"""
+    return [
+        {'title': 'Sediment Transport in Rivers', 'abstract': 'Bedload on a delta.', 'journal': 'Geology'},
+        {'title': 'Riverine carbon', 'abstract': 'Sedimentary rocks.', 'journal': 'Geology'},
+        {'title': 'Protein folding', 'abstract': None, 'journal': 'Nature'},
+    ]
+
+def test_word_boundary_and_phrase_matching(articles):
+    """Test terms match whole words and phrases match across tokens"""
+    scorer = RelevanceScorer(keywords=["sediment transport", "river", "delta"])
+    scores = scorer.scores(articles)
+
+    # "Rivers" is not "river"; the phrase and "delta" match
+    assert scores[0] == pytest.approx(2 / 3)
+    # "Riverine" and "Sedimentary" must not match
+    assert scores[1] == 0.0
+    assert scores[2] == 0.0
+
+def test_weighted_terms(articles):
+    """Test matched weight is normalised by total weight"""
+    scorer = RelevanceScorer(keywords={"sediment transport": 3.0, "avulsion": 1.0})
+
+    assert scorer.scores(articles)[0] == pytest.approx(0.75)
+
+def test_impact_factor_boost():
+    """Test higher-impact journals score higher for the same text, within [0, 1]"""
+    scorer = RelevanceScorer(
+        keywords=["delta"],
+        impact_factors={"Nature": 49.962, "Geology": 5.399},
+        impact_weight=0.5
+    )
+    batch = [{'title': 'Delta', 'abstract': '', 'journal': journal}
+             for journal in ("Nature", "Geology", "Unknown")]
+    nature, geology, unknown = scorer.scores(batch)
+
+    assert nature == pytest.approx(1.0)
+    assert nature > geology > unknown
+    assert unknown == pytest.approx(1 / 1.5)
+
+def test_score_returns_copies(articles):
+    """Test score keeps its contract of returning new dicts"""
+    scored = RelevanceScorer(keywords=["delta"]).score(articles)
+
+    assert 'relevance_score' not in articles[0]
+    assert scored[0]['relevance_score'] == 1.0
+    assert RelevanceScorer(keywords=["delta"]).scores([]).shape == (0,)
@@ -0,0 +1,153 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from aiohttp import web
+from components.fetch_engine import FetchEngine
+from components.parse_executor import ParseStage
+from components.rss_feed_fetcher import RSSFeedFetcher, load_journals
+
+WILEY_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/">
+  <channel>
+    <title>Wiley: Basin Research: Table of Contents</title>
+    <item>
+      <title>Delta avulsion and stratigraphy</title>
+      <link>https://onlinelibrary.wiley.com/doi/10.1111/bre.70001</link>
+      <description>Abstract text</description>
+      <author>Jane Doe, John Smith</author>
+      <pubDate>Mon, 02 Dec 2024 10:00:00 GMT</pubDate>
+      <prism:doi>10.1111/bre.70001</prism:doi>
+    </item>
+  </channel>
+</rss>"""
+
+@pytest.fixture
+async def feed_server():
+    """Serve a Wiley-style feed, a generic feed and a forbidden one"""
+    async def feed(request):
+        return web.Response(body=WILEY_FEED, content_type='application/rss+xml')
+
+    async def forbidden(request):
+        return web.Response(status=403)
+
+    async def not_modified(request):
+        return web.Response(status=304)
+
+    app = web.Application()
+    app.router.add_get('/wiley', feed)
+    app.router.add_get('/generic', feed)
+    app.router.add_get('/forbidden', forbidden)
+    app.router.add_get('/not-modified', not_modified)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+@pytest.fixture
+def threaded_feed_server():
+    """Serve the same feeds from a thread, for tests that own the event loop"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/forbidden':
+                self.send_response(403)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.send_header('Content-Length', str(len(WILEY_FEED)))
+            self.end_headers()
+            self.wfile.write(WILEY_FEED)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def write_journals(path, base_url):
+    path.write_text(
+        "Journal Name,RSS URL,Format\n"
+        f"Basin Research,{base_url}/wiley,2\n"
+        f"Generic Journal,{base_url}/generic,\n"
+        f"Closed Journal,{base_url}/forbidden,2\n"
+    )
+    return str(path)
+
+def test_load_journals(tmp_path):
+    """Test journal rows are read from CSV and a missing file yields none"""
+    csv_file = write_journals(tmp_path / "journals.csv", "http://example.com")
+    journals = load_journals(csv_file)
+    assert [journal['Journal Name'] for journal in journals] == [
+        'Basin Research', 'Generic Journal', 'Closed Journal'
+    ]
+    assert journals[0]['Format'] == '2'
+    assert load_journals(str(tmp_path / "missing.csv")) == []
+
+@pytest.mark.asyncio
+async def test_fetch_all_dispatches_formats(tmp_path, feed_server):
+    """Test each journal is parsed by its format parser and timed"""
+    fetcher = RSSFeedFetcher(csv_file=write_journals(tmp_path / "journals.csv", feed_server),
+                             parse_stage=ParseStage(workers=0))
+
+    articles = await fetcher.fetch_all()
+
+    by_journal = {article['journal']: article for article in articles}
+    assert len(articles) == 2
+    formatted = by_journal['Basin Research']
+    assert formatted['doi'] == '10.1111/bre.70001'
+    assert formatted['url'] == 'https://onlinelibrary.wiley.com/doi/10.1111/bre.70001'
+    assert formatted['authors'] == ['Jane Doe', 'John Smith']
+
+    report = {timing.name: timing for timing in fetcher.timing_report()}
+    assert report['Basin Research'].status == 'ok'
+    assert report['Basin Research'].articles == 1
+    assert report['Closed Journal'].status == 'error'
+    assert report['Closed Journal'].articles == 0
+
+@pytest.mark.asyncio
+async def test_fetch_single_uses_generic_parser(feed_server):
+    """Test bare URLs are parsed without a journal format"""
+    fetcher = RSSFeedFetcher(csv_file=None, parse_stage=ParseStage(workers=0))
+    async with FetchEngine() as engine:
+        articles = await fetcher.fetch_single(f"{feed_server}/generic", engine)
+
+    assert [article['title'] for article in articles] == ['Delta avulsion and stratigraphy']
+
+@pytest.mark.asyncio
+async def test_unsolicited_304_without_cache(feed_server):
+    """Test a 304 to an unconditional request yields no articles instead of failing"""
+    fetcher = RSSFeedFetcher(csv_file=None, parse_stage=ParseStage(workers=0))
+    async with FetchEngine() as engine:
+        assert await fetcher.fetch_single(f"{feed_server}/not-modified", engine) == []
+
+    assert fetcher.feed_timings[f"{feed_server}/not-modified"].status == 'not_modified'
+
+def test_sync_facade(tmp_path, threaded_feed_server):
+    """Test the blocking wrappers run the async engine to completion"""
+    fetcher = RSSFeedFetcher(csv_file=write_journals(tmp_path / "journals.csv", threaded_feed_server),
+                             parse_stage=ParseStage(workers=0))
+
+    articles = fetcher.fetch_all_sync(max_articles=1)
+    assert len(articles) == 2
+    assert fetcher.fetch_journal(fetcher.journals[2]) == []
+    assert len(fetcher.fetch_journal(fetcher.journals[0])) == 1
+
+def test_close_shuts_down_owned_parse_stage():
+    """Test close() stops the worker pool the fetcher created, not a caller's"""
+    fetcher = RSSFeedFetcher(csv_file=None, parse_stage=None)
+    fetcher.parse_stage._get_executor()
+    fetcher.close()
+    assert fetcher.parse_stage.executor is None
+
+    shared = ParseStage(workers=1)
+    shared_executor = shared._get_executor()
+    RSSFeedFetcher(csv_file=None, parse_stage=shared).close()
+    assert shared.executor is shared_executor
+    shared.shutdown()
@@ -0,0 +1,106 @@
+import pytest
+from components.seen_index import SeenArticleIndex
+
+@pytest.fixture
+def seen_index(tmp_path):
+    """Create a test seen-article index"""
+    index = SeenArticleIndex(str(tmp_path / "seen.ddb"))
+    yield index
+    index.close()
+
+@pytest.fixture
+def processed_article():
+    """Create an article that has been through the LLM stage"""
+    return {
+        'title': 'Avulsion Dynamics on the Yellow River Delta',
+        'url': 'https://onlinelibrary.wiley.com/doi/10.1029/2024GL000001',
+        'journal': 'Geophysical Research Letters',
+        'llm_summary': 'A cached summary',
+        'relevance_score': 0.8,
+        'key_topics': ['avulsion', 'deltas'],
+        'relevance_reasoning': 'Directly relevant'
+    }
+
+def test_unseen_articles_pass_through(seen_index, processed_article):
+    """Test nothing is filtered before anything is recorded"""
+    new, cached = seen_index.partition([processed_article])
+
+    assert new == [processed_article]
+    assert cached == []
+
+@pytest.mark.parametrize("variant", [
+    # Same DOI via a different host
+    {'title': 'Different', 'url': 'https://agupubs.onlinelibrary.wiley.com/doi/10.1029/2024gl000001'},
+    # Same page with tracking parameters
+    {'title': 'Different', 'url': 'https://onlinelibrary.wiley.com/doi/10.1029/2024GL000001/?utm_source=rss'},
+    # Same title with different case and punctuation, no URL
+    {'title': 'avulsion dynamics on the Yellow River delta.', 'url': ''},
+])
+def test_seen_articles_rehydrated(seen_index, processed_article, variant):
+    """Test DOI, canonical URL and title matches restore cached LLM output"""
+    seen_index.record([processed_article])
+
+    new, cached = seen_index.partition([variant])
+
+    assert new == []
+    assert cached[0]['llm_summary'] == 'A cached summary'
+    assert cached[0]['relevance_score'] == 0.8
+    assert cached[0]['key_topics'] == ['avulsion', 'deltas']
+    assert cached[0]['title'] == variant['title']
+
+def test_failed_results_not_recorded(seen_index, processed_article):
+    """Test articles whose LLM step failed are retried next run"""
+    seen_index.record([dict(processed_article, llm_error='timeout')])
+
+    new, cached = seen_index.partition([processed_article])
+
+    assert len(new) == 1
+    assert cached == []
+
+def test_generic_title_does_not_match_other_doi(seen_index):
+    """Test papers with different DOIs never share a cached result by title"""
+    seen_index.record([{
+        'title': 'Issue Information',
+        'url': 'https://onlinelibrary.wiley.com/doi/10.1111/sed.13001',
+        'llm_summary': 'Front matter of issue 1',
+        'relevance_score': 0.1,
+    }])
+
+    new, cached = seen_index.partition([{
+        'title': 'Issue Information',
+        'url': 'https://onlinelibrary.wiley.com/doi/10.1111/sed.13002',
+    }])
+
+    assert cached == []
+    assert len(new) == 1
+
+def test_url_variants_recorded_once(seen_index, processed_article):
+    """Test recording a URL variant updates the existing row"""
+    variant = dict(processed_article, url=processed_article['url'] + '?utm_source=rss',
+                   llm_summary='Newer summary')
+    seen_index.record([processed_article])
+    seen_index.record([variant])
+
+    rows = seen_index.conn.execute("SELECT llm_summary FROM seen_articles").fetchall()
+    assert rows == [('Newer summary',)]
+
+def test_migrates_raw_url_keys(tmp_path, processed_article):
+    """Test rows keyed by the old raw-URL hash are re-keyed and collapsed"""
+    db_path = str(tmp_path / "legacy_seen.ddb")
+    index = SeenArticleIndex(db_path)
+    doi, url, title = index.lookup_keys(processed_article)
+    index.conn.executemany(
+        "INSERT INTO seen_articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, now()::TIMESTAMP, now()::TIMESTAMP)",
+        [('old-1', doi, url, title, 'first', 0.5, [], ''),
+         ('old-2', doi, url, title, 'second', 0.6, [], '')]
+    )
+    index.close()
+
+    index = SeenArticleIndex(db_path)
+    try:
+        rows = index.conn.execute("SELECT id FROM seen_articles").fetchall()
+        assert len(rows) == 1
+        assert not rows[0][0].startswith('old')
+        assert len(index.partition([processed_article])[1]) == 1
+    finally:
+        index.close()
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from components.vector_index import VectorIndex
+
+DOCS = {
+    'delta': 'Avulsion and channel migration on river deltas',
+    'glacier': 'Glacier retreat and ice sheet mass balance',
+    'turbidite': 'Turbidity currents depositing submarine fan turbidites',
+}
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "vectors")
+
+def test_search_ranks_similar_text(index_path):
+    """Test top-k cosine search returns the most related document first"""
+    index = VectorIndex(index_path, dim=256)
+    index.add(list(DOCS), list(DOCS.values()))
+
+    results = index.search('delta avulsion', k=2)
+
+    assert results[0][0] == 'delta'
+    assert len(results) == 2
+    assert results[0][1] > results[1][1]
+
+def test_index_persists_and_appends(index_path):
+    """Test vectors survive reopening and new rows append incrementally"""
+    VectorIndex(index_path, dim=256).add(['delta'], [DOCS['delta']])
+    index = VectorIndex(index_path, dim=1024)  # dim comes from the stored index
+    index.add(['glacier', 'delta'], [DOCS['glacier'], 'Glacier ice retreat'])
+
+    assert index.dim == 256
+    assert len(index) == 2
+    # Re-adding an id overwrites its vector rather than duplicating it
+    similarities = dict(index.search('avulsion channel migration', k=2))
+    assert similarities['delta'] == pytest.approx(0.0, abs=0.2)
+    assert np.isclose(np.linalg.norm(index.embed(['river delta'])[0]), 1.0)
+
+def test_empty_queries(index_path):
+    """Test searching an empty index or with only stop words returns nothing"""
+    index = VectorIndex(index_path, dim=256)
+    assert index.search('delta') == []
+    index.add(['delta'], [DOCS['delta']])
+    assert index.search('the and of') == []
+
+def test_concurrent_add_and_search(index_path):
+    """Test searches from another thread see consistent ids while rows are appended"""
+    import threading
+
+    index = VectorIndex(index_path, dim=256)
+    index.add(list(DOCS), list(DOCS.values()))
+    errors = []
+
+    def search():
+        try:
+            for _ in range(200):
+                for article_id, _ in index.search('delta avulsion', k=3):
+                    assert article_id in index.positions
+        except Exception as e:
+            errors.append(e)
+
+    reader = threading.Thread(target=search)
+    reader.start()
+    for i in range(200):
+        index.add([f'doc-{i}'], [f'river delta avulsion study {i}'])
+    reader.join()
+
+    assert errors == []
+    assert len(index) == len(DOCS) + 200